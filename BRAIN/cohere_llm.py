@@ -1,14 +1,18 @@
 import os
-import requests
 import json
+import asyncio
 import logging
 from dotenv import load_dotenv
+from BRAIN.streaming import LLMStream
+from BRAIN.tokens import get_context_limit
+from core.http_client import get_http_pool
 
 load_dotenv()
 
 class CohereLLM:
-    def __init__(self, model="command-a-03-2025"):
+    def __init__(self, model="command-a-03-2025", http_client=None):
         self.logger = logging.getLogger("CohereLLM")
+        self.http = http_client or get_http_pool()
         self.api_key = os.getenv("COHERA_API_KEY")
         self.model = model
         self.base_url = "https://api.cohere.com/v1/chat"
@@ -47,10 +51,7 @@ class CohereLLM:
 
 
 
-    def generate(self, messages_history, system_prompt):
-        if not self.api_key:
-            return "My brain is missing its connection key (COHERA_API_KEY).", None, None
-
+    def _build_payload(self, messages_history, system_prompt):
         latest_message = "Hello"
         chat_history = []
         
@@ -72,12 +73,10 @@ class CohereLLM:
                      text_parts = [p.get("text", "") for p in content if p.get("type") == "text"]
                      content = " ".join(text_parts)
                  chat_history.append({"role": role, "message": str(content)})
-        else:
-            pass
 
         full_preamble = "CRITICAL PROTOCOL: YOU ARE AN ENGLISH-ONLY AI. NEVER SPEAK HINDI. " + system_prompt
 
-        payload = {
+        return {
             "model": self.model,
             "message": latest_message,
             "chat_history": chat_history,
@@ -85,26 +84,36 @@ class CohereLLM:
             "temperature": 0.7
         }
 
-        headers = {
+    def _headers(self):
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
 
+    def _usage_from_meta(self, data):
+        meta = data.get("meta", {}).get("billed_units", {})
+        return {
+            "prompt_tokens": meta.get("input_tokens", 0),
+            "completion_tokens": meta.get("output_tokens", 0),
+            "total_tokens": meta.get("input_tokens", 0) + meta.get("output_tokens", 0)
+        }
+
+    def generate(self, messages_history, system_prompt):
+        if not self.api_key:
+            return "My brain is missing its connection key (COHERA_API_KEY).", None, None
+
+        payload = self._build_payload(messages_history, system_prompt)
+        headers = self._headers()
+
         try:
             self.logger.info(f"Sending request to Cohere ({self.model})...")
-            response = requests.post(self.base_url, headers=headers, data=json.dumps(payload), timeout=30)
+            response = self.http.post(self.base_url, headers=headers, content=json.dumps(payload), timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
                 content = data.get("text", "")
-                
-                meta = data.get("meta", {}).get("billed_units", {})
-                usage = {
-                    "prompt_tokens": meta.get("input_tokens", 0),
-                    "completion_tokens": meta.get("output_tokens", 0),
-                    "total_tokens": meta.get("input_tokens", 0) + meta.get("output_tokens", 0)
-                }
+                usage = self._usage_from_meta(data)
                 
                 return content, usage, self.model
             else:
@@ -115,5 +124,49 @@ class CohereLLM:
             self.logger.error(f"Cohere Request Exception: {e}")
             return f"Error: {str(e)}", None, None
 
+    async def agenerate(self, messages_history, system_prompt):
+        return await asyncio.to_thread(self.generate, messages_history, system_prompt)
+
+    def stream(self, messages_history, system_prompt):
+        """Streams the completion from the chat endpoint. Returns an LLMStream of text deltas."""
+        if not self.api_key:
+            return LLMStream.from_error("My brain is missing its connection key (COHERA_API_KEY).")
+
+        payload = self._build_payload(messages_history, system_prompt)
+        payload["stream"] = True
+
+        return LLMStream(self._stream_events(payload), self.model)
+
+    def _stream_events(self, payload):
+        try:
+            self.logger.info(f"Streaming request to Cohere ({self.model})...")
+            with self.http.stream("POST", self.base_url, headers=self._headers(), content=json.dumps(payload), timeout=30) as response:
+                if response.status_code != 200:
+                    response.read()
+                    self.logger.warning(f"Cohere Stream Failed ({response.status_code}): {response.text}")
+                    yield "error", f"Error: {response.status_code}"
+                    return
+                yield "response", response
+
+                # v1 chat streams newline-delimited JSON events
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    event_type = event.get("event_type")
+
+                    if event_type == "text-generation":
+                        yield "delta", event.get("text", "")
+                    elif event_type == "stream-end":
+                        if event.get("finish_reason") not in (None, "COMPLETE", "MAX_TOKENS"):
+                            self.logger.warning(f"Cohere Stream ended: {event.get('finish_reason')}")
+                        yield "usage", self._usage_from_meta(event.get("response", {}))
+                        break
+
+        except Exception as e:
+            yield "error", f"Error: {str(e)}"
+            # Not reached when the stream was cancelled: LLMStream closes us at the yield above
+            self.logger.error(f"Cohere Stream Exception: {e}")
+
     def get_model_context_limit(self, model_name):
-        return 128000
+        return get_context_limit(model_name or self.model)
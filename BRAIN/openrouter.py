@@ -1,14 +1,18 @@
 import os
-import requests
 import json
+import asyncio
 import logging
 from dotenv import load_dotenv
+from BRAIN.streaming import LLMStream
+from BRAIN.tokens import get_context_limit
+from core.http_client import get_http_pool
 
 load_dotenv()
 
 class OpenRouterLLM:
-    def __init__(self, model="meta-llama/llama-3.3-70b-instruct"):
+    def __init__(self, model="meta-llama/llama-3.3-70b-instruct", http_client=None):
         self.logger = logging.getLogger("OpenRouterLLM")
+        self.http = http_client or get_http_pool()
         self.api_key = os.getenv("OPENROUTER_AI")
         self.model = model
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
@@ -46,12 +50,9 @@ class OpenRouterLLM:
 
 
     def get_model_context_limit(self, model_name):
-        return 128000
-
-    def generate(self, messages_history, system_prompt):
-        if not self.api_key:
-            return "My brain is missing its connection key (OPENROUTER_AI).", None, None
+        return get_context_limit(model_name or self.model)
 
+    def _build_messages(self, messages_history, system_prompt):
         messages = [{"role": "system", "content": system_prompt}]
         
         if messages_history:
@@ -62,22 +63,30 @@ class OpenRouterLLM:
                     content = " ".join(text_parts)
                 
                 messages.append({"role": msg["role"], "content": str(content)})
+        return messages
 
-        payload = {
-            "model": self.model,
-            "messages": messages
-        }
-
-        headers = {
+    def _headers(self):
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/Start-Of-The-Week/Ava",
             "X-Title": "Ava"
         }
 
+    def generate(self, messages_history, system_prompt):
+        if not self.api_key:
+            return "My brain is missing its connection key (OPENROUTER_AI).", None, None
+
+        payload = {
+            "model": self.model,
+            "messages": self._build_messages(messages_history, system_prompt)
+        }
+
+        headers = self._headers()
+
         try:
             self.logger.info(f"Sending request to OpenRouter ({self.model})...")
-            response = requests.post(self.base_url, headers=headers, data=json.dumps(payload), timeout=30)
+            response = self.http.post(self.base_url, headers=headers, content=json.dumps(payload), timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -98,3 +107,64 @@ class OpenRouterLLM:
         except Exception as e:
             self.logger.error(f"OpenRouter Request Exception: {e}")
             return f"Error: {str(e)}", None, None
+
+    async def agenerate(self, messages_history, system_prompt):
+        return await asyncio.to_thread(self.generate, messages_history, system_prompt)
+
+    def stream(self, messages_history, system_prompt):
+        """Streams the completion over SSE. Returns an LLMStream of text deltas."""
+        if not self.api_key:
+            return LLMStream.from_error("My brain is missing its connection key (OPENROUTER_AI).")
+
+        payload = {
+            "model": self.model,
+            "messages": self._build_messages(messages_history, system_prompt),
+            "stream": True,
+            "usage": {"include": True}
+        }
+
+        return LLMStream(self._stream_events(payload), self.model)
+
+    def _stream_events(self, payload):
+        try:
+            self.logger.info(f"Streaming request to OpenRouter ({self.model})...")
+            with self.http.stream("POST", self.base_url, headers=self._headers(), content=json.dumps(payload), timeout=30) as response:
+                if response.status_code != 200:
+                    response.read()
+                    self.logger.warning(f"OpenRouter Stream Failed ({response.status_code}): {response.text}")
+                    yield "error", f"Error: {response.status_code}"
+                    return
+                yield "response", response
+
+                for line in response.iter_lines():
+                    # Skips SSE comments (": OPENROUTER PROCESSING") and keep-alive blanks
+                    if not line or not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    chunk = json.loads(data)
+                    if chunk.get("error"):
+                        self.logger.warning(f"OpenRouter Stream Error: {chunk['error']}")
+                        yield "error", f"Error: {chunk['error'].get('message', 'stream error')}"
+                        return
+
+                    choices = chunk.get("choices") or []
+                    if choices:
+                        delta = choices[0].get("delta", {}).get("content")
+                        if delta:
+                            yield "delta", delta
+
+                    usage_data = chunk.get("usage")
+                    if usage_data:
+                        yield "usage", {
+                            "prompt_tokens": usage_data.get("prompt_tokens", 0),
+                            "completion_tokens": usage_data.get("completion_tokens", 0),
+                            "total_tokens": usage_data.get("total_tokens", 0)
+                        }
+
+        except Exception as e:
+            yield "error", f"Error: {str(e)}"
+            # Not reached when the stream was cancelled: LLMStream closes us at the yield above
+            self.logger.error(f"OpenRouter Stream Exception: {e}")
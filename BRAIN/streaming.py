@@ -0,0 +1,90 @@
+import asyncio
+import socket
+import time
+
+
+class LLMStream:
+    """Iterable of text deltas from a streaming chat completion.
+
+    Iterate it (or `async for` it) to receive deltas as they arrive. Once the
+    stream is exhausted, `text`, `usage` and `model` hold the full completion
+    and the provider's final token usage, mirroring what `generate()` returns.
+    """
+
+    def __init__(self, events, model):
+        # events yields ("delta", str) and ("usage", dict) tuples, plus an optional
+        # ("response", httpx.Response) once connected so cancel() can abort the read
+        self._events = events
+        self._response = None
+        self.model = model
+        self.text = ""
+        self.usage = None
+        self.started_at = time.perf_counter()
+        self.first_token_at = None
+        self.finished = False
+        self.cancelled = False
+
+    def __iter__(self):
+        for kind, value in self._events:
+            if self.cancelled:
+                # Closing the generator releases the underlying HTTP stream
+                close = getattr(self._events, "close", None)
+                if close:
+                    close()
+                break
+            if kind == "response":
+                self._response = value
+            elif kind == "usage":
+                self.usage = value
+            elif kind == "error":
+                self.model = None
+                self.text += value
+                yield value
+            elif value:
+                if self.first_token_at is None:
+                    self.first_token_at = time.perf_counter()
+                self.text += value
+                yield value
+        self.finished = True
+
+    async def __aiter__(self):
+        iterator = iter(self)
+        done = object()
+        while True:
+            delta = await asyncio.to_thread(next, iterator, done)
+            if delta is done:
+                break
+            yield delta
+
+    def cancel(self):
+        """
+        Stops the stream; safe to call from another thread or task. A read
+        blocked on a stalled connection is woken by shutting its socket down,
+        so the worker thread exits instead of waiting for the read timeout.
+        """
+        self.cancelled = True
+        response = self._response
+        network_stream = response.extensions.get("network_stream") if response is not None else None
+        sock = network_stream.get_extra_info("socket") if network_stream is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    @property
+    def time_to_first_token(self):
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    def result(self):
+        """Drains the stream and returns (content, usage, model) like `generate()`."""
+        if not self.finished:
+            for _ in self:
+                pass
+        return self.text, self.usage, self.model
+
+    @classmethod
+    def from_error(cls, message):
+        return cls(iter([("error", message)]), None)
@@ -0,0 +1,71 @@
+import logging
+import math
+import re
+
+# Context windows in tokens, keyed by model id (provider prefix optional)
+MODEL_CONTEXT_LIMITS = {
+    "command-a-03-2025": 256000,
+    "command-r-plus": 128000,
+    "command-r-plus-08-2024": 128000,
+    "command-r": 128000,
+    "command-r-08-2024": 128000,
+    "command-r7b-12-2024": 128000,
+    "meta-llama/llama-3.3-70b-instruct": 131072,
+    "meta-llama/llama-3.1-8b-instruct": 131072,
+    "meta-llama/llama-3.1-70b-instruct": 131072,
+    "mistralai/mistral-7b-instruct": 32768,
+    "google/gemma-2-9b-it": 8192,
+    "openai/gpt-4o": 128000,
+    "openai/gpt-4o-mini": 128000,
+}
+
+DEFAULT_CONTEXT_LIMIT = 128000
+
+
+def get_context_limit(model_name):
+    if not model_name:
+        return DEFAULT_CONTEXT_LIMIT
+    if model_name in MODEL_CONTEXT_LIMITS:
+        return MODEL_CONTEXT_LIMITS[model_name]
+
+    short_name = model_name.split("/")[-1]
+    for known, limit in MODEL_CONTEXT_LIMITS.items():
+        if known.split("/")[-1] == short_name:
+            return limit
+    return DEFAULT_CONTEXT_LIMIT
+
+
+class ApproxTokenizer:
+    """Dependency-free estimate: roughly 4 characters per token, never fewer tokens than words."""
+
+    name = "approx"
+    _WORD = re.compile(r"\w+|[^\w\s]")
+
+    def count(self, text):
+        if not text:
+            return 0
+        return max(math.ceil(len(text) / 4), len(self._WORD.findall(text)))
+
+
+class TiktokenTokenizer:
+    name = "tiktoken"
+
+    def __init__(self, encoding="cl100k_base"):
+        import tiktoken
+        self.encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text):
+        if not text:
+            return 0
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+def get_tokenizer(name="auto"):
+    """Returns a tokenizer exposing count(text). "auto" prefers tiktoken when installed."""
+    if name in ("auto", "tiktoken"):
+        try:
+            return TiktokenTokenizer()
+        except Exception as e:
+            if name == "tiktoken":
+                logging.getLogger("Tokenizer").warning(f"tiktoken unavailable ({e}); using approximate counts.")
+    return ApproxTokenizer()
@@ -1,9 +1,19 @@
 from managers.vlm_manager import VLMManager
 
 class ScreenReaderTool:
-    def __init__(self):
+    # Phrase -> weight for IntentEngine routing (Hinglish included)
+    keywords = {
+        "on my screen": 1.0, "read my screen": 1.0, "see my screen": 1.0, "look at my screen": 1.0,
+        "describe my screen": 1.0, "check my screen": 1.0, "analyze screen": 1.0, "analyze my screen": 1.0,
+        "reading screen": 1.0, "on the screen": 1.0, "my screen": 0.8, "screen": 0.5,
+        "what do you see": 1.0, "what is visible": 1.0, "what can you see": 1.0,
+        "kya dikh raha hai": 1.0, "dikh raha": 0.8, "screen par kya hai": 1.0, "screen dekho": 1.0,
+        "screen mein kya": 1.0, "mere screen": 1.0, "screen pe": 1.0
+    }
+
+    def __init__(self, http_client=None):
         self.name = "screen_reader"
-        self.manager = VLMManager(model="minicpm-v")
+        self.manager = VLMManager(model="minicpm-v", http_client=http_client)
 
-    def execute(self, prompt="Describe strictly what you see on the screen."):
-        return self.manager.analyze_screen(prompt)
+    def execute(self, prompt="Describe strictly what you see on the screen.", on_partial=None, frame=None):
+        return self.manager.analyze_screen(prompt, on_partial=on_partial, frame=frame)
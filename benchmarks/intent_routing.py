@@ -0,0 +1,112 @@
+"""
+Intent routing: the compiled IntentEngine against the legacy keyword scans,
+on a labelled utterance corpus. Reports throughput and per-intent
+precision/recall.
+
+    python -m benchmarks.intent_routing [--corpus benchmarks/data/intent_corpus.jsonl] [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import time
+
+from config import Config
+from managers.intent_engine import IntentEngine
+from tools.weather import WeatherTool
+from tools.news import NewsTool
+from tools.system_info import SystemInfoTool
+from Functions.screen.screen_reader import ScreenReaderTool
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "data", "intent_corpus.jsonl")
+TOOLS = [("weather", WeatherTool), ("news", NewsTool), ("screen_reader", ScreenReaderTool), ("system_info", SystemInfoTool)]
+
+
+def legacy_find_intent(text):
+    """ToolManager.find_tool_for_intent before the intent engine, returning the tool name."""
+    text = text.lower()
+    if "weather" in text or "vedar" in text or "vader" in text:
+        return "weather"
+    if "news" in text:
+        return "news"
+
+    screen_keywords = [
+        "on my screen", "read my screen", "see my screen", "look at my screen", "describe my screen",
+        "kya dikh raha hai", "screen par kya hai", "screen dekho", "reading screen",
+        "what do you see", "what is visible", "check my screen", "analyze screen",
+        "screen mein kya", "mere screen"
+    ]
+    if any(keyword in text for keyword in screen_keywords):
+        return "screen_reader"
+
+    system_keywords = [
+        "system", "spec", "specs", "processor", "cpu",
+        "memory", "ram", "disk", "storage", "space", "os", "platform",
+        "gpu", "graphics", "card"
+    ]
+    if any(keyword in text for keyword in system_keywords):
+        if "space" in text and not ("free" in text or "left" in text or "disk" in text or "storage" in text):
+            pass
+        else:
+            return "system_info"
+    return None
+
+
+def build_engine():
+    engine = IntentEngine(threshold=Config.INTENT_THRESHOLD)
+    for name, tool_class in TOOLS:
+        engine.add(name, tool_class.keywords)
+    engine.compile()
+    return engine
+
+
+def evaluate(route, corpus, repeat):
+    predictions = [route(row["text"]) for row in corpus]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for row in corpus:
+            route(row["text"])
+    elapsed = time.perf_counter() - started
+
+    per_intent = {}
+    for name, _ in TOOLS:
+        tp = sum(1 for row, p in zip(corpus, predictions) if p == name and row["intent"] == name)
+        fp = sum(1 for row, p in zip(corpus, predictions) if p == name and row["intent"] != name)
+        fn = sum(1 for row, p in zip(corpus, predictions) if p != name and row["intent"] == name)
+        per_intent[name] = (tp / (tp + fp) if tp + fp else 1.0, tp / (tp + fn) if tp + fn else 1.0)
+
+    accuracy = sum(1 for row, p in zip(corpus, predictions) if p == row["intent"]) / len(corpus)
+    errors = [(row["text"], row["intent"], p) for row, p in zip(corpus, predictions) if p != row["intent"]]
+    return len(corpus) * repeat / elapsed, per_intent, accuracy, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--show-errors", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+
+    engine = build_engine()
+
+    def engine_route(text):
+        match = engine.route(text)
+        return match.intent if match else None
+
+    print(f"{len(corpus)} labelled utterances\n")
+    print(f"{'router':<8} {'utt/s':>10} {'accuracy':>9}  " + "  ".join(f"{name + ' P/R':>20}" for name, _ in TOOLS))
+    for label, route in (("legacy", legacy_find_intent), ("engine", engine_route)):
+        throughput, per_intent, accuracy, errors = evaluate(route, corpus, args.repeat)
+        cells = "  ".join(f"{p:>9.2f} / {r:<8.2f}" for p, r in per_intent.values())
+        print(f"{label:<8} {throughput:>10.0f} {accuracy:>9.1%}  {cells}")
+        if args.show_errors:
+            for text, expected, got in errors:
+                print(f"    {text!r}: expected {expected}, got {got}")
+
+
+if __name__ == "__main__":
+    main()
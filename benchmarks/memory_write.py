@@ -0,0 +1,84 @@
+"""
+Per-turn write latency: whole-file memory.json rewrite vs. the append-only journal.
+
+A turn writes two messages (user + assistant). The legacy path rewrites the
+full history with json.dump(indent=4) after each one; the journal appends one
+line per message.
+
+    python -m benchmarks.memory_write [--sizes 1000 10000 100000] [--turns 20]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from managers.memory_journal import MemoryJournal
+
+
+def make_history(n):
+    history = []
+    for i in range(n):
+        role = "user" if i % 2 == 0 else "assistant"
+        history.append({"role": role, "content": f"Message {i}: " + "lorem ipsum dolor sit amet " * 12})
+    return history
+
+
+def legacy_turn(path, history, turn):
+    for role in ("user", "assistant"):
+        history.append({"role": role, "content": f"turn {turn}"})
+        with open(path, "w") as f:
+            json.dump(history, f, indent=4)
+
+
+def bench_legacy(workdir, history, turns):
+    path = os.path.join(workdir, "memory.json")
+    history = list(history)
+    timings = []
+    for turn in range(turns):
+        started = time.perf_counter()
+        legacy_turn(path, history, turn)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def bench_journal(workdir, history, turns):
+    legacy = os.path.join(workdir, "seed.json")
+    with open(legacy, "w") as f:
+        json.dump(history, f)
+    journal = MemoryJournal(os.path.join(workdir, "journal"), legacy_file=legacy)
+    timings = []
+    for turn in range(turns):
+        started = time.perf_counter()
+        journal.append({"role": "user", "content": f"turn {turn}"})
+        journal.append({"role": "assistant", "content": f"turn {turn}"})
+        timings.append(time.perf_counter() - started)
+    journal.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'messages':>9} {'legacy p50 (ms)':>16} {'journal p50 (ms)':>17} {'speedup':>8}")
+    for size in args.sizes:
+        history = make_history(size)
+        workdir = tempfile.mkdtemp(prefix="ava_memory_bench_")
+        try:
+            # Fewer legacy turns at large sizes; each one rewrites the whole file
+            legacy_turns = max(3, args.turns * 1000 // max(size, 1000))
+            legacy = statistics.median(bench_legacy(workdir, history, legacy_turns)) * 1000
+            journal = statistics.median(bench_journal(workdir, history, args.turns)) * 1000
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        print(f"{size:>9} {legacy:>16.2f} {journal:>17.3f} {legacy / journal:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
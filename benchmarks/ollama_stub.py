@@ -0,0 +1,163 @@
+"""
+A stand-in for Ollama's /api/generate with realistic timing, for exercising
+VLMManager without a GPU or the real model.
+
+It models what matters for latency: a load delay when the model is not
+resident, keep_alive expiry ("30m", "10s", seconds, -1 = forever, 0 =
+unload now), a prompt-processing delay per image, and token-by-token
+output for "stream": true. Response fields (load_duration, eval_count,
+...) follow Ollama's, in nanoseconds.
+
+    python -m benchmarks.ollama_stub [--port 11435] [--load-ms 2500] [--token-ms 30]
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ANSWER = ("The screen shows a code editor with a Python file open on the left and a terminal "
+          "running tests on the right. A browser window with documentation is partly visible behind them.")
+
+DEFAULT_KEEP_ALIVE = 300
+
+
+def parse_keep_alive(value):
+    """Seconds the model stays loaded after a request; None means forever."""
+    if value is None:
+        return DEFAULT_KEEP_ALIVE
+    if isinstance(value, (int, float)):
+        return None if value < 0 else float(value)
+    match = re.fullmatch(r"(-?\d+(?:\.\d+)?)\s*(ms|s|m|h)?", str(value).strip())
+    if not match:
+        return DEFAULT_KEEP_ALIVE
+    amount = float(match.group(1))
+    if amount < 0:
+        return None
+    return amount * {"ms": 0.001, "s": 1, "m": 60, "h": 3600, None: 1}[match.group(2)]
+
+
+class StubModel:
+    def __init__(self, load_ms, prefill_ms, token_ms):
+        self.load_s = load_ms / 1000
+        self.prefill_s = prefill_ms / 1000
+        self.token_s = token_ms / 1000
+        self.loaded_until = 0.0  # monotonic deadline; None = pinned
+        self.lock = threading.Lock()
+        self.loads = 0
+
+    def ensure_loaded(self, keep_alive):
+        """Loads the model if needed; returns the load time spent (seconds)."""
+        with self.lock:
+            now = time.monotonic()
+            resident = self.loaded_until is None or self.loaded_until > now
+            spent = 0.0
+            if not resident:
+                time.sleep(self.load_s)
+                spent = self.load_s
+                self.loads += 1
+            seconds = parse_keep_alive(keep_alive)
+            self.loaded_until = None if seconds is None else time.monotonic() + seconds
+            return spent
+
+    def unload(self):
+        with self.lock:
+            self.loaded_until = 0.0
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    model = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, body, status=200):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json({"error": "not found"}, 404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        name = request.get("model", "minicpm-v")
+        started = time.perf_counter()
+
+        if request.get("keep_alive") in (0, "0", "0s") and not request.get("prompt"):
+            self.model.unload()
+            self._send_json({"model": name, "response": "", "done": True, "done_reason": "unload"})
+            return
+
+        load_s = self.model.ensure_loaded(request.get("keep_alive"))
+        final = {"model": name, "done": True, "done_reason": "stop", "load_duration": int(load_s * 1e9)}
+        if not request.get("prompt"):
+            final.update(response="", done_reason="load", total_duration=int((time.perf_counter() - started) * 1e9))
+            self._send_json(final)
+            return
+
+        time.sleep(self.model.prefill_s * max(1, len(request.get("images") or [])))
+        tokens = re.findall(r"\S+\s*", ANSWER)
+        final["prompt_eval_duration"] = int(self.model.prefill_s * 1e9)
+        final["eval_count"] = len(tokens)
+
+        if not request.get("stream", True):
+            time.sleep(self.model.token_s * len(tokens))
+            final.update(response=ANSWER, total_duration=int((time.perf_counter() - started) * 1e9))
+            self._send_json(final)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for token in tokens:
+            time.sleep(self.model.token_s)
+            self._write_chunk({"model": name, "response": token, "done": False})
+        final.update(response="", total_duration=int((time.perf_counter() - started) * 1e9))
+        self._write_chunk(final)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, event):
+        data = (json.dumps(event) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+def serve(port=0, load_ms=2500, prefill_ms=400, token_ms=30):
+    """Starts the stub on a daemon thread; returns (server, base_url). Port 0 picks a free one."""
+    handler = type("StubHandler", (Handler,), {"model": StubModel(load_ms, prefill_ms, token_ms)})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, name="OllamaStub", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--load-ms", type=int, default=2500, help="model load time when not resident")
+    parser.add_argument("--prefill-ms", type=int, default=400, help="prompt processing time per image")
+    parser.add_argument("--token-ms", type=int, default=30, help="time per generated token")
+    args = parser.parse_args()
+
+    server, url = serve(args.port, args.load_ms, args.prefill_ms, args.token_ms)
+    print(f"Ollama stand-in listening on {url} (set OLLAMA_HOST={url} to point Ava at it)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Recall index latency: incremental add() and top-k query() at growing history sizes.
+
+    python -m benchmarks.recall_query [--sizes 1000 10000 100000] [--queries 200]
+"""
+
+import argparse
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+from managers.recall_index import RecallIndex
+
+TOPICS = [
+    "weather in Kolkata", "news about cricket", "my sister's interview", "python code on screen",
+    "GPU temperature", "disk space left", "bitcoin price", "dinner recipe", "exam schedule", "movie tonight",
+]
+
+
+def make_messages(n, rng):
+    for i in range(n):
+        topic = rng.choice(TOPICS)
+        yield {"role": "user" if i % 2 == 0 else "assistant", "content": f"{topic} message {i} " + rng.choice(TOPICS)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=128)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    print(f"{'messages':>9} {'build (s)':>10} {'add p50 (ms)':>13} {'query p50 (ms)':>15} {'query p99 (ms)':>15}")
+    for size in args.sizes:
+        workdir = tempfile.mkdtemp(prefix="ava_recall_bench_")
+        try:
+            index = RecallIndex(workdir, dim=args.dim)
+            started = time.perf_counter()
+            index.catch_up(make_messages(size, rng), 0)
+            build = time.perf_counter() - started
+
+            adds = []
+            for i in range(50):
+                started = time.perf_counter()
+                index.add(index.count, f"{rng.choice(TOPICS)} follow up {i}")
+                adds.append(time.perf_counter() - started)
+
+            queries = []
+            for _ in range(args.queries):
+                text = rng.choice(TOPICS)
+                started = time.perf_counter()
+                index.query(text, k=3, exclude_from=index.count - 20)
+                queries.append(time.perf_counter() - started)
+            queries.sort()
+            del index
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        print(f"{size:>9} {build:>10.2f} {statistics.median(adds) * 1000:>13.3f} "
+              f"{statistics.median(queries) * 1000:>15.3f} {queries[int(len(queries) * 0.99) - 1] * 1000:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
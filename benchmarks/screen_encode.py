@@ -0,0 +1,94 @@
+"""
+Encode cost and payload size of screenshots sent to the vision model.
+
+Renders a synthetic desktop (windows, text lines, a photo-like gradient
+area) at common screen sizes, then times the old path (full-resolution
+PNG + base64) against ScreenCapture pipelines. Pass --live to use a real
+screenshot of this machine instead.
+
+    python -m benchmarks.screen_encode [--runs 5] [--live]
+"""
+
+import argparse
+import base64
+import random
+import statistics
+import time
+from io import BytesIO
+
+from PIL import Image, ImageDraw, ImageGrab
+
+from modules.vision.screen_capture import ScreenCapture
+
+SIZES = [(1366, 768), (1920, 1080), (2560, 1440), (3840, 2160)]
+
+PIPELINES = [
+    ("jpeg q85 @1344", dict(max_side=1344, image_format="JPEG", quality=85)),
+    ("webp q80 @1344", dict(max_side=1344, image_format="WEBP", quality=80)),
+    ("png @1344", dict(max_side=1344, image_format="PNG")),
+    ("jpeg q85 @896", dict(max_side=896, image_format="JPEG", quality=85))
+]
+
+
+def synthetic_screen(width, height, seed=7):
+    """A desktop-like image: flat UI chrome, lots of small text-like strokes, one noisy photo area."""
+    rng = random.Random(seed)
+    image = Image.new("RGB", (width, height), (32, 33, 36))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, height - height // 25, width, height], fill=(20, 20, 24))
+    for _ in range(4):
+        left, top = rng.randrange(0, width // 2), rng.randrange(0, height // 2)
+        right, bottom = left + rng.randrange(width // 4, width // 2), top + rng.randrange(height // 4, height // 2)
+        draw.rectangle([left, top, right, bottom], fill=(245, 245, 245), outline=(90, 90, 90))
+        draw.rectangle([left, top, right, top + 28], fill=(60, 64, 72))
+        y = top + 40
+        while y < bottom - 14:
+            x = left + 12
+            while x < right - 60:
+                word = rng.randrange(12, 60)
+                draw.line([x, y, x + word, y], fill=(30, 30, 30), width=2)
+                draw.line([x, y + 4, x + word // 2, y + 4], fill=(30, 30, 30), width=1)
+                x += word + 8
+            y += 18
+    photo = Image.effect_noise((width // 3, height // 3), 40).convert("RGB")
+    gradient = Image.linear_gradient("L").resize(photo.size).convert("RGB")
+    image.paste(Image.blend(photo, gradient, 0.6), (width // 2, height // 2))
+    return image
+
+
+def legacy(image):
+    started = time.perf_counter()
+    buffered = BytesIO()
+    image.save(buffered, format="PNG")
+    payload = base64.b64encode(buffered.getvalue()).decode("utf-8")
+    return (time.perf_counter() - started) * 1000, len(payload)
+
+
+def pipeline(capture, image):
+    result = capture.process(image)
+    return result.scale_ms + result.encode_ms, result.payload_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--live", action="store_true", help="benchmark a real screenshot instead of synthetic sizes")
+    args = parser.parse_args()
+
+    screens = [ImageGrab.grab()] if args.live else [synthetic_screen(w, h) for w, h in SIZES]
+    print(f"{'screen':<11} {'pipeline':<16} {'encode ms':>10} {'payload KB':>11}")
+    for image in screens:
+        label = f"{image.width}x{image.height}"
+        rows = [("png full (old)", lambda img: legacy(img))]
+        rows += [(name, (lambda capture: lambda img: pipeline(capture, img))(ScreenCapture(**options)))
+                 for name, options in PIPELINES]
+        for name, run in rows:
+            timings, payload = [], 0
+            for _ in range(args.runs):
+                elapsed, payload = run(image)
+                timings.append(elapsed)
+            print(f"{label:<11} {name:<16} {statistics.median(timings):>10.1f} {payload / 1024:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+CPU used while idle-listening: the old busy-poll loop against the event bridge.
+
+Launches the real headless Chrome listener on the bundled page, marks it as
+recording without starting speech recognition (so no microphone is needed)
+and stops after --seconds. CPU time is summed for this process, chromedriver
+and Chrome over that window.
+
+With --stub the listener talks to benchmarks/webdriver_stub.py, started as
+a child process, instead (no Chrome needed): the Python column is then
+real, the other column is the stand-in's CPU rather than chromedriver+Chrome.
+
+    python -m benchmarks.stt_cpu [--seconds 10] [--stub | --remote URL]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+import psutil
+from selenium.webdriver.common.by import By
+
+from modules.stt.listener import SpeechToTextListener
+
+
+def legacy_poll(listener):
+    """The loop run_cycle used before the bridge: WebDriver round trips back to back."""
+    is_recording = listener.driver.find_element(By.ID, "is_recording")
+    while is_recording.text.startswith("Recording: True"):
+        listener.get_text()
+        is_recording = listener.driver.find_element(By.ID, "is_recording")
+
+
+def event_bridge(listener):
+    listener.follow_recording(lambda text: None)
+
+
+def simulate_idle_recording(listener, seconds):
+    listener.driver.execute_script(
+        "if (window.resetSttEvents) { window.resetSttEvents(); }"
+        "is_recording.innerHTML = 'Recording: True';"
+        "setTimeout(function () { is_recording.innerHTML = 'Recording: False'; }, arguments[0]);",
+        int(seconds * 1000)
+    )
+
+
+def cpu_seconds(processes):
+    total = 0.0
+    for process in processes:
+        try:
+            times = process.cpu_times()
+            total += times.user + times.system
+        except psutil.Error:
+            pass
+    return total
+
+
+def measure(listener, loop, seconds):
+    me = psutil.Process()
+    browser = me.children(recursive=True)
+    simulate_idle_recording(listener, seconds)
+    # Let the page report the state change before the loop looks at it
+    time.sleep(0.2)
+
+    own_before, browser_before = cpu_seconds([me]), cpu_seconds(browser)
+    started = time.perf_counter()
+    loop(listener)
+    wall = time.perf_counter() - started
+    own = cpu_seconds([me]) - own_before
+    browser_cpu = cpu_seconds(browser) - browser_before
+    return wall, own / wall * 100, browser_cpu / wall * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--stub", action="store_true", help="use the in-process WebDriver stand-in instead of Chrome")
+    target.add_argument("--remote", help="URL of an already running WebDriver (chromedriver --port=...)")
+    args = parser.parse_args()
+
+    stub, remote = None, args.remote
+    if args.stub:
+        stub = subprocess.Popen([sys.executable, "-m", "benchmarks.webdriver_stub", "--port", "9516"], stdout=subprocess.PIPE, text=True)
+        stub.stdout.readline()
+        remote = "http://127.0.0.1:9516"
+
+    listener = SpeechToTextListener(language="en-IN", remote_url=remote)
+    try:
+        listener.load_page()
+        browser_label = "stand-in CPU %" if args.stub else "chrome+driver CPU %"
+        print(f"{'loop':<8} {'wall (s)':>9} {'python CPU %':>13} {browser_label:>20}")
+        for label, loop in (("poll", legacy_poll), ("event", event_bridge)):
+            wall, own, browser = measure(listener, loop, args.seconds)
+            print(f"{label:<8} {wall:>9.1f} {own:>13.1f} {browser:>20.1f}")
+    finally:
+        listener.driver.quit()
+        if stub:
+            stub.terminate()
+
+
+if __name__ == "__main__":
+    main()
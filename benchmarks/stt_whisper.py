@@ -0,0 +1,80 @@
+"""
+Real-time factor and latency of the offline Whisper STT backend on this machine.
+
+Each clip is decoded to 16 kHz mono, padded with silence and streamed
+through WhisperListener's VAD endpointing at real-time pace (or as fast as
+possible with --fast), exactly as microphone frames would arrive. Reported
+per model: load time, RTF of a plain whole-clip transcription, partial
+hypotheses per clip, final-decode RTF and end-of-speech-to-text latency
+(endpoint silence plus final decode when paced in real time).
+
+    python -m benchmarks.stt_whisper --audio clip1.wav clip2.mp3 [--models tiny base small] [--fast]
+
+--models takes faster-whisper size names or paths to converted model
+directories (for machines that cannot download from the Hugging Face hub).
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import numpy as np
+from faster_whisper import decode_audio
+
+from config import Config
+from modules.stt.whisper_listener import WhisperListener
+
+
+def bench_model(model_size, compute_type, clips, realtime):
+    listener = WhisperListener(model_size=model_size, compute_type=compute_type, device="cpu")
+    started = time.perf_counter()
+    listener.warm_up()
+    load_s = time.perf_counter() - started
+
+    offline_rtf, final_rtf, latency, partials = [], [], [], []
+    for audio in clips:
+        started = time.perf_counter()
+        listener.transcribe(audio)
+        offline_rtf.append((time.perf_counter() - started) / (len(audio) / listener.SAMPLE_RATE))
+
+        padding = np.zeros(int(listener.SAMPLE_RATE * 1.5), dtype=np.float32)
+        stream = np.concatenate((padding[:listener.SAMPLE_RATE // 2], audio, padding))
+        listener.listen_frames(listener.paced_frames(stream, realtime), on_text=lambda text: None)
+        timing = listener.last_timing
+        if "rtf" in timing:
+            final_rtf.append(timing["rtf"])
+            latency.append(timing["end_of_speech_to_text_s"])
+        partials.append(timing["partials"])
+
+    return {
+        "load_s": load_s,
+        "offline_rtf": statistics.median(offline_rtf),
+        "final_rtf": statistics.median(final_rtf) if final_rtf else float("nan"),
+        "latency_ms": statistics.median(latency) * 1000 if latency else float("nan"),
+        "partials": statistics.mean(partials)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", nargs="+", required=True, help="speech clips (any format ffmpeg/PyAV can read)")
+    parser.add_argument("--models", nargs="+", default=[Config.STT_MODEL_SIZE])
+    parser.add_argument("--compute-type", default=Config.STT_COMPUTE_TYPE)
+    parser.add_argument("--fast", action="store_true", help="stream frames without real-time pacing")
+    args = parser.parse_args()
+
+    clips = [decode_audio(path, sampling_rate=WhisperListener.SAMPLE_RATE) for path in args.audio]
+    seconds = sum(len(clip) for clip in clips) / WhisperListener.SAMPLE_RATE
+    print(f"{len(clips)} clip(s), {seconds:.1f} s of audio, compute type {args.compute_type}, "
+          f"{'fast' if args.fast else 'real-time'} streaming, endpoint after {Config.STT_ENDPOINT_SILENCE_MS} ms")
+    print(f"{'model':<14} {'load (s)':>9} {'offline RTF':>12} {'final RTF':>10} {'partials':>9} {'end->text (ms)':>15}")
+    for model_size in args.models:
+        result = bench_model(model_size, args.compute_type, clips, not args.fast)
+        name = os.path.basename(os.path.normpath(model_size))
+        print(f"{name:<14} {result['load_s']:>9.2f} {result['offline_rtf']:>12.3f} {result['final_rtf']:>10.3f} "
+              f"{result['partials']:>9.1f} {result['latency_ms']:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
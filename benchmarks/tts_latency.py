@@ -0,0 +1,63 @@
+"""
+Compares EdgeTTS single-file synthesis against the pipelined sentence path.
+
+Reports time-to-first-audio and total wall time for each mode. By default
+playback is simulated by sleeping for the clip's duration so the benchmark
+runs headless; pass --playback to play through the speakers.
+
+    python -m benchmarks.tts_latency [--runs 3] [--playback]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from modules.tts.edge_tts_engine import EdgeTTS
+
+TEXT = (
+    "Kolkata is currently partly cloudy at twenty nine degrees with seventy percent humidity. "
+    "Expect light showers later in the evening, so carry an umbrella if you are heading out. "
+    "Tomorrow looks clearer, with temperatures rising to around thirty two degrees. "
+    "Winds will stay light from the south east through the weekend. "
+    "Air quality is moderate, so sensitive groups should limit long outdoor activity."
+)
+
+# edge-tts default output format is audio-24khz-48kbitrate-mono-mp3
+MP3_BYTES_PER_SECOND = 48000 / 8
+
+
+class SimulatedPlaybackTTS(EdgeTTS):
+    def _play_file(self, audio_file):
+        time.sleep(os.path.getsize(audio_file) / MP3_BYTES_PER_SECOND)
+
+    def _play_bytes(self, audio):
+        time.sleep(len(audio) / MP3_BYTES_PER_SECOND)
+
+
+def run(mode, engine, runs):
+    speak = engine.speak_single if mode == "single" else engine.speak_pipelined
+    first_audio, totals = [], []
+    for _ in range(runs):
+        speak(TEXT)
+        first_audio.append(engine.last_timing["time_to_first_audio"])
+        totals.append(engine.last_timing["total"])
+    return statistics.median(first_audio), statistics.median(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--playback", action="store_true", help="play audio instead of simulating it")
+    args = parser.parse_args()
+
+    engine = EdgeTTS(temp_folder="temp") if args.playback else SimulatedPlaybackTTS(temp_folder="temp")
+
+    print(f"{'mode':<10} {'first audio (s)':>16} {'total (s)':>10}")
+    for mode in ("single", "pipelined"):
+        first_audio, total = run(mode, engine, args.runs)
+        print(f"{mode:<10} {first_audio:>16.2f} {total:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
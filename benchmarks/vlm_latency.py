@@ -0,0 +1,64 @@
+"""
+Screen-question latency against Ollama: cold vs warm model, streaming vs not.
+
+Each scenario asks VLMManager about the same synthetic 1920x1080 screen
+(the analysis cache is off) and reports time to first token and total
+time. "cold" unloads the model first (keep_alive 0); "after warm-up"
+unloads it and then runs the startup warm-up ping before the question.
+By default it runs against benchmarks/ollama_stub.py; pass --url to
+measure a real Ollama.
+
+    python -m benchmarks.vlm_latency [--url http://localhost:11434] [--runs 3]
+"""
+
+import argparse
+import statistics
+
+from benchmarks.ollama_stub import serve
+from benchmarks.screen_encode import synthetic_screen
+from core.http_client import HTTPClientPool
+from managers.vlm_manager import VLMManager
+
+QUESTION = "what is on my screen"
+
+
+def scenario(vlm, stream, state):
+    vlm.stream = stream
+    if state in ("cold", "after warm-up"):
+        vlm.release()
+    if state == "after warm-up":
+        vlm.warm_up()
+    vlm.analyze_screen(QUESTION)
+    return vlm.last_timing["ttft_s"], vlm.last_timing["total_s"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Ollama base URL (default: start the local stand-in)")
+    parser.add_argument("--model", default="minicpm-v")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    server, url = (None, args.url) if args.url else serve()
+    http = HTTPClientPool()
+    vlm = VLMManager(model=args.model, http_client=http, base_url=url)
+    vlm.cache = None
+    screen = synthetic_screen(1920, 1080)
+    vlm.capture.grab = lambda region=None: screen
+
+    print(f"{'mode':<11} {'model':<14} {'first token (s)':>16} {'total (s)':>10}")
+    try:
+        for stream in (False, True):
+            for state in ("cold", "warm", "after warm-up"):
+                results = [scenario(vlm, stream, state) for _ in range(args.runs)]
+                ttft = statistics.median(r[0] for r in results)
+                total = statistics.median(r[1] for r in results)
+                print(f"{'stream' if stream else 'blocking':<11} {state:<14} {ttft:>16.2f} {total:>10.2f}")
+    finally:
+        http.close()
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
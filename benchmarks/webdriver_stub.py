@@ -0,0 +1,143 @@
+"""
+A stand-in for chromedriver + the bundled STT page, for exercising the
+listener's WebDriver traffic without Chrome.
+
+It speaks the W3C WebDriver endpoints SpeechToTextListener uses (new
+session, navigate, find element, element text, execute sync/async) and
+models only the page state they touch: #is_recording, #convert_text and
+the event bridge's window.nextSttEvents long-poll. Each command costs one
+HTTP round trip, like the real driver; the browser's own CPU is not
+modelled, so use it to compare the Python side of listener loops only.
+
+    python -m benchmarks.webdriver_stub [--port 9515]
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class StubPage:
+    def __init__(self):
+        self.recording = False
+        self.transcript = ""
+        self.language = "en-IN"
+        self.changed = threading.Condition()
+        self.events = []
+
+    def set_recording(self, value):
+        with self.changed:
+            if value != self.recording:
+                self.recording = value
+                self.events.append({"type": "recording", "data": value, "t": time.time() * 1000})
+                self.changed.notify_all()
+
+    def next_events(self, timeout_ms):
+        with self.changed:
+            self.changed.wait_for(lambda: self.events, timeout_ms / 1000)
+            events, self.events = self.events, []
+            return events
+
+    def text(self, element):
+        if element == "is_recording":
+            return f"Recording: {self.recording}"
+        if element == "convert_text":
+            return self.transcript
+        return ""
+
+    def execute(self, script, args):
+        """Recognizes the handful of scripts the listener and benchmarks send."""
+        if "typeof window.nextSttEvents" in script:
+            return True
+        if len(args) == 2 and isinstance(args[0], dict) and args[1] == "value":
+            # selenium's getAttribute atom, only used on the checked language option
+            return self.language
+        match = re.search(r"select\.value = '([^']*)'", script)
+        if match:
+            self.language = match.group(1)
+        if "resetSttEvents" in script:
+            with self.changed:
+                self.events = []
+        if "Recording: True" in script and "setTimeout" in script:
+            self.set_recording(True)
+            threading.Timer(args[0] / 1000, self.set_recording, (False,)).start()
+        if "innerHTML = ''" in script:
+            self.transcript = ""
+        if "endSttUtterance" in script:
+            self.set_recording(False)
+        return None
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Keep-alive plus Nagle/delayed ACK would add ~40 ms per command, which chromedriver doesn't
+    disable_nagle_algorithm = True
+    page = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, value, status=200):
+        data = json.dumps({"value": value}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts[-1] == "text" and "element" in parts:
+            self._reply(self.page.text(parts[-2]))
+        elif parts[-1] == "status":
+            self._reply({"ready": True, "message": "stub"})
+        else:
+            self._reply(None)
+
+    def do_DELETE(self):
+        self._reply(None)
+
+    def do_POST(self):
+        body = self._body()
+        parts = self.path.strip("/").split("/")
+        if parts == ["session"]:
+            self._reply({"sessionId": "stub", "capabilities": {"browserName": "chrome", "browserVersion": "stub"}})
+        elif parts[-1] == "element":
+            # Selenium sends By.ID as a css selector: [id="is_recording"]
+            selector = body.get("value", "")
+            element = selector.split('"')[1] if '"' in selector else selector
+            self._reply({ELEMENT_KEY: element})
+        elif parts[-2:] == ["execute", "sync"]:
+            self._reply(self.page.execute(body.get("script", ""), body.get("args", [])))
+        elif parts[-2:] == ["execute", "async"]:
+            args = body.get("args", [])
+            self._reply(self.page.next_events(args[0] if args else 5000))
+        else:
+            self._reply(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9515)
+    args = parser.parse_args()
+
+    handler = type("StubHandler", (Handler,), {"page": StubPage()})
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    print(f"WebDriver stand-in listening on http://127.0.0.1:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,3 +16,149 @@ class Config:
     # LLM Provider: "OPENROUTER", "COHERE"
     LLM_PROVIDER = "COHERE"
 
+    # TTS: synthesize sentence N+1 while sentence N plays, from in-memory buffers
+    TTS_PIPELINED = True
+    TTS_LOOKAHEAD = 2
+
+    # Synthesized phrases are cached outside temp/ so they survive restarts
+    TTS_CACHE_ENABLED = True
+    TTS_CACHE_DIR = os.path.join("cache", "tts")
+    TTS_CACHE_MAX_MB = 50
+
+    # Conversation memory: append-only journal, imported once from memory/memory.json
+    MEMORY_JOURNAL_DIR = os.path.join("memory", "journal")
+    MEMORY_SEGMENT_SIZE = 1000
+    MEMORY_FSYNC = False
+    MEMORY_RECENT_WINDOW = 50
+
+    # Context assembly: history sent per turn is capped at min(model limit, CONTEXT_MAX_TOKENS)
+    # minus CONTEXT_RESERVE_TOKENS left for the completion. Tokenizer: "auto", "tiktoken", "approx"
+    CONTEXT_MAX_TOKENS = 16000
+    CONTEXT_RESERVE_TOKENS = 1024
+    CONTEXT_TOKENIZER = "auto"
+
+    # Relevance recall: with the index enabled only the last CONTEXT_RECENT_MESSAGES are sent,
+    # plus the RECALL_TOP_K most similar past exchanges (hashed n-gram vectors, needs numpy)
+    MEMORY_RECALL_ENABLED = True
+    MEMORY_RECALL_DIR = os.path.join("memory", "recall")
+    MEMORY_RECALL_DIM = 128
+    CONTEXT_RECENT_MESSAGES = 20
+    RECALL_TOP_K = 3
+    RECALL_MIN_SCORE = 0.3
+
+    # Shared HTTP pool: one keep-alive client per host, HTTP/2 when `h2` is installed
+    HTTP2_ENABLED = True
+    HTTP_MAX_CONNECTIONS_PER_HOST = 4
+    HTTP_KEEPALIVE_EXPIRY = 120
+
+    # Tool parameters (city, news topic) are extracted locally; below this confidence the LLM is asked
+    DEFAULT_CITY = "Kolkata"
+    SLOT_CONFIDENCE_THRESHOLD = 0.6
+
+    # Minimum summed keyword weight for IntentEngine to route an utterance to a tool
+    INTENT_THRESHOLD = 0.5
+
+    # Weather/news responses: (fresh seconds, extra seconds served stale while refreshing in the background)
+    TOOL_CACHE_ENABLED = True
+    TOOL_CACHE_FILE = os.path.join("cache", "tools.json")
+    TOOL_CACHE_TTLS = {
+        "weather": (600, 1800),
+        "news": (900, 3600)
+    }
+
+    # Background refresh of the default city's weather, top headlines and the most asked-for queries
+    PREFETCH_ENABLED = True
+    PREFETCH_STATS_FILE = os.path.join("cache", "prefetch.json")
+    PREFETCH_INTERVALS = {"weather": 600, "news": 900}
+    PREFETCH_MAX_CALLS_PER_HOUR = {"weather": 30, "news": 6}
+    PREFETCH_TOP_N = 2
+
+    # System tool readings come from a background sampler (seconds between samples, samples kept), started
+    # during the startup warm-up. A CPU reading needs at least SYSTEM_CPU_MIN_WINDOW seconds of measurement
+    SYSTEM_SAMPLE_INTERVAL = 5
+    SYSTEM_CPU_MIN_WINDOW = 0.5
+    SYSTEM_SAMPLE_HISTORY = 720
+    SYSTEM_GPU_SAMPLE_EVERY = 6
+    SYSTEM_TREND_WINDOW = 300
+
+    # Startup warm-up, run while the activation sound plays (seconds before a component is reported as still warming)
+    WARMUP_TIMEOUT = 10
+    TTS_WARMUP_PHRASES = ["Ava is online.", "Shutting down in 5 seconds."]
+    VLM_WARMUP = True
+    VLM_KEEP_ALIVE = "30m"
+
+    # Screen capture for the VLM: the longest side is downscaled to VLM_MAX_SIDE before encoding (minicpm-v
+    # works on ~448 px slices). Format "JPEG", "WEBP" or "PNG"; region None (whole screen), "active" (foreground
+    # window, Windows only) or a (left, top, right, bottom) box
+    VLM_MAX_SIDE = 1344
+    VLM_IMAGE_FORMAT = "JPEG"
+    VLM_IMAGE_QUALITY = 85
+    VLM_CAPTURE_REGION = None
+
+    # Screen answers are reused while the screen looks the same: same normalized question, within VLM_CACHE_TTL
+    # seconds, dHash distance <= VLM_CACHE_TOLERANCE bits (of 64) for the whole screen and for every cell of a
+    # VLM_CACHE_TILES x VLM_CACHE_TILES grid (0 = whole-screen hash only)
+    VLM_CACHE_ENABLED = True
+    VLM_CACHE_TTL = 120
+    VLM_CACHE_TOLERANCE = 4
+    VLM_CACHE_TILES = 4
+    VLM_CACHE_MAX_ENTRIES = 32
+
+    # Ollama vision calls: partial answers are streamed (and shown while the turn is processed). VLM_KEEP_ALIVE
+    # above goes with every request: a duration ("30m") or "pin" to keep minicpm-v loaded for as long as Ava
+    # runs; a pinned model is unloaded again on exit when VLM_UNLOAD_ON_EXIT is set
+    VLM_OLLAMA_URL = os.getenv("OLLAMA_HOST", "http://localhost:11434")
+    VLM_STREAM = True
+    VLM_UNLOAD_ON_EXIT = True
+
+    # STT backend: "browser" (Chrome web speech page) or "whisper" (offline faster-whisper, using the
+    # STT_MODEL_SIZE/DEVICE/COMPUTE_TYPE above). Whisper ends an utterance after STT_ENDPOINT_SILENCE_MS
+    # of non-speech from the Silero VAD and re-decodes every STT_PARTIAL_INTERVAL seconds for partials
+    STT_BACKEND = "browser"
+    STT_LANGUAGE = "en-IN"
+    STT_BEAM_SIZE = 5
+    STT_VAD_THRESHOLD = 0.5
+    STT_ENDPOINT_SILENCE_MS = 600
+    STT_PARTIAL_INTERVAL = 0.8
+    STT_MAX_UTTERANCE = 30
+    STT_START_TIMEOUT = 10
+
+    # Browser STT endpointing: the turn ends on the recognizer's final result, or once the interim transcript
+    # has held still for the preset's stable_ms (with at least min_words words), instead of waiting for the
+    # page to stop recording by itself. "off" keeps the old behaviour
+    STT_ENDPOINTING = "balanced"
+    STT_ENDPOINT_PRESETS = {
+        "conservative": {"stable_ms": 1200, "min_words": 3},
+        "balanced": {"stable_ms": 800, "min_words": 2},
+        "aggressive": {"stable_ms": 500, "min_words": 1}
+    }
+
+    # Speculative tool calls: partial transcripts are routed locally and the likely tool fetch (or screen grab)
+    # starts before the user finishes; the final transcript confirms or discards it. A speculative screen grab
+    # older than SPECULATION_FRAME_MAX_AGE seconds by then is retaken, since the screen may have moved on
+    SPECULATION_ENABLED = True
+    SPECULATION_MAX_WORKERS = 2
+    SPECULATION_FRAME_MAX_AGE = 1.0
+
+    # Audio output: decoded PCM is played from a ring buffer in AUDIO_CHUNK_MS slices, so stop, pause and
+    # barge-in (the user talking over a reply, detected from partial transcripts) act within one slice. A partial
+    # only barges in with BARGE_IN_MIN_NEW_WORDS words Ava did not just say; shorter commands stop her once the
+    # utterance is complete
+    AUDIO_BUFFER_SECONDS = 4
+    AUDIO_CHUNK_MS = 40
+    BARGE_IN_ENABLED = True
+    BARGE_IN_MIN_NEW_WORDS = 2
+
+    # Echo suppression: a transcript is dropped as Ava hearing herself when at least ECHO_THRESHOLD of it
+    # (token/bigram containment) matches what she said in the last ECHO_WINDOW_SECONDS. Transcripts under
+    # ECHO_MIN_TOKENS words are only dropped when they repeat a whole sentence. Only speech heard while Ava is
+    # playing, or within ECHO_TAIL_SECONDS after she stops, is checked at all
+    ECHO_WINDOW_SECONDS = 20
+    ECHO_TAIL_SECONDS = 1.0
+    ECHO_THRESHOLD = 0.7
+    ECHO_MIN_TOKENS = 3
+    ECHO_MAX_SENTENCES = 50
+
+    # One JSON line per turn with stage latencies (end of speech -> tools -> LLM -> first audio)
+    TURN_METRICS_FILE = os.path.join("logs", "turn_latency.jsonl")
+
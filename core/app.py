@@ -1,6 +1,6 @@
+import asyncio
 import logging
 import os
-import time
 from managers.stt_manager import STTManager
 from managers.tts_manager import TTSManager
 from BRAIN.openrouter import OpenRouterLLM
@@ -14,32 +14,75 @@ from rich import box
 
 console = Console()
 
-from playsound import playsound
 import os
 
 from System.prompts import SystemPrompts
 
 from managers.memory_manager import MemoryManager
+from managers.context_builder import ContextBuilder
+from core.http_client import get_http_pool
 from managers.tool_manager import ToolManager
+from modules.tts.sentence_chunker import SentenceChunker
+from core.startup_profile import startup_phase
+from core.warmup import Warmup
+from core.turn_metrics import TurnMetrics
+from managers.speculative_executor import SpeculativeExecutor
 
 class JarvisApp:
-    def __init__(self):
+    def __init__(self, stt_backend=Config.STT_BACKEND):
         self.console = Console()
         self._cleanup_temp()
         self.setup_logging()
-        self.stt_manager = STTManager()
-        self.tts_manager = TTSManager()
-        self.memory_manager = MemoryManager()
+        self.http = get_http_pool()
+        with startup_phase("STTManager"):
+            self.stt_manager = STTManager(stt_backend)
+        with startup_phase("TTSManager"):
+            self.tts_manager = TTSManager()
+        with startup_phase("MemoryManager"):
+            self.memory_manager = MemoryManager()
+        with startup_phase("ContextBuilder"):
+            self.context_builder = ContextBuilder()
         
-        if Config.LLM_PROVIDER == "OPENROUTER":
-            self.llm = OpenRouterLLM()
-        elif Config.LLM_PROVIDER == "COHERE":
-            self.llm = CohereLLM()
-        else:
-             # Default to OpenRouter if unknown
-            self.llm = OpenRouterLLM()
+        with startup_phase("LLM client"):
+            if Config.LLM_PROVIDER == "OPENROUTER":
+                self.llm = OpenRouterLLM(http_client=self.http)
+            elif Config.LLM_PROVIDER == "COHERE":
+                self.llm = CohereLLM(http_client=self.http)
+            else:
+                 # Default to OpenRouter if unknown
+                self.llm = OpenRouterLLM(http_client=self.http)
             
-        self.tool_manager = ToolManager(llm_instance=self.llm)
+        with startup_phase("ToolManager"):
+            self.tool_manager = ToolManager(llm_instance=self.llm, http_client=self.http)
+        if self.tool_manager.prefetcher:
+            self.tool_manager.prefetcher.start()
+        self.metrics = TurnMetrics()
+        self.speculator = SpeculativeExecutor(self.tool_manager) if Config.SPECULATION_ENABLED else None
+
+    def _build_warmup(self):
+        warmup = Warmup()
+        # The first listen needs the page anyway, so it is always awaited
+        warmup.add("stt", self.stt_manager.warm_up, required=True)
+        warmup.add("llm", self._warm_llm)
+        warmup.add("tts", self.tts_manager.warm_up)
+        # Builds the system tool so its sampler has readings (and a trend) before the first system question
+        warmup.add("system", self._warm_system)
+        if Config.VLM_WARMUP:
+            warmup.add("vlm", lambda: self.tool_manager.tools["screen_reader"].manager.warm_up())
+        return warmup
+
+    def _warm_system(self):
+        self.tool_manager.tools.get("system_info")
+        return "sampler started"
+
+    def _warm_llm(self):
+        """Pays the TCP/TLS handshake to the provider now rather than on the first turn."""
+        response = self.http.request("HEAD", self.llm.base_url, timeout=5)
+        return f"{self.llm.base_url} connected (HTTP {response.status_code})"
+
+    def _play_sound(self, path):
+        from playsound import playsound
+        playsound(path)
 
     def _cleanup_temp(self):
         temp_dir = 'temp'
@@ -74,106 +117,224 @@ class JarvisApp:
         logger.addHandler(error_handler)
 
     def run(self):
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        logging.info(f"HTTP pool stats: {self.http.stats()}")
+        if self.tool_manager.prefetcher:
+            self.tool_manager.prefetcher.stop()
+            logging.info(f"Prefetch stats: {self.tool_manager.prefetcher.stats()}")
+        if self.tool_manager.cache:
+            logging.info(f"Tool cache stats: {self.tool_manager.cache.stats()}")
+        if "screen_reader" in self.tool_manager.tools.loaded():
+            screen_cache = self.tool_manager.tools["screen_reader"].manager.cache
+            if screen_cache:
+                logging.info(f"Screen analysis cache stats: {screen_cache.stats()}")
+            if Config.VLM_KEEP_ALIVE == "pin" and Config.VLM_UNLOAD_ON_EXIT:
+                try:
+                    self.tool_manager.tools["screen_reader"].manager.release()
+                except Exception as e:
+                    logging.warning(f"Could not release the vision model: {e}")
+        if self.speculator:
+            self.speculator.close()
+            logging.info(f"Speculation stats: {self.speculator.stats()}")
+        logging.info(f"Echo filter stats: {self.tts_manager.echo_filter.stats()}")
+        if self.metrics.turns:
+            logging.info(f"Turn latency summary: {self.metrics.summary()}")
+        self.stt_manager.close()
+        self.http.close()
+
+    async def run_async(self):
         self.console.print("\n[bold cyan]Ava AI Online[/bold cyan]\n", justify="center")
         
+        warmup = self._build_warmup()
         activation_sound = os.path.join("assets", "ASSETS_SOUNDS_activation_sound.wav")
         if os.path.exists(activation_sound):
-            playsound(activation_sound)
+            greeting = asyncio.to_thread(self._play_sound, activation_sound)
         else:
-             self.tts_manager.speak("Ava is online.")
-             self.tts_manager.wait()
-        
+            greeting = self.tts_manager.aspeak("Ava is online.")
+        await asyncio.gather(greeting, warmup.run())
+        for line in warmup.summary():
+            self.console.print(line)
+        self.console.print()
+
+        # Playback of the previous reply; the next listen starts while its tail is still playing
+        self._speech_task = None
+        self._active_stream = None
+
         while True:
+            # Speculation belongs to one utterance; whatever the last turn did not claim is dropped
+            if self.speculator:
+                self.speculator.discard()
             try:
                 with self.console.status("Listening...", spinner="dots") as status:
                     def stt_callback(text):
                         status.update(f"[bold green]Listening: {text}[/bold green]")
+                        if self.tts_manager.echo_filter.is_own_fragment(text):
+                            return
+                        # Talking over the tail of a reply cuts it off; one misheard word of her own reply must not
+                        if Config.BARGE_IN_ENABLED and not self.tts_manager.is_idle() \
+                                and len(self.tts_manager.echo_filter.new_words(text)) >= Config.BARGE_IN_MIN_NEW_WORDS:
+                            self.tts_manager.barge_in()
+                        if self.speculator:
+                            self.speculator.on_partial(text)
                         
-                    text = self.stt_manager.listen(callback=stt_callback)
+                    text = await self.stt_manager.alisten(callback=stt_callback)
+                    stt_timing = self.stt_manager.last_timing
                 
                 if text:
-                    self.tts_manager.stop()
-                    
-                    if text.strip().lower() == self.tts_manager.last_spoken.strip().lower():
-                        logging.info("Ignored self-hearing echo")
+                    if self.tts_manager.echo_filter.is_echo(text, stt_timing.get("speech_end")):
                         continue
 
+                    self.tts_manager.stop()
+                    await self._finish_speech()
+
                     logging.info(f"User: {text}")
-                    
-                    import datetime
-                    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
 
                     self.console.print(f"[bold green]User:[/bold green] {text}")
                     
                     if "exit" in text.lower() or "quit" in text.lower():
                          self.console.print(Panel("[bold red]Initiating Shutdown Sequence...[/bold red]", border_style="red"))
-                         self.tts_manager.speak("Shutting down in 5 seconds.")
-                         time.sleep(5)
+                         await self.tts_manager.aspeak("Shutting down in 5 seconds.")
+                         await asyncio.sleep(5)
                          deactivation_sound = os.path.join("assets", "ASSETS_SOUNDS_deactivation_sound.wav")
                          if os.path.exists(deactivation_sound):
-                             playsound(deactivation_sound)
+                             await asyncio.to_thread(self._play_sound, deactivation_sound)
                          self.console.print("[bold red]System Offline.[/bold red]")
                          break
-                    
-                    tool_result = self.tool_manager.process(text)
-                    tool_content = None
-                    if tool_result:
-                        text += f" [VISUAL CONTEXT: {tool_result}]"
-                        tool_content = Text("\n\nTool Output: ", style="italic dim yellow") + Text(str(tool_result), style="italic dim yellow")
-                        self.memory_manager.add_message("user", text + " (System: Respond in clear English. Describe the visual context briefly.)")
-                    else:
-                        self.memory_manager.add_message("user", text + " (System: Respond in clear English.)")
-                    
-                    with self.console.status("[bold magenta]Processing...[/bold magenta]", spinner="bouncingBar") as status:
-                         history = self.memory_manager.get_messages()
-                         response, usage, model_name = self.llm.generate(history, system_prompt=SystemPrompts.AVA_BEHAVIOR)
-                    
-                    self.memory_manager.add_message("assistant", response)
-                    
-    
-                    if usage:
-                        total = usage.get('total', usage.get('total_tokens', 0))
-                        limit = self.llm.get_model_context_limit(model_name)
-                        left = limit - total
-                        
-    
-                        short_model = model_name.split('/')[-1] if '/' in model_name else model_name
-                        
-                        subtitle_text = f"[dim]{short_model} • U:{total} L:{left}[/dim]"
-                    else:
-                        subtitle_text = f"[dim]{model_name or 'Unknown'}[/dim]"
 
-                    from rich.live import Live
-                    
-                    panel_content = Text("", style="cyan")
-                    
-                    def create_panel(text_content):
-                        return Panel(
-                            text_content,
-                            title="[bold cyan]Ava[/bold cyan]",
-                            title_align="left",
-                            subtitle=subtitle_text,
-                            subtitle_align="right",
-                            border_style="cyan",
-                            box=box.ROUNDED,
-                            padding=(1, 2),
-                            width=80
-                        )
-
-                    import threading
-                    tts_thread = threading.Thread(target=self.tts_manager.speak, args=(response,))
-                    tts_thread.start()
-
-                    with Live(Align.left(create_panel(panel_content)), console=self.console, refresh_per_second=15, auto_refresh=True) as live:
-                        for word in response.split(" "):
-                            panel_content.append(word + " ")
-                            live.update(Align.left(create_panel(panel_content)))
-                    
-                    tts_thread.join()  
-                    
-            except KeyboardInterrupt:
-                break
+                    turn = self.metrics.start(text, stt_timing.get("speech_end"), stt_timing.get("returned"))
+                    await self.handle_turn(text, turn)
+
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                await self._cancel_turn()
+                raise
             except Exception as e:
                 self.console.print(f"[bold red]Error:[/bold red] {e}")
                 logging.error(f"Runtime Error: {e}")
+                await self._cancel_turn()
                 break
+
+        await self._finish_speech()
+
+    async def _finish_speech(self):
+        if self._speech_task:
+            await self._speech_task
+            self._speech_task = None
+
+    async def _cancel_turn(self):
+        """Stops the in-flight LLM stream and speech so cancellation leaves nothing running."""
+        if self._active_stream:
+            self._active_stream.cancel()
+            self._active_stream = None
+        self.tts_manager.stop()
+        if self._speech_task:
+            # stop() makes the playback worker drain immediately, so this returns quickly
+            await asyncio.gather(self._speech_task, return_exceptions=True)
+            self._speech_task = None
+        else:
+            await asyncio.to_thread(self.tts_manager.finish_stream)
+
+    async def handle_turn(self, text, turn=None):
+        turn = turn or self.metrics.start(text)
+        # The tool fetch and history assembly are independent; run them side by side
+        with self.console.status("[bold magenta]Processing...[/bold magenta]", spinner="bouncingBar") as status:
+            def tool_partial(partial):
+                # Streamed screen descriptions show up while the rest of the turn is prepared
+                status.update(f"[bold magenta]Processing...[/bold magenta] [dim]{partial[-60:]}[/dim]")
+
+            tool_result, context = await asyncio.gather(
+                self.tool_manager.aprocess(text, on_partial=tool_partial, speculation=self.speculator),
+                asyncio.to_thread(self.context_builder.build, self.memory_manager, SystemPrompts.AVA_BEHAVIOR, self.llm.model, text)
+            )
+
+            if tool_result:
+                text += f" [VISUAL CONTEXT: {tool_result}]"
+                user_message = text + " (System: Respond in clear English. Describe the visual context briefly.)"
+            else:
+                user_message = text + " (System: Respond in clear English.)"
+            self.memory_manager.add_message("user", user_message)
+            history = self.context_builder.extend(context, {"role": "user", "content": user_message}).messages
+            self.metrics.mark(turn, "context_ready")
+
+            self.metrics.mark(turn, "llm_request")
+            stream = self.llm.stream(history, system_prompt=SystemPrompts.AVA_BEHAVIOR)
+            self._active_stream = stream
+            deltas = stream.__aiter__()
+            # Keep the spinner up until the provider sends the first token
+            first_delta = await anext(deltas, "")
+            self.metrics.mark(turn, "llm_first_token")
+
+        from rich.live import Live
+        
+        panel_content = Text("", style="cyan")
+        
+        def create_panel(text_content, subtitle_text):
+            return Panel(
+                text_content,
+                title="[bold cyan]Ava[/bold cyan]",
+                title_align="left",
+                subtitle=subtitle_text,
+                subtitle_align="right",
+                border_style="cyan",
+                box=box.ROUNDED,
+                padding=(1, 2),
+                width=80
+            )
+
+        streaming_subtitle = f"[dim]{stream.model or 'Unknown'}[/dim]"
+        chunker = SentenceChunker()
+        self.tts_manager.start_stream()
+
+        with Live(Align.left(create_panel(panel_content, streaming_subtitle)), console=self.console, refresh_per_second=15, auto_refresh=True) as live:
+            panel_content.append(first_delta)
+            for sentence in chunker.feed(first_delta):
+                self.tts_manager.feed(sentence)
+
+            # TTS synthesis and playback run on their own threads while tokens render here
+            async for delta in deltas:
+                panel_content.append(delta)
+                live.update(Align.left(create_panel(panel_content, streaming_subtitle)))
+                for sentence in chunker.feed(delta):
+                    self.tts_manager.feed(sentence)
+
+            for sentence in chunker.flush():
+                self.tts_manager.feed(sentence)
+
+            response, usage, model_name = stream.result()
+            self._active_stream = None
+            self.metrics.mark(turn, "llm_done")
+
+            if usage:
+                total = usage.get('total', usage.get('total_tokens', 0))
+                limit = self.llm.get_model_context_limit(model_name)
+                left = limit - total
+                
+
+                short_model = model_name.split('/')[-1] if '/' in model_name else model_name
+                
+                subtitle_text = f"[dim]{short_model} • U:{total} L:{left}[/dim]"
+            else:
+                subtitle_text = f"[dim]{model_name or 'Unknown'}[/dim]"
+
+            live.update(Align.left(create_panel(panel_content, subtitle_text)))
+
+        if stream.time_to_first_token is not None:
+            logging.info(f"LLM time to first token: {stream.time_to_first_token:.2f}s")
+
+        self.memory_manager.add_message("assistant", response)
+
+        self._speech_task = asyncio.create_task(self._speak_reply(turn))
+
+    async def _speak_reply(self, turn):
+        try:
+            await self.tts_manager.afinish_stream()
+        finally:
+            if self.tts_manager.first_audio_at is not None:
+                self.metrics.mark(turn, "first_audio", self.tts_manager.first_audio_at)
+            self.metrics.finish(turn)
@@ -0,0 +1,137 @@
+import logging
+import threading
+from contextlib import contextmanager
+
+import httpx
+from config import Config
+
+try:
+    import h2  # noqa: F401  (httpx only needs it importable to speak HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HTTPClientPool:
+    """
+    Keep-alive HTTP clients shared by the LLM backends, tools and the VLM.
+
+    One httpx.Client is kept per host so each host gets its own connection
+    limit, and HTTP/2 is negotiated where the `h2` package is installed.
+    Every request is traced to count whether it opened a new connection or
+    reused a pooled one.
+    """
+
+    def __init__(self, http2=Config.HTTP2_ENABLED, max_connections_per_host=Config.HTTP_MAX_CONNECTIONS_PER_HOST,
+                 keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY, timeout=30):
+        self.logger = logging.getLogger("HTTPClientPool")
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self._clients = {}
+        self._lock = threading.Lock()
+        self.new_connections = 0
+        self.reused_connections = 0
+
+        if http2 and not HTTP2_AVAILABLE:
+            self.logger.info("h2 not installed; using HTTP/1.1 keep-alive only.")
+
+    def client_for(self, url):
+        origin = httpx.URL(url)
+        key = (origin.scheme, origin.host, origin.port)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = httpx.Client(http2=self.http2, limits=self.limits, timeout=self.timeout)
+                self._clients[key] = client
+            return client
+
+    def _tracer(self):
+        opened = []
+
+        def trace(event_name, info):
+            if event_name == "connection.connect_tcp.started":
+                opened.append(True)
+
+        return trace, opened
+
+    def _record(self, opened):
+        with self._lock:
+            if opened:
+                self.new_connections += 1
+            else:
+                self.reused_connections += 1
+
+    def request(self, method, url, **kwargs):
+        trace, opened = self._tracer()
+        extensions = dict(kwargs.pop("extensions", None) or {}, trace=trace)
+        try:
+            return self.client_for(url).request(method, url, extensions=extensions, **kwargs)
+        finally:
+            self._record(opened)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    @contextmanager
+    def stream(self, method, url, **kwargs):
+        trace, opened = self._tracer()
+        extensions = dict(kwargs.pop("extensions", None) or {}, trace=trace)
+        try:
+            with self.client_for(url).stream(method, url, extensions=extensions, **kwargs) as response:
+                self._record(opened)
+                opened = None
+                yield response
+        finally:
+            if opened is not None:
+                self._record(opened)
+
+    def warm_up(self, urls, timeout=5):
+        """Opens (and TLS-handshakes) a pooled connection to each URL's host in parallel."""
+        def _ping(url):
+            try:
+                self.request("HEAD", url, timeout=timeout)
+            except Exception as e:
+                self.logger.debug(f"Warm-up failed for {url}: {e}")
+
+        threads = [threading.Thread(target=_ping, args=(url,), daemon=True) for url in dict.fromkeys(urls) if url]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def stats(self):
+        total = self.new_connections + self.reused_connections
+        return {
+            "requests": total,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "reuse_rate": self.reused_connections / total if total else 0.0,
+            "hosts": len(self._clients),
+            "http2": self.http2
+        }
+
+    def close(self):
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+_shared_pool = None
+_shared_lock = threading.Lock()
+
+
+def get_http_pool():
+    """Returns the process-wide pool, creating it on first use."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = HTTPClientPool()
+        return _shared_pool
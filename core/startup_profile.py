@@ -0,0 +1,132 @@
+"""
+Startup profiling for `python main.py --profile-startup`: times every import
+and each init phase of JarvisApp up to the point where "Ava AI Online" would
+be printed, prints a breakdown and appends the totals to
+logs/startup_profile.jsonl so cold-start time can be tracked across changes.
+"""
+
+import builtins
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+FIRST_PARTY = {"core", "managers", "tools", "BRAIN", "modules", "Functions", "System", "config", "main"}
+
+_active = None
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.first_party = {}
+        self.third_party = {}
+        self.phases = []
+        self._stack = []
+        self._original_import = None
+
+    def install(self):
+        global _active
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+        _active = self
+
+    def uninstall(self):
+        global _active
+        self.finished = time.perf_counter()
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+        _active = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        root = name.partition(".")[0]
+        importer_root = self._stack[-1][0] if self._stack else None
+        self._stack.append([root, 0.0])
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            _, children = self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+            if root in FIRST_PARTY:
+                # Own code: time spent in the module body itself, excluding what it imports
+                self.first_party[name] = self.first_party.get(name, 0.0) + elapsed - children
+            elif importer_root is None or importer_root in FIRST_PARTY:
+                # A dependency imported by our code: charge its whole import tree to it
+                self.third_party[root] = self.third_party.get(root, 0.0) + elapsed
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    def total(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def report(self, console, top=15):
+        from rich.table import Table
+
+        total = self.total()
+        for title, timings in (("Dependency imports", self.third_party), ("Own module bodies", self.first_party)):
+            table = Table(title=title, title_justify="left")
+            table.add_column("module")
+            table.add_column("ms", justify="right")
+            for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:top]:
+                table.add_row(name, f"{seconds * 1000:.1f}")
+            console.print(table)
+
+        table = Table(title="Init phases", title_justify="left")
+        table.add_column("phase")
+        table.add_column("ms", justify="right")
+        for name, seconds in self.phases:
+            table.add_row(name, f"{seconds * 1000:.1f}")
+        console.print(table)
+        console.print(f"[bold cyan]Time to 'Ava AI Online': {total * 1000:.0f} ms[/bold cyan]")
+
+    def save(self, path=os.path.join("logs", "startup_profile.jsonl")):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        record = {
+            "timestamp": time.time(),
+            "total_ms": round(self.total() * 1000, 1),
+            "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in self.phases},
+            "imports_ms": {name: round(seconds * 1000, 1) for name, seconds in self.third_party.items()}
+        }
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+@contextmanager
+def startup_phase(name):
+    """Times an init step when a startup profile is being taken; free otherwise."""
+    if _active is None:
+        yield
+        return
+    with _active.phase(name):
+        yield
+
+
+def profile_startup():
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        with profiler.phase("import core.app"):
+            from core.app import JarvisApp
+        with profiler.phase("JarvisApp() total"):
+            app = JarvisApp()
+    finally:
+        profiler.uninstall()
+
+    profiler.report(app.console)
+    profiler.save()
+    app.shutdown()
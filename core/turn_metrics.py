@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+import statistics
+import time
+from config import Config
+
+# (stage, from mark, to mark); a stage is skipped when either mark is missing
+STAGES = (
+    ("stt_endpoint", "speech_end", "text"),
+    ("tools_context", "text", "context_ready"),
+    ("llm_first_token", "llm_request", "llm_first_token"),
+    ("llm_total", "llm_request", "llm_done"),
+    ("tts_first_audio", "llm_first_token", "first_audio"),
+    ("voice_to_voice", "speech_end", "first_audio"),
+    ("turn_total", "speech_end", "speech_done")
+)
+
+
+class TurnMetrics:
+    """
+    Per-turn latency breakdown. The app marks perf_counter() timestamps as a
+    turn moves from end of speech through tools, LLM and TTS; finish() turns
+    them into stage durations and appends one JSON line per turn.
+    """
+
+    def __init__(self, path=Config.TURN_METRICS_FILE):
+        self.logger = logging.getLogger("TurnMetrics")
+        self.path = path
+        self.turns = []
+
+    def start(self, text, speech_end=None, text_at=None):
+        text_at = text_at or time.perf_counter()
+        # Without a speech-end signal from the recognizer, latency is counted from the final text
+        return {"text": text, "marks": {"speech_end": speech_end or text_at, "text": text_at}}
+
+    def mark(self, turn, name, at=None):
+        turn["marks"][name] = at if at is not None else time.perf_counter()
+
+    def finish(self, turn):
+        self.mark(turn, "speech_done")
+        marks = turn["marks"]
+        stages = {}
+        for stage, begin, end in STAGES:
+            if marks.get(begin) is not None and marks.get(end) is not None:
+                stages[stage] = round((marks[end] - marks[begin]) * 1000, 1)
+
+        record = {"timestamp": time.time(), "text": turn["text"], "stages_ms": stages}
+        self.turns.append(record)
+        self.logger.info(f"Turn latency: {stages}")
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            self.logger.error(f"Could not write turn metrics: {e}")
+        return stages
+
+    def summary(self):
+        """{stage: (turns, median ms, worst ms)} over the turns of this session."""
+        result = {}
+        for stage, _, _ in STAGES:
+            values = [turn["stages_ms"][stage] for turn in self.turns if stage in turn["stages_ms"]]
+            if values:
+                result[stage] = (len(values), statistics.median(values), max(values))
+        return result
+
+    def report(self, console):
+        from rich.table import Table
+
+        table = Table(title=f"Turn latency ({len(self.turns)} turns)", title_justify="left")
+        table.add_column("stage")
+        table.add_column("turns", justify="right")
+        table.add_column("median ms", justify="right")
+        table.add_column("max ms", justify="right")
+        for stage, (count, median, worst) in self.summary().items():
+            table.add_row(stage, str(count), f"{median:.0f}", f"{worst:.0f}")
+        console.print(table)
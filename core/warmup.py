@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import time
+from config import Config
+
+
+class Warmup:
+    """
+    Runs component warm-ups concurrently in worker threads and records which
+    finished. Each step is a callable returning a short detail string or
+    raising. Optional steps are given up on (not cancelled; the thread keeps
+    going) after `timeout` seconds; required ones are always awaited.
+    """
+
+    def __init__(self, timeout=Config.WARMUP_TIMEOUT):
+        self.logger = logging.getLogger("Warmup")
+        self.timeout = timeout
+        self.steps = []
+        self.results = {}
+
+    def add(self, name, func, required=False):
+        self.steps.append((name, func, required))
+
+    async def run(self):
+        await asyncio.gather(*(self._run_step(name, func, required) for name, func, required in self.steps))
+        return self.results
+
+    async def _run_step(self, name, func, required):
+        started = time.perf_counter()
+        try:
+            call = asyncio.to_thread(func)
+            detail = await (call if required else asyncio.wait_for(call, self.timeout))
+            ready = True
+        except asyncio.TimeoutError:
+            ready, detail = False, f"still warming after {self.timeout}s"
+        except Exception as e:
+            ready, detail = False, str(e) or type(e).__name__
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.results[name] = {"ready": ready, "ms": elapsed_ms, "detail": detail}
+        self.logger.info(f"Warm-up {name}: {'ready' if ready else 'not ready'} in {elapsed_ms:.0f} ms ({detail})")
+
+    def summary(self):
+        """One rich-markup line per component, in the order they were added."""
+        lines = []
+        for name, _, _ in self.steps:
+            result = self.results.get(name)
+            if result is None:
+                continue
+            mark = "[green]✓[/green]" if result["ready"] else "[yellow]✗[/yellow]"
+            lines.append(f"{mark} {name:<4} {result['ms']:>6.0f} ms  [dim]{result['detail']}[/dim]")
+        return lines
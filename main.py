@@ -1,7 +1,7 @@
 
+import argparse
 import os
 import warnings
-from core.app import JarvisApp
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
 
@@ -9,8 +9,32 @@ warnings.filterwarnings("ignore", category=UserWarning, module='pygame')
 warnings.filterwarnings("ignore", message=".*pkg_resources is deprecated.*")
 
 def main():
-    app = JarvisApp()
+    parser = argparse.ArgumentParser(description="Ava voice assistant")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print per-module import and init timings up to 'Ava AI Online', then exit")
+    parser.add_argument("--replay", metavar="SCRIPT",
+                        help="run unattended from a JSONL script of user turns instead of the microphone, "
+                             "then print per-stage turn latency")
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from core.startup_profile import profile_startup
+        profile_startup()
+        return
+
+    # Imported here so --profile-startup can time it
+    from core.app import JarvisApp
+    if not args.replay:
+        JarvisApp().run()
+        return
+
+    from modules.stt.backends import ReplayBackend
+    replay = ReplayBackend(args.replay)
+    app = JarvisApp(stt_backend=replay)
+    # Scripted users wait for Ava to finish talking, as a person would
+    replay.is_idle = app.tts_manager.is_idle
     app.run()
+    app.metrics.report(app.console)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,246 @@
+"""
+World cities for local slot extraction, mapped to the name OpenWeather expects.
+Aliases cover old names, common misspellings from speech recognition and
+Hinglish variants. Names that are also everyday English words (Nice, Reading,
+Split, Mobile, ...) are left out on purpose; those fall back to the LLM.
+"""
+
+CITIES = {
+    # India
+    "Kolkata": ["calcutta", "kolkatta", "kolkota", "kalkatta"],
+    "Mumbai": ["bombay", "mumbai city", "bambai"],
+    "Delhi": ["new delhi", "dilli", "dehli", "delhi ncr"],
+    "Bengaluru": ["bangalore", "banglore", "bengaluru city"],
+    "Chennai": ["madras"],
+    "Hyderabad": ["hydrabad", "hyderbad"],
+    "Pune": ["poona"],
+    "Ahmedabad": ["amdavad", "ahemdabad"],
+    "Jaipur": ["pink city"],
+    "Lucknow": ["lakhnau"],
+    "Kanpur": [],
+    "Nagpur": [],
+    "Indore": [],
+    "Bhopal": [],
+    "Patna": [],
+    "Ranchi": [],
+    "Varanasi": ["banaras", "benaras", "kashi"],
+    "Prayagraj": ["allahabad"],
+    "Agra": [],
+    "Noida": [],
+    "Gurugram": ["gurgaon"],
+    "Ghaziabad": [],
+    "Faridabad": [],
+    "Chandigarh": [],
+    "Amritsar": [],
+    "Ludhiana": [],
+    "Jalandhar": [],
+    "Dehradun": [],
+    "Shimla": ["simla"],
+    "Srinagar": [],
+    "Jammu": [],
+    "Leh": [],
+    "Guwahati": ["gauhati"],
+    "Shillong": [],
+    "Siliguri": [],
+    "Darjeeling": [],
+    "Durgapur": [],
+    "Asansol": [],
+    "Howrah": [],
+    "Bhubaneswar": ["bhubaneshwar"],
+    "Cuttack": [],
+    "Visakhapatnam": ["vizag", "vishakhapatnam"],
+    "Vijayawada": [],
+    "Kochi": ["cochin"],
+    "Thiruvananthapuram": ["trivandrum"],
+    "Kozhikode": ["calicut"],
+    "Coimbatore": [],
+    "Madurai": [],
+    "Mysuru": ["mysore"],
+    "Mangaluru": ["mangalore"],
+    "Goa": ["panaji", "panjim"],
+    "Surat": [],
+    "Vadodara": ["baroda"],
+    "Rajkot": [],
+    "Udaipur": [],
+    "Jodhpur": [],
+    "Raipur": [],
+    "Nashik": ["nasik"],
+    "Aurangabad": [],
+    "Gwalior": [],
+    "Jabalpur": [],
+    "Meerut": [],
+    "Aligarh": [],
+    "Gorakhpur": [],
+    "Dhanbad": [],
+    "Jamshedpur": [],
+    "Gangtok": [],
+    "Imphal": [],
+    "Agartala": [],
+    "Aizawl": [],
+    "Puducherry": ["pondicherry", "pondy"],
+    # South Asia
+    "Dhaka": ["dacca"],
+    "Chittagong": ["chattogram"],
+    "Karachi": [],
+    "Lahore": [],
+    "Islamabad": [],
+    "Kathmandu": [],
+    "Colombo": [],
+    "Thimphu": [],
+    "Kabul": [],
+    # East / South-East Asia
+    "Tokyo": [],
+    "Osaka": [],
+    "Kyoto": [],
+    "Seoul": [],
+    "Busan": [],
+    "Beijing": ["peking"],
+    "Shanghai": [],
+    "Shenzhen": [],
+    "Guangzhou": ["canton"],
+    "Hong Kong": ["hongkong"],
+    "Taipei": [],
+    "Singapore": [],
+    "Kuala Lumpur": [],
+    "Bangkok": [],
+    "Phuket": [],
+    "Hanoi": [],
+    "Ho Chi Minh City": ["saigon", "ho chi minh"],
+    "Jakarta": [],
+    "Bali": ["denpasar"],
+    "Manila": [],
+    "Yangon": ["rangoon"],
+    "Phnom Penh": [],
+    "Ulaanbaatar": ["ulan bator"],
+    # Middle East
+    "Dubai": [],
+    "Abu Dhabi": [],
+    "Doha": [],
+    "Riyadh": [],
+    "Jeddah": [],
+    "Mecca": ["makkah"],
+    "Medina": [],
+    "Muscat": [],
+    "Kuwait City": ["kuwait"],
+    "Manama": ["bahrain"],
+    "Tehran": [],
+    "Baghdad": [],
+    "Tel Aviv": [],
+    "Jerusalem": [],
+    "Amman": [],
+    "Beirut": [],
+    "Istanbul": [],
+    "Ankara": [],
+    # Europe
+    "London": [],
+    "Manchester": [],
+    "Birmingham": [],
+    "Liverpool": [],
+    "Edinburgh": [],
+    "Glasgow": [],
+    "Dublin": [],
+    "Paris": [],
+    "Marseille": [],
+    "Lyon": [],
+    "Berlin": [],
+    "Munich": ["munchen"],
+    "Frankfurt": [],
+    "Hamburg": [],
+    "Cologne": ["koln"],
+    "Amsterdam": [],
+    "Rotterdam": [],
+    "Brussels": [],
+    "Zurich": [],
+    "Geneva": [],
+    "Vienna": ["wien"],
+    "Prague": [],
+    "Budapest": [],
+    "Warsaw": [],
+    "Krakow": [],
+    "Copenhagen": [],
+    "Stockholm": [],
+    "Oslo": [],
+    "Helsinki": [],
+    "Reykjavik": [],
+    "Madrid": [],
+    "Barcelona": [],
+    "Lisbon": [],
+    "Porto": [],
+    "Rome": ["roma"],
+    "Milan": ["milano"],
+    "Venice": [],
+    "Florence": [],
+    "Naples": [],
+    "Athens": [],
+    "Moscow": [],
+    "Saint Petersburg": ["st petersburg", "petersburg"],
+    "Kyiv": ["kiev"],
+    "Bucharest": [],
+    "Sofia": [],
+    "Belgrade": [],
+    # Africa
+    "Cairo": [],
+    "Alexandria": [],
+    "Lagos": [],
+    "Abuja": [],
+    "Nairobi": [],
+    "Addis Ababa": [],
+    "Johannesburg": ["joburg"],
+    "Cape Town": [],
+    "Durban": [],
+    "Casablanca": [],
+    "Marrakesh": ["marrakech"],
+    "Accra": [],
+    "Dakar": [],
+    "Kinshasa": [],
+    "Dar es Salaam": [],
+    "Kampala": [],
+    "Tunis": [],
+    "Algiers": [],
+    # Americas
+    "New York": ["nyc", "new york city", "manhattan"],
+    "Los Angeles": [],
+    "San Francisco": ["sf", "san fran"],
+    "Chicago": [],
+    "Houston": [],
+    "Dallas": [],
+    "Austin": [],
+    "Seattle": [],
+    "Boston": [],
+    "Miami": [],
+    "Atlanta": [],
+    "Denver": [],
+    "Las Vegas": ["vegas"],
+    "Phoenix": [],
+    "Philadelphia": ["philly"],
+    "Washington": ["washington dc"],
+    "San Diego": [],
+    "San Jose": [],
+    "Detroit": [],
+    "Toronto": [],
+    "Vancouver": [],
+    "Montreal": [],
+    "Ottawa": [],
+    "Calgary": [],
+    "Mexico City": [],
+    "Cancun": [],
+    "Havana": [],
+    "Bogota": [],
+    "Lima": [],
+    "Santiago": [],
+    "Buenos Aires": [],
+    "Sao Paulo": [],
+    "Rio de Janeiro": ["rio"],
+    "Brasilia": [],
+    "Caracas": [],
+    "Quito": [],
+    # Oceania
+    "Sydney": [],
+    "Melbourne": [],
+    "Brisbane": [],
+    "Perth": [],
+    "Adelaide": [],
+    "Canberra": [],
+    "Auckland": [],
+    "Wellington": [],
+}
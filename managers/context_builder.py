@@ -0,0 +1,134 @@
+import logging
+from config import Config
+from BRAIN.tokens import get_context_limit, get_tokenizer
+
+# Chat formats add a few tokens of framing per message (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class ContextWindow:
+    def __init__(self, messages, used_tokens, budget, dropped_messages, dropped_tokens, recalled_messages=0):
+        self.messages = messages
+        self.used_tokens = used_tokens
+        self.budget = budget
+        self.dropped_messages = dropped_messages
+        self.dropped_tokens = dropped_tokens
+        self.recalled_messages = recalled_messages
+
+
+class ContextBuilder:
+    """
+    Assembles the most recent turns that fit in the model's context window,
+    leaving `reserve_tokens` free for the completion. History is walked newest
+    first, so older segments of the journal are never read once the budget is
+    spent.
+
+    When the memory has a recall index, the recent window is capped at
+    `recent_messages` and the remaining budget goes to the past exchanges most
+    similar to the current message.
+    """
+
+    def __init__(self, tokenizer=None, max_tokens=Config.CONTEXT_MAX_TOKENS, reserve_tokens=Config.CONTEXT_RESERVE_TOKENS,
+                 recent_messages=Config.CONTEXT_RECENT_MESSAGES, recall_k=Config.RECALL_TOP_K, recall_min_score=Config.RECALL_MIN_SCORE):
+        self.logger = logging.getLogger("ContextBuilder")
+        self.tokenizer = tokenizer or get_tokenizer(Config.CONTEXT_TOKENIZER)
+        self.max_tokens = max_tokens
+        self.reserve_tokens = reserve_tokens
+        self.recent_messages = recent_messages
+        self.recall_k = recall_k
+        self.recall_min_score = recall_min_score
+        # Running total over the whole history, so dropped tokens are known without rescanning it
+        self._counted_messages = 0
+        self._history_tokens = 0
+
+    def count_message(self, message):
+        content = message["content"]
+        if isinstance(content, list):
+            content = " ".join(p.get("text", "") for p in content if p.get("type") == "text")
+        return self.tokenizer.count(str(content)) + MESSAGE_OVERHEAD_TOKENS
+
+    def budget_for(self, model_name, system_prompt=""):
+        limit = get_context_limit(model_name)
+        if self.max_tokens:
+            limit = min(limit, self.max_tokens)
+        return limit - self.reserve_tokens - self.tokenizer.count(system_prompt)
+
+    def _update_history_tokens(self, memory_manager):
+        total = len(memory_manager)
+        if total < self._counted_messages:
+            # History was cleared
+            self._counted_messages = 0
+            self._history_tokens = 0
+        new = total - self._counted_messages
+        if new:
+            for message in memory_manager.get_recent(new):
+                self._history_tokens += self.count_message(message)
+            self._counted_messages = total
+
+    def build(self, memory_manager, system_prompt, model_name, query=None):
+        """
+        `query` is the text recall should match against; it defaults to the
+        latest stored message, but can be the incoming user text when the
+        window is built before that message is saved.
+        """
+        budget = self.budget_for(model_name, system_prompt)
+        self._update_history_tokens(memory_manager)
+
+        recalling = bool(getattr(memory_manager, "recall_index", None)) and self.recall_k > 0
+        recent_limit = self.recent_messages if recalling else None
+
+        selected = []
+        used = 0
+        for message in memory_manager.iter_reversed():
+            if recent_limit and len(selected) >= recent_limit:
+                break
+            tokens = self.count_message(message)
+            # The latest message is always sent, even if it alone exceeds the budget
+            if selected and used + tokens > budget:
+                break
+            selected.append(message)
+            used += tokens
+        selected.reverse()
+
+        recalled = []
+        total = len(memory_manager)
+        if recalling and selected and total > len(selected):
+            if query is None:
+                query = selected[-1]["content"]
+            exchanges = memory_manager.recall(str(query), k=self.recall_k, exclude_from=total - len(selected), min_score=self.recall_min_score)
+            for message in exchanges:
+                tokens = self.count_message(message)
+                if used + tokens > budget:
+                    break
+                recalled.append(message)
+                used += tokens
+
+        window = ContextWindow(
+            messages=recalled + selected,
+            used_tokens=used,
+            budget=budget,
+            dropped_messages=total - len(selected) - len(recalled),
+            dropped_tokens=max(0, self._history_tokens - used),
+            recalled_messages=len(recalled)
+        )
+        if window.dropped_messages:
+            self.logger.info(
+                f"Context: sent {len(selected)} recent + {len(recalled)} recalled messages ({used} tokens, budget {budget}); "
+                f"dropped {window.dropped_messages} messages ({window.dropped_tokens} tokens)."
+            )
+        return window
+
+    def extend(self, window, message):
+        """Appends a message built after the window, trimming the oldest entries to stay in budget."""
+        tokens = self.count_message(message)
+        window.messages.append(message)
+        window.used_tokens += tokens
+        while window.used_tokens > window.budget and len(window.messages) > 1:
+            dropped = window.messages.pop(0)
+            if window.recalled_messages:
+                window.recalled_messages -= 1
+            dropped_tokens = self.count_message(dropped)
+            window.used_tokens -= dropped_tokens
+            window.dropped_messages += 1
+            window.dropped_tokens += dropped_tokens
+        return window
@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from config import Config
+from managers.intent_engine import tokenize
+
+
+def bigrams(tokens):
+    return set(zip(tokens, tokens[1:]))
+
+
+class EchoFilter:
+    """
+    Recognizes transcripts that are the microphone hearing Ava herself.
+
+    Every sentence Ava speaks is kept for `window` seconds as a token set and
+    a token-bigram set. An incoming transcript is scored by how much of it is
+    contained in what was said recently: the mean of its token containment
+    (tolerates mis-recognized words) and bigram containment (requires the
+    words in the same order). Containment rather than overlap means a
+    fragment of a long reply still scores high. Transcripts shorter than
+    `min_tokens` are only suppressed when they repeat a whole sentence,
+    so short commands ("stop", "yes") get through.
+
+    Only speech heard while Ava is playing, or within `tail` seconds after,
+    can be an echo; the TTS side reports playback through
+    playback_started() / playback_stopped(). A full transcript must also
+    be mostly covered by her word pairs: a follow-up that reuses her words
+    ("what is the weather in Kolkata") carries new content and is kept.
+    """
+
+    def __init__(self, window=Config.ECHO_WINDOW_SECONDS, threshold=Config.ECHO_THRESHOLD,
+                 min_tokens=Config.ECHO_MIN_TOKENS, max_sentences=Config.ECHO_MAX_SENTENCES,
+                 tail=Config.ECHO_TAIL_SECONDS):
+        self.logger = logging.getLogger("EchoFilter")
+        self.window = window
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+        self.tail = tail
+        self.spoken = deque(maxlen=max_sentences)
+        self.checked = 0
+        self.suppressed = 0
+        self.recent_suppressed = deque(maxlen=20)
+        self._lock = threading.Lock()
+        # Playback state, in perf_counter() time like the STT timings
+        self._playing = 0
+        self._stopped_at = None
+
+    def playback_started(self):
+        with self._lock:
+            self._playing += 1
+
+    def playback_stopped(self):
+        with self._lock:
+            self._playing = max(0, self._playing - 1)
+            self._stopped_at = time.perf_counter()
+
+    def in_playback(self, at=None):
+        """True when speech heard at `at` (perf_counter(), default now) overlapped Ava's playback or its tail."""
+        at = at if at is not None else time.perf_counter()
+        with self._lock:
+            if self._playing:
+                return True
+            return self._stopped_at is not None and at <= self._stopped_at + self.tail
+
+    def remember(self, sentence):
+        tokens = tokenize(sentence)
+        if tokens:
+            with self._lock:
+                self.spoken.append((time.monotonic(), tuple(tokens), set(tokens), bigrams(tokens)))
+
+    def _recent(self):
+        cutoff = time.monotonic() - self.window
+        with self._lock:
+            return [entry for entry in self.spoken if entry[0] >= cutoff]
+
+    def score(self, text, fragment=False):
+        """
+        Fraction of `text` (0..1) that matches what Ava said within the
+        window. A `fragment` (partial transcript) is scored by containment
+        however short it is: the first word of Ava's own sentence must not
+        look like the user talking.
+        """
+        tokens = tokenize(text)
+        if not tokens:
+            return 0.0
+        recent = self._recent()
+        if not recent:
+            return 0.0
+
+        if len(tokens) < self.min_tokens and not fragment:
+            return 1.0 if any(tuple(tokens) == sentence for _, sentence, _, _ in recent) else 0.0
+
+        heard_words = set().union(*(words for _, _, words, _ in recent))
+        heard_pairs = set().union(*(pairs for _, _, _, pairs in recent))
+        words = set(tokens)
+        pairs = bigrams(tokens)
+        word_score = len(words & heard_words) / len(words)
+        if not pairs:
+            return word_score
+        pair_score = len(pairs & heard_pairs) / len(pairs)
+        return (word_score + pair_score) / 2
+
+    def coverage(self, text):
+        """
+        Fraction of the transcript's words that sit in a word pair Ava said
+        recently; the rest is new content. One misheard word in an echo only
+        uncovers itself, while new words around her phrase stay uncovered.
+        """
+        tokens = tokenize(text)
+        if len(tokens) < 2:
+            return 1.0
+        heard_pairs = set().union(*(pairs for _, _, _, pairs in self._recent()))
+        covered = set()
+        for index, pair in enumerate(zip(tokens, tokens[1:])):
+            if pair in heard_pairs:
+                covered.update((index, index + 1))
+        return len(covered) / len(tokens)
+
+    def is_echo(self, text, heard_at=None):
+        """`heard_at` is when the transcript's speech ended (perf_counter()), if the STT backend knows."""
+        if not self.in_playback(heard_at):
+            with self._lock:
+                self.checked += 1
+            return False
+        score = self.score(text)
+        if score >= self.threshold:
+            score = min(score, self.coverage(text))
+        with self._lock:
+            self.checked += 1
+            echo = score >= self.threshold
+            if echo:
+                self.suppressed += 1
+                self.recent_suppressed.append((text, round(score, 2)))
+        if echo:
+            self.logger.info(f"Suppressed echo (score {score:.2f}): {text}")
+        return echo
+
+    def new_words(self, text):
+        """Words of `text` that Ava has not said within the window."""
+        heard_words = set().union(*(words for _, _, words, _ in self._recent()))
+        return [token for token in tokenize(text) if token not in heard_words]
+
+    def is_own_fragment(self, partial):
+        """True when a partial transcript is most likely Ava's voice rather than the user's."""
+        return self.in_playback() and self.score(partial, fragment=True) >= self.threshold
+
+    def stats(self):
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "suppressed": self.suppressed,
+                "suppression_rate": self.suppressed / self.checked if self.checked else 0.0,
+                "recent": list(self.recent_suppressed)
+            }
@@ -0,0 +1,105 @@
+import re
+from collections import namedtuple
+
+TOKEN = re.compile(r"[a-z0-9']+")
+
+IntentMatch = namedtuple("IntentMatch", ["intent", "score", "phrases"])
+
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+
+class IntentEngine:
+    """
+    Routes an utterance to a tool with a precompiled token trie.
+
+    Every tool declares a keyword table of phrase -> weight. The phrases are
+    compiled into one trie keyed on whole tokens, so "os" never matches
+    inside "most" and multi-word phrases cost nothing extra. An utterance is
+    scanned once; at each token the trie is walked as far as it goes and
+    every phrase ending on the way is collected. A phrase covered by a longer
+    phrase of the same intent ("screen" inside "my screen") is dropped, and
+    the weights of the remaining distinct phrases are summed per intent.
+    Negative weights veto ("outer space" is not about disk space).
+
+    The best intent wins if its score reaches the threshold; ties go to the
+    intent registered first.
+    """
+
+    def __init__(self, threshold=0.5):
+        self.threshold = threshold
+        self.order = []
+        self.tables = {}
+        self.trie = {}
+        self._compiled = False
+
+    def add(self, intent, keywords):
+        if intent not in self.tables:
+            self.order.append(intent)
+            self.tables[intent] = {}
+        self.tables[intent].update(keywords)
+        self._compiled = False
+
+    def compile(self):
+        trie = {}
+        for intent in self.order:
+            for phrase, weight in self.tables[intent].items():
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+                node = trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node.setdefault(None, []).append((intent, phrase, weight, len(tokens)))
+        self.trie = trie
+        self._compiled = True
+
+    def scan(self, text):
+        """Returns every (start, end, intent, phrase, weight) keyword hit in `text`."""
+        if not self._compiled:
+            self.compile()
+
+        tokens = tokenize(text)
+        count = len(tokens)
+        trie = self.trie
+        hits = []
+        for start, token in enumerate(tokens):
+            node = trie.get(token)
+            end = start
+            while node is not None:
+                end += 1
+                for intent, phrase, weight, _ in node.get(None, ()):
+                    hits.append((start, end, intent, phrase, weight))
+                node = node.get(tokens[end]) if end < count else None
+        return hits
+
+    def score(self, text):
+        """Returns {intent: IntentMatch} for every intent with at least one hit."""
+        hits = self.scan(text)
+        if not hits:
+            return {}
+        kept = {}
+        for hit in hits:
+            start, end, intent, phrase, _ = hit
+            covered = any(
+                other[2] == intent and other[0] <= start and end <= other[1] and (other[1] - other[0]) > (end - start)
+                for other in hits
+            )
+            if not covered:
+                kept.setdefault(intent, {})[phrase] = hit[4]
+
+        return {
+            intent: IntentMatch(intent, sum(phrases.values()), tuple(phrases))
+            for intent, phrases in kept.items()
+        }
+
+    def route(self, text):
+        """Returns the best IntentMatch above the threshold, or None."""
+        scores = self.score(text)
+        best = None
+        for intent in self.order:
+            match = scores.get(intent)
+            if match and match.score >= self.threshold and (best is None or match.score > best.score):
+                best = match
+        return best
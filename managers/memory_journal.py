@@ -0,0 +1,316 @@
+import json
+import logging
+import os
+import shutil
+
+
+def quarantine(path):
+    """Renames a broken file or directory to <path>.corrupt (numbered if taken) and returns the new path."""
+    target = path + ".corrupt"
+    suffix = 1
+    while os.path.exists(target):
+        suffix += 1
+        target = f"{path}.corrupt{suffix}"
+    os.replace(path, target)
+    return target
+
+
+class MemoryJournal:
+    """
+    Append-only, segmented JSONL store for conversation history.
+
+    Records are appended to the active segment with a single write, so a turn
+    costs O(1) disk I/O regardless of history length. Once a segment holds
+    `segment_size` records it is sealed and listed in `manifest.json`, which is
+    only ever replaced atomically. A torn final line left by a crash is
+    truncated on open instead of corrupting the whole history.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory="memory/journal", segment_size=1000, compact_every=10, fsync=False, legacy_file=None):
+        self.logger = logging.getLogger("MemoryJournal")
+        self.directory = directory
+        self.segment_size = segment_size
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.sealed = []
+        self.active_name = None
+        self.active_count = 0
+        self._handle = None
+        self._rolls_since_compact = 0
+        self._segment_cache = (None, None)
+
+        if not os.path.exists(os.path.join(self.directory, self.MANIFEST)):
+            if legacy_file and os.path.exists(legacy_file):
+                try:
+                    self.import_json(legacy_file)
+                except (ValueError, TypeError, KeyError) as e:
+                    # An unreadable memory.json must not keep the journal from opening; start empty
+                    corrupt = quarantine(legacy_file)
+                    self.logger.error(f"Could not import {legacy_file} ({e}); moved it to {corrupt}.")
+                    self._initialize(self.directory)
+            else:
+                self._initialize(self.directory)
+
+        self._open()
+
+    # --- Layout ---
+
+    def _initialize(self, directory, sealed=None, active_name="seg-000001.jsonl"):
+        os.makedirs(directory, exist_ok=True)
+        open(os.path.join(directory, active_name), "a").close()
+        self._write_manifest(directory, sealed or [], active_name)
+
+    def _write_manifest(self, directory, sealed, active_name):
+        path = os.path.join(directory, self.MANIFEST)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": 1, "sealed": sealed, "active": active_name}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _open(self):
+        with open(os.path.join(self.directory, self.MANIFEST)) as f:
+            manifest = json.load(f)
+        self.sealed = manifest["sealed"]
+        self.active_name = manifest["active"]
+
+        active_path = os.path.join(self.directory, self.active_name)
+        if not os.path.exists(active_path):
+            open(active_path, "a").close()
+        self.active_count = self._recover(active_path)
+        self._handle = open(active_path, "a", encoding="utf-8")
+        self._remove_orphans()
+
+    def _remove_orphans(self):
+        """Deletes segments left behind by a compaction interrupted around the manifest swap."""
+        live = {s["name"] for s in self.sealed} | {self.active_name, self.MANIFEST}
+        for name in os.listdir(self.directory):
+            if name not in live and name.startswith("seg-"):
+                try:
+                    os.remove(self._segment_path(name))
+                except OSError:
+                    pass
+
+    def _recover(self, path):
+        """Counts valid records in the active segment, truncating a torn tail."""
+        count = 0
+        valid_end = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                count += 1
+                valid_end += len(line)
+            size = f.seek(0, os.SEEK_END)
+
+        if size != valid_end:
+            self.logger.warning(f"Truncating torn record at end of {path} ({size - valid_end} bytes)")
+            with open(path, "r+b") as f:
+                f.truncate(valid_end)
+        return count
+
+    def _segment_path(self, name):
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def _span(name):
+        numbers = name[len("seg-"):-len(".jsonl")].split("-")
+        return int(numbers[0]), int(numbers[-1])
+
+    def _next_name(self, name):
+        return f"seg-{self._span(name)[1] + 1:06d}.jsonl"
+
+    # --- Writes ---
+
+    def append(self, record):
+        self._handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._handle.flush()
+        if self.fsync:
+            os.fsync(self._handle.fileno())
+        self.active_count += 1
+
+        if self.active_count >= self.segment_size:
+            self._roll()
+
+    def _roll(self):
+        self._handle.close()
+        self.sealed.append({"name": self.active_name, "count": self.active_count})
+        self.active_name = self._next_name(self.active_name)
+        open(self._segment_path(self.active_name), "a").close()
+        self._write_manifest(self.directory, self.sealed, self.active_name)
+        self.active_count = 0
+        self._handle = open(self._segment_path(self.active_name), "a", encoding="utf-8")
+
+        self._rolls_since_compact += 1
+        if self.compact_every and self._rolls_since_compact >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Merges runs of sealed segments into segments of up to 10x `segment_size` records."""
+        self._rolls_since_compact = 0
+        target = self.segment_size * 10
+        merged, run, run_count = [], [], 0
+
+        def flush_run():
+            if len(run) == 1:
+                merged.append(run[0])
+            elif run:
+                # Merged output gets a fresh name, so the manifest swap below is the commit point
+                name = f"seg-{self._span(run[0]['name'])[0]:06d}-{self._span(run[-1]['name'])[1]:06d}.jsonl"
+                tmp_path = self._segment_path(name + ".tmp")
+                with open(tmp_path, "wb") as out:
+                    for segment in run:
+                        with open(self._segment_path(segment["name"]), "rb") as f:
+                            shutil.copyfileobj(f, out)
+                    out.flush()
+                    os.fsync(out.fileno())
+                os.replace(tmp_path, self._segment_path(name))
+                merged.append({"name": name, "count": run_count})
+
+        for segment in self.sealed:
+            if run_count + segment["count"] > target:
+                flush_run()
+                run, run_count = [], 0
+            run.append(segment)
+            run_count += segment["count"]
+        flush_run()
+
+        if len(merged) == len(self.sealed):
+            return
+
+        obsolete = {s["name"] for s in self.sealed} - {s["name"] for s in merged}
+        self.sealed = merged
+        self._write_manifest(self.directory, self.sealed, self.active_name)
+        for name in obsolete:
+            try:
+                os.remove(self._segment_path(name))
+            except OSError:
+                pass
+        self._segment_cache = (None, None)
+        self.logger.info(f"Compacted journal into {len(merged)} sealed segments.")
+
+    def clear(self):
+        self._handle.close()
+        obsolete = [s["name"] for s in self.sealed] + [self.active_name]
+        # The new manifest goes in first so it never points at deleted segments
+        self.active_name = self._next_name(self.active_name)
+        self.sealed = []
+        self._initialize(self.directory, active_name=self.active_name)
+        for name in obsolete:
+            try:
+                os.remove(self._segment_path(name))
+            except OSError:
+                pass
+        self._segment_cache = (None, None)
+        self.active_count = 0
+        self._handle = open(self._segment_path(self.active_name), "a", encoding="utf-8")
+
+    def import_json(self, legacy_file):
+        """Atomically builds a journal from a legacy memory.json list of messages."""
+        with open(legacy_file, "r") as f:
+            messages = json.load(f)
+        if not isinstance(messages, list):
+            raise ValueError("expected a list of messages")
+
+        staging = self.directory + ".importing"
+        if os.path.exists(staging):
+            shutil.rmtree(staging)
+        os.makedirs(staging)
+
+        sealed = []
+        name = "seg-000001.jsonl"
+        for start in range(0, len(messages), self.segment_size):
+            chunk = messages[start:start + self.segment_size]
+            with open(os.path.join(staging, name), "w", encoding="utf-8") as f:
+                for record in chunk:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if len(chunk) == self.segment_size:
+                sealed.append({"name": name, "count": len(chunk)})
+                name = self._next_name(name)
+
+        self._initialize(staging, sealed=sealed, active_name=name)
+
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
+        os.replace(staging, self.directory)
+        self.logger.info(f"Imported {len(messages)} messages from {legacy_file}.")
+
+    def close(self):
+        if self._handle and not self._handle.closed:
+            self._handle.close()
+
+    # --- Reads ---
+
+    def __len__(self):
+        return sum(s["count"] for s in self.sealed) + self.active_count
+
+    def _segments(self):
+        return self.sealed + [{"name": self.active_name, "count": self.active_count}]
+
+    def _read_segment(self, name):
+        cached_name, records = self._segment_cache
+        if cached_name == name and name != self.active_name:
+            return records
+        records = []
+        with open(self._segment_path(name), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    records.append(json.loads(line))
+        if name != self.active_name:
+            self._segment_cache = (name, records)
+        return records
+
+    def iter_records(self):
+        """Streams every record, oldest first, one segment at a time."""
+        for segment in self._segments():
+            with open(self._segment_path(segment["name"]), "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def iter_from(self, start):
+        """Streams records from absolute position `start`, skipping whole segments before it."""
+        offset = 0
+        for segment in self._segments():
+            if offset + segment["count"] <= start:
+                offset += segment["count"]
+                continue
+            with open(self._segment_path(segment["name"]), "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    if offset >= start:
+                        yield json.loads(line)
+                    offset += 1
+
+    def iter_reversed(self):
+        """Streams records newest first without loading older segments until needed."""
+        for segment in reversed(self._segments()):
+            yield from reversed(self._read_segment(segment["name"]))
+
+    def tail(self, n):
+        records = []
+        for record in self.iter_reversed():
+            if len(records) >= n:
+                break
+            records.append(record)
+        records.reverse()
+        return records
+
+    def get(self, index):
+        """Returns the record at absolute position `index`."""
+        if index < 0:
+            index += len(self)
+        offset = 0
+        for segment in self._segments():
+            if index < offset + segment["count"]:
+                return self._read_segment(segment["name"])[index - offset]
+            offset += segment["count"]
+        raise IndexError(index)
@@ -1,43 +1,148 @@
 
-import json
-import os
 import logging
+import os
+import threading
+from collections import deque
+from config import Config
+from managers.memory_journal import MemoryJournal, quarantine
 
 class MemoryManager:
-    def __init__(self, memory_file="memory/memory.json"):
+    def __init__(self, memory_file="memory/memory.json", journal_dir=Config.MEMORY_JOURNAL_DIR):
         self.logger = logging.getLogger("MemoryManager")
         self.memory_file = memory_file
-        self.memory = []
+        self.journal_dir = journal_dir
+        self.journal = None
+        self.recent = deque(maxlen=Config.MEMORY_RECENT_WINDOW)
+        self.memory = None
+        self.recall_index = None
+        self._recall_lock = threading.Lock()
+        self._recall_thread = None
         self.load_memory()
+        self._init_recall()
 
     def load_memory(self):
-        if os.path.exists(self.memory_file):
-            try:
-                with open(self.memory_file, 'r') as f:
-                    self.memory = json.load(f)
-                self.logger.info("Memory loaded.")
-
-            except Exception as e:
-                self.logger.error(f"Failed to load memory: {e}")
-                self.memory = []
-        else:
+        """
+        Opens the journal and loads only the most recent messages. The full
+        history is streamed from disk the first time get_messages() needs it.
+        """
+        try:
+            if self.journal:
+                self.journal.close()
+            self.journal = self._open_journal()
+            self.recent.clear()
+            self.recent.extend(self.journal.tail(self.recent.maxlen))
+            self.memory = None
+            if len(self.journal):
+                self.logger.info(f"Memory loaded ({len(self.journal)} messages).")
+            else:
+                self.logger.info("No existing memory found. Starting fresh.")
+
+        except Exception as e:
+            # Same as a missing history: set the unreadable journal aside and start fresh
+            self.logger.error(f"Failed to load memory: {e}")
+            if os.path.exists(self.journal_dir):
+                self.logger.error(f"Moved the unreadable journal to {quarantine(self.journal_dir)}.")
+            self.journal = self._open_journal()
+            self.recent.clear()
             self.memory = []
-            self.logger.info("No existing memory found. Starting fresh.")
 
-    def save_memory(self):
+    def _open_journal(self):
+        return MemoryJournal(
+            self.journal_dir,
+            segment_size=Config.MEMORY_SEGMENT_SIZE,
+            fsync=Config.MEMORY_FSYNC,
+            legacy_file=self.memory_file
+        )
+
+    def _init_recall(self):
+        if not Config.MEMORY_RECALL_ENABLED or self.journal is None:
+            return
         try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(self.memory, f, indent=4)
+            from managers.recall_index import RecallIndex
+            self.recall_index = RecallIndex(Config.MEMORY_RECALL_DIR, dim=Config.MEMORY_RECALL_DIM)
         except Exception as e:
-            self.logger.error(f"Failed to save memory: {e}")
+            self.logger.warning(f"Recall index disabled: {e}")
+            return
+
+        if self.recall_index.count > len(self.journal):
+            # Journal was cleared or replaced underneath the index
+            self.recall_index.reset()
+        if self.recall_index.count < len(self.journal):
+            self._schedule_recall_catch_up()
+
+    def _schedule_recall_catch_up(self):
+        """Starts the background catch-up unless one is already running; returns True if it started one."""
+        with self._recall_lock:
+            if self._recall_thread and self._recall_thread.is_alive():
+                return False
+            self._recall_thread = threading.Thread(target=self._catch_up_recall, name="RecallCatchUp", daemon=True)
+            self._recall_thread.start()
+            return True
+
+    def _catch_up_recall(self):
+        try:
+            while self.recall_index.count < len(self.journal):
+                start = self.recall_index.count
+                self.recall_index.catch_up(self.journal.iter_from(start), start)
+        except Exception as e:
+            self.logger.error(f"Recall indexing failed at position {self.recall_index.count}: {e}")
+
+    def recall(self, query, k, exclude_from, min_score=0.0):
+        """
+        Returns the past exchanges (user message + reply) most relevant to
+        `query`, oldest first, drawn only from positions before `exclude_from`.
+        """
+        if not self.recall_index:
+            return []
+
+        positions = set()
+        for position, _ in self.recall_index.query(query, k=k, exclude_from=exclude_from, min_score=min_score):
+            role = self.journal.get(position)["role"]
+            pair = (position, position + 1) if role == "user" else (position - 1, position)
+            positions.update(p for p in pair if 0 <= p < exclude_from)
+        return [self.journal.get(p) for p in sorted(positions)]
+
+    def save_memory(self):
+        # Appends are written through immediately; nothing to rewrite.
+        pass
 
     def add_message(self, role, content):
-        self.memory.append({"role": role, "content": content})
-        self.save_memory()
+        message = {"role": role, "content": content}
+        try:
+            position = len(self.journal)
+            self.journal.append(message)
+            if self.recall_index and not self.recall_index.add(position, str(content)):
+                # Earlier rows are missing (catch-up still running or it failed); fill them in the background
+                if self._schedule_recall_catch_up():
+                    self.logger.warning(f"Recall index is behind at {self.recall_index.count}/{position}; catching up.")
+        except Exception as e:
+            self.logger.error(f"Failed to save memory: {e}")
+        self.recent.append(message)
+        if self.memory is not None:
+            self.memory.append(message)
 
     def get_messages(self):
+        if self.memory is None:
+            self.memory = list(self.journal.iter_records())
         return self.memory
 
+    def get_recent(self, n):
+        if n <= len(self.recent):
+            return list(self.recent)[len(self.recent) - n:]
+        return self.journal.tail(n)
+
+    def iter_reversed(self):
+        """Yields messages newest first, reading older segments only as needed."""
+        if self.memory is not None:
+            return reversed(self.memory)
+        return self.journal.iter_reversed()
+
+    def __len__(self):
+        return len(self.journal) if self.journal else len(self.memory or [])
+
     def clear_memory(self):
+        self.journal.clear()
+        if self.recall_index:
+            self.recall_index.reset()
+        self.recent.clear()
         self.memory = []
-        self.save_memory()
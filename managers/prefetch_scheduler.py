@@ -0,0 +1,146 @@
+import json
+import logging
+import os
+import threading
+import time
+from config import Config
+
+
+class PrefetchScheduler:
+    """
+    Keeps the tool cache warm for the queries the user actually makes.
+
+    Every tool call is recorded; the most frequent parameter sets per tool
+    (plus the default city's weather and the top headlines, which are always
+    asked for) become jobs refreshed every Config.PREFETCH_INTERVALS seconds
+    on a daemon thread, just before their cache entry would go stale. A job
+    is skipped while the entry is still fresh (an interactive ask may have
+    just refreshed it) and once the tool's API calls over the last hour,
+    interactive ones included, reach Config.PREFETCH_MAX_CALLS_PER_HOUR.
+    Usage counts persist across restarts, and so do the cache's call times
+    the budget is counted from.
+    """
+
+    def __init__(self, tools, cache, path=Config.PREFETCH_STATS_FILE, intervals=None,
+                 max_calls_per_hour=None, top_n=Config.PREFETCH_TOP_N, tick=30):
+        self.logger = logging.getLogger("PrefetchScheduler")
+        self.tools = tools
+        self.cache = cache
+        self.path = path
+        self.intervals = intervals or Config.PREFETCH_INTERVALS
+        self.max_calls_per_hour = max_calls_per_hour or Config.PREFETCH_MAX_CALLS_PER_HOUR
+        self.top_n = top_n
+        self.tick = tick
+        self.seeds = [("weather", {"city": Config.DEFAULT_CITY}), ("news", {"query": None, "category": None})]
+        self.usage = self._load()
+        self.last_attempt = {}
+        self.stats_counts = {"refreshed": 0, "skipped_budget": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            snapshot = json.dumps(self.usage)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(snapshot)
+        os.replace(tmp_path, self.path)
+
+    def record(self, tool, params):
+        """Called for every interactive tool invocation."""
+        if tool not in self.intervals:
+            return
+        key = self.cache.key(tool, **params)
+        with self._lock:
+            entry = self.usage.setdefault(key, {"tool": tool, "params": params, "count": 0})
+            entry["count"] += 1
+            entry["last_used"] = time.time()
+        self._save()
+
+    def jobs(self):
+        """Returns the (tool, params) pairs currently worth keeping warm."""
+        stale_cutoff = time.time() - 7 * 86400
+        with self._lock:
+            frequent = sorted(
+                (e for e in self.usage.values() if e["count"] >= 2 and e.get("last_used", 0) >= stale_cutoff),
+                key=lambda e: e["count"], reverse=True
+            )
+        selected = list(self.seeds)
+        seen = {self.cache.key(tool, **params) for tool, params in selected}
+        per_tool = {}
+        for entry in frequent:
+            key = self.cache.key(entry["tool"], **entry["params"])
+            if key in seen or per_tool.get(entry["tool"], 0) >= self.top_n:
+                continue
+            seen.add(key)
+            per_tool[entry["tool"]] = per_tool.get(entry["tool"], 0) + 1
+            selected.append((entry["tool"], entry["params"]))
+        return [
+            (tool, params) for tool, params in selected
+            if tool in self.tools and tool in self.intervals and self._has_api_key(tool)
+        ]
+
+    def _has_api_key(self, tool):
+        # Read from the registry's class metadata: building a tool here would load it on the prefetch thread
+        if tool in self.tools.loaded():
+            return bool(getattr(self.tools[tool], "api_key", None))
+        setting = self.tools.attribute(tool, "api_key_setting")
+        return bool(setting and getattr(Config, setting, None))
+
+    def run_due(self):
+        """Refreshes every job whose cached entry is about to expire. Returns the number of API calls made."""
+        calls = 0
+        now = time.time()
+        for tool, params in self.jobs():
+            interval = self.intervals[tool]
+            key = self.cache.key(tool, **params)
+            age = self.cache.age(tool, params)
+            if age is not None and age < interval - self.tick:
+                # Still fresh; an interactive ask or an earlier pass refreshed it
+                continue
+            if now - self.last_attempt.get(key, 0) < interval / 2:
+                # Failed or was over budget recently; don't retry every tick
+                continue
+            self.last_attempt[key] = now
+
+            if self.cache.calls_in_window(tool, 3600) >= self.max_calls_per_hour.get(tool, 0):
+                self.stats_counts["skipped_budget"] += 1
+                self.logger.debug(f"Hourly API budget for {tool} reached; not prefetching {key}.")
+                continue
+
+            try:
+                self.tools[tool].refresh(**params)
+                self.stats_counts["refreshed"] += 1
+                calls += 1
+            except Exception as e:
+                self.stats_counts["failed"] += 1
+                self.logger.debug(f"Prefetch of {key} failed: {e}")
+        return calls
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_due()
+            except Exception as e:
+                self.logger.error(f"Prefetch pass failed: {e}")
+            self._stop.wait(self.tick)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="PrefetchScheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        return dict(self.stats_counts, jobs=len(self.jobs()))
@@ -0,0 +1,194 @@
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Instructions appended to user turns by JarvisApp; they would dominate every vector
+SYSTEM_SUFFIX = re.compile(r"\((?:System|SYSTEM INSTRUCTION):.*?\)\s*$", re.DOTALL)
+WORD = re.compile(r"\w+")
+
+STOPWORDS = frozenset("""
+a an the is are was were be been am i me my you your we our it its this that these those
+what which who whom how why when where do does did can could would should will shall
+to of in on at for with about from by and or but not no yes so if then than please
+tell give show hey ok okay ava
+hai kya ka ki ke ko se me mein par aur bhi tha thi hoon ho na
+""".split())
+
+
+class HashedNgramEmbedder:
+    """
+    Offline text embedding via the hashing trick: word unigrams, word bigrams
+    and character trigrams are hashed (crc32, stable across runs) into a
+    fixed-size signed vector, then L2-normalized so a dot product is cosine
+    similarity.
+    """
+
+    def __init__(self, dim=128):
+        self.dim = dim
+
+    def features(self, text):
+        words = [w for w in WORD.findall(SYSTEM_SUFFIX.sub("", text).lower()) if w not in STOPWORDS]
+        for word in words:
+            yield word, 1.0
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                yield padded[i:i + 3], 0.5
+        for first, second in zip(words, words[1:]):
+            yield f"{first} {second}", 1.0
+
+    def embed(self, text):
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self.features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            vector[h % self.dim] += weight if (h >> 31) & 1 else -weight
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+
+
+class RecallIndex:
+    """
+    Incrementally updated, memory-mapped matrix of message embeddings. Row i
+    holds the embedding of message i in the conversation journal. The backing
+    file grows by doubling, so appends are amortized O(1) and queries are a
+    single matrix-vector product over the mapped rows.
+    """
+
+    def __init__(self, directory="memory/recall", dim=128, initial_capacity=1024):
+        if np is None:
+            raise ImportError("numpy is required for the recall index")
+
+        self.logger = logging.getLogger("RecallIndex")
+        self.directory = directory
+        self.embedder = HashedNgramEmbedder(dim)
+        self.dim = dim
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.meta_path = os.path.join(directory, "meta.json")
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        meta = self._read_meta()
+        if meta.get("dim") != dim or not os.path.exists(self.vectors_path):
+            # Fresh index (or the embedding changed); rows are rebuilt by catch_up()
+            meta = {"dim": dim, "count": 0, "capacity": initial_capacity}
+            with open(self.vectors_path, "wb") as f:
+                f.truncate(initial_capacity * dim * 4)
+            self._write_meta(meta)
+
+        self.count = meta["count"]
+        self.capacity = meta["capacity"]
+        self.matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(self.capacity, dim))
+
+    def _read_meta(self):
+        try:
+            with open(self.meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, meta):
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def _grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        self.matrix.flush()
+        with open(self.vectors_path, "r+b") as f:
+            f.truncate(capacity * self.dim * 4)
+        # Queries may still hold the old mapping; it stays valid until they drop it
+        matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self.capacity = capacity
+        self.matrix = matrix
+
+    def add(self, position, text):
+        """
+        Embeds the message at journal `position`. Positions must arrive in
+        order; returns False (leaving the row for catch_up) when earlier
+        positions are still missing.
+        """
+        vector = self.embedder.embed(text)
+        with self._lock:
+            if position < self.count:
+                return True
+            if position > self.count:
+                return False
+            if position >= self.capacity:
+                self._grow(position + 1)
+            self.matrix[position] = vector
+            self.count += 1
+            self._write_meta({"dim": self.dim, "count": self.count, "capacity": self.capacity})
+        return True
+
+    def catch_up(self, messages, start, batch_size=256):
+        """
+        Indexes `messages` (an iterable starting at journal position `start`)
+        in batches of `batch_size`. Embedding happens outside the lock and the
+        lock is released between batches, so add() and query() never wait on
+        the whole backlog; rows committed before a failure stay indexed.
+        """
+        messages = iter(messages)
+        position = start
+        added = 0
+        while True:
+            vectors = [self.embedder.embed(_text(message)) for message in islice(messages, batch_size)]
+            if not vectors:
+                break
+            with self._lock:
+                if self.count != position:
+                    # reset() ran meanwhile; whoever catches up next starts from the new count
+                    break
+                end = position + len(vectors)
+                if end > self.capacity:
+                    self._grow(end)
+                self.matrix[position:end] = vectors
+                self.count = end
+                self.matrix.flush()
+                self._write_meta({"dim": self.dim, "count": self.count, "capacity": self.capacity})
+            position = end
+            added += len(vectors)
+        if added:
+            self.logger.info(f"Indexed {added} past messages for recall.")
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self._write_meta({"dim": self.dim, "count": 0, "capacity": self.capacity})
+
+    def query(self, text, k=3, exclude_from=None, min_score=0.0):
+        """
+        Returns up to `k` (position, score) pairs most similar to `text`,
+        ignoring positions >= `exclude_from` (the recent window already sent).
+        """
+        with self._lock:
+            matrix, count = self.matrix, self.count
+        limit = count if exclude_from is None else min(count, exclude_from)
+        if limit <= 0 or k <= 0:
+            return []
+
+        q = self.embedder.embed(text)
+        scores = matrix[:limit] @ q
+        k = min(k, limit)
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(int(i), float(scores[i])) for i in top if scores[i] >= min_score]
+
+
+def _text(message):
+    content = message["content"]
+    if isinstance(content, list):
+        return " ".join(p.get("text", "") for p in content if p.get("type") == "text")
+    return str(content)
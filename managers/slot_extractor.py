@@ -0,0 +1,119 @@
+import re
+import unicodedata
+from managers.city_gazetteer import CITIES
+
+WORD = re.compile(r"[a-z0-9]+")
+
+# Words that can follow "in/at/for" without naming a place
+NON_PLACES = frozenset("""
+the a an my our this that today tonight tomorrow now morning evening afternoon night
+weekend week general detail details celsius fahrenheit degrees outside here there city area
+""".split())
+
+# A place mentioned but not in the gazetteer, e.g. "weather in Springfield" or "Springfield ka mausam"
+PLACE_PREPOSITION = re.compile(r"\b(?:in|at|for|of|near)\s+([a-z][a-z\s]{1,40}?)(?=\s+(?:today|tomorrow|tonight|now|right now|please|like)\b|[?.!,]|$)")
+PLACE_HINGLISH = re.compile(r"\b([a-z][a-z\s]{1,30}?)\s+(?:ka|ki|ke|mein|me|main)\s+(?:weather|mausam|temperature|vedar|vader)\b")
+
+TOPIC_PATTERNS = [
+    re.compile(r"\b(?:news|headlines|updates?)\s+(?:about|on|regarding|related to|around|concerning|of|for|from)\s+(.+)"),
+    re.compile(r"\b(?:latest|anything)\s+(?:on|about)\s+(.+?)(?:\s+(?:news|headlines))?$"),
+    re.compile(r"\bwhat(?:'s| is)\s+happening\s+(?:in|with|around)\s+(.+)"),
+    re.compile(r"\b(.+?)\s+(?:ki|ke|se related|ke bare mein|ke baare mein)\s+(?:news|khabar|headlines)\b"),
+    re.compile(r"\b(.+?)\s+(?:news|headlines)\b"),
+]
+
+# Words stripped from a captured topic; if nothing is left the user wants top headlines
+TOPIC_FILLER = frozenset("""
+a an the some any me us tell give show get read what whats what's is are latest today today's todays
+recent current breaking top main big important new news headlines headline updates update please now
+hey ava can could you would i want to hear know about on of for in and
+aaj ki ka ke kya hai sunao batao mujhe
+""".split())
+
+TRAILING_NOISE = re.compile(r"\s+(?:today|please|right now|now|lately|these days|this week)$")
+
+
+def _normalize(text):
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return text.lower().strip()
+
+
+class SlotExtractor:
+    """
+    Local extraction of tool parameters, tried before asking the LLM.
+
+    Each method returns (value, confidence). A value of None with high
+    confidence means "nothing specified, use the default"; low confidence
+    means the text seems to name something the local rules don't know, and
+    the caller should fall back to the LLM.
+    """
+
+    def __init__(self, cities=CITIES):
+        self.index = {}
+        self.max_words = 1
+        for canonical, aliases in cities.items():
+            for name in [canonical] + list(aliases):
+                key = tuple(WORD.findall(_normalize(name)))
+                if key:
+                    self.index[key] = canonical
+                    self.max_words = max(self.max_words, len(key))
+
+    def find_cities(self, text):
+        """Returns ([(canonical, start_word, end_word), ...], words), taking the longest alias at each position."""
+        words = WORD.findall(_normalize(text))
+        matches = []
+        i = 0
+        while i < len(words):
+            for size in range(min(self.max_words, len(words) - i), 0, -1):
+                canonical = self.index.get(tuple(words[i:i + size]))
+                if canonical:
+                    matches.append((canonical, i, i + size))
+                    i += size
+                    break
+            else:
+                i += 1
+        return matches, words
+
+    def extract_city(self, text):
+        matches, words = self.find_cities(text)
+        if matches:
+            # Prefer the city right after a preposition ("from Delhi to Mumbai" -> the last one otherwise)
+            for canonical, start, _ in matches:
+                if start and words[start - 1] in ("in", "at", "for", "of"):
+                    return canonical, 1.0
+            return matches[-1][0], 0.95
+
+        normalized = _normalize(text)
+        for pattern in (PLACE_PREPOSITION, PLACE_HINGLISH):
+            for candidate in pattern.findall(normalized):
+                place_words = [w for w in WORD.findall(candidate) if w not in NON_PLACES]
+                if place_words and place_words[0] not in ("weather", "mausam", "temperature"):
+                    # Names something we don't know; let the LLM decide
+                    return None, 0.2
+        return None, 0.9
+
+    def extract_news_topic(self, text):
+        normalized = _normalize(text).rstrip("?.! ")
+        for pattern in TOPIC_PATTERNS:
+            match = pattern.search(normalized)
+            if not match:
+                continue
+            topic = TRAILING_NOISE.sub("", re.sub(r"'s\b", "", match.group(1)).strip())
+            words = [w for w in WORD.findall(topic) if w not in TOPIC_FILLER]
+            if not words:
+                return None, 0.9
+            if len(words) > 5:
+                # Long captures are usually a whole clause, not a topic
+                return None, 0.3
+            return self._restore_case(text, " ".join(words)), 0.85
+
+        if "news" in normalized or "headlines" in normalized:
+            leftover = [w for w in WORD.findall(normalized) if w not in TOPIC_FILLER]
+            if not leftover:
+                return None, 0.9
+        return None, 0.3
+
+    @staticmethod
+    def _restore_case(original, topic):
+        match = re.search(re.escape(topic), original, re.IGNORECASE)
+        return match.group(0) if match else topic.title()
@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import Config
+from managers.tool_manager import MISSING
+
+
+def plan_key(plan):
+    name, params = plan
+    return name, tuple(sorted(params.items()))
+
+
+class SpeculativeExecutor:
+    """
+    Starts tool work on partial transcripts while the user is still talking.
+
+    Every partial is routed with the tool manager's local-only planner (no
+    LLM). The first time a plan appears in an utterance its speculative part
+    (ToolManager.speculate) is submitted to a small pool; repeats of the
+    same plan in later partials are deduplicated. When the final transcript
+    is planned, claim() hands back the matching speculation (waiting for it
+    if it is still running) and everything else launched for the utterance
+    is discarded: cancelled if it has not started, counted as wasted if it
+    ran.
+    """
+
+    def __init__(self, tool_manager, max_workers=Config.SPECULATION_MAX_WORKERS):
+        self.logger = logging.getLogger("SpeculativeExecutor")
+        self.tool_manager = tool_manager
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Speculate")
+        self.launched = {}
+        self._lock = threading.Lock()
+        self.counts = {"launched": 0, "deduplicated": 0, "useful": 0, "wasted": 0, "cancelled": 0, "failed": 0}
+        self.saved_ms = 0.0
+        self.wasted_ms = 0.0
+
+    def on_partial(self, text):
+        """Called with every partial transcript (from the STT thread)."""
+        try:
+            plan = self.tool_manager.plan(text, local_only=True)
+        except Exception as e:
+            self.logger.debug(f"Planning a partial failed: {e}")
+            return
+        if not plan or plan[0] not in self.tool_manager.SPECULATIVE_TOOLS:
+            return
+
+        key = plan_key(plan)
+        with self._lock:
+            if key in self.launched:
+                self.counts["deduplicated"] += 1
+                return
+            entry = {"plan": plan, "started": time.perf_counter(), "finished": None}
+            entry["future"] = self.pool.submit(self._run, entry)
+            self.launched[key] = entry
+            self.counts["launched"] += 1
+        self.logger.info(f"Speculating {plan} on partial: {text!r}")
+
+    def _run(self, entry):
+        try:
+            return self.tool_manager.speculate(entry["plan"])
+        finally:
+            entry["finished"] = time.perf_counter()
+
+    def claim(self, plan):
+        """The speculative artifact for `plan`, or MISSING if nothing usable was launched for it."""
+        with self._lock:
+            entry = self.launched.pop(plan_key(plan), None)
+        if entry is None:
+            return MISSING
+
+        claimed = time.perf_counter()
+        try:
+            artifact = entry["future"].result()
+        except Exception as e:
+            self.logger.warning(f"Speculation {plan} failed, running it again: {e}")
+            with self._lock:
+                self.counts["failed"] += 1
+            return MISSING
+
+        # Time the speculation ran before the final transcript asked for it
+        saved = (min(entry["finished"], claimed) - entry["started"]) * 1000
+        with self._lock:
+            self.counts["useful"] += 1
+            self.saved_ms += saved
+        self.logger.info(f"Speculation {plan} confirmed ({saved:.0f} ms of work done ahead)")
+        return artifact
+
+    def discard(self):
+        """Ends the utterance: whatever was launched and not claimed is cancelled or written off."""
+        with self._lock:
+            leftovers, self.launched = list(self.launched.values()), {}
+        for entry in leftovers:
+            future = entry["future"]
+            with self._lock:
+                if future.cancel():
+                    self.counts["cancelled"] += 1
+                    continue
+                self.counts["wasted"] += 1
+            # Already running: let it finish on its own (a weather/news fetch still warms the tool cache)
+            future.add_done_callback(lambda _, entry=entry: self._write_off(entry))
+
+    def _write_off(self, entry):
+        with self._lock:
+            self.wasted_ms += ((entry["finished"] or time.perf_counter()) - entry["started"]) * 1000
+
+    def stats(self):
+        with self._lock:
+            decided = self.counts["useful"] + self.counts["wasted"] + self.counts["cancelled"]
+            return dict(
+                self.counts,
+                hit_rate=self.counts["useful"] / decided if decided else 0.0,
+                saved_ms=round(self.saved_ms),
+                wasted_ms=round(self.wasted_ms)
+            )
+
+    def close(self):
+        self.discard()
+        self.pool.shutdown(wait=False, cancel_futures=True)
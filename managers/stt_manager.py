@@ -1,12 +1,57 @@
-
-from modules.stt.listener import SpeechToTextListener
+import asyncio
 import logging
+import threading
+from config import Config
+from modules.stt.backends import create_backend
 
 class STTManager:
-    def __init__(self):
+    def __init__(self, backend=Config.STT_BACKEND):
+        """`backend` is a name from modules.stt.backends.BACKENDS or a ready-made backend object."""
         self.logger = logging.getLogger("STTManager")
-        self.listener = SpeechToTextListener(language="en-IN")
+        self.backend = create_backend(backend) if isinstance(backend, str) else backend
+        # Chrome launches (or Whisper loads) in the background while the rest of the app initializes
+        self._start_detail = None
+        self._start_error = None
+        self._started = threading.Event()
+        threading.Thread(target=self._start_backend, name="STTLauncher", daemon=True).start()
+
+    def _start_backend(self):
+        try:
+            self._start_detail = self.backend.start()
+        except Exception as e:
+            self._start_error = e
+        finally:
+            self._started.set()
+
+    def _wait_started(self):
+        self._started.wait()
+        if self._start_error:
+            raise self._start_error
+
+    @property
+    def language(self):
+        return self.backend.language
+
+    @property
+    def last_timing(self):
+        return self.backend.last_timing
+
+    def warm_up(self):
+        """Waits for the backend to finish starting, so the first listen begins at once."""
+        self._wait_started()
+        return self._start_detail
     
     def listen(self, callback=None):
-        text = self.listener.run_cycle(callback=callback)
-        return text
+        self._wait_started()
+        return self.backend.listen(callback)
+
+    async def alisten(self, callback=None):
+        return await asyncio.to_thread(self.listen, callback)
+
+    def close(self):
+        if not self._started.is_set() or self._start_error:
+            return
+        try:
+            self.backend.stop()
+        except Exception as e:
+            self.logger.debug(f"Stopping the STT backend failed: {e}")
@@ -1,92 +1,196 @@
+import asyncio
 import logging
+import time
 from config import Config
-from tools.weather import WeatherTool
-from tools.news import NewsTool
-from tools.system_info import SystemInfoTool
-from Functions.screen.screen_reader import ScreenReaderTool
+from managers.intent_engine import IntentEngine
+from managers.prefetch_scheduler import PrefetchScheduler
+from managers.slot_extractor import SlotExtractor
+from managers.tool_registry import ToolRegistry
+from tools.cache import get_tool_cache
+
+# "No speculative result": distinct from a speculation that legitimately returned None
+MISSING = object()
 
 
 class ToolManager:
-    def __init__(self, llm_instance=None):
+    def __init__(self, llm_instance=None, http_client=None):
         self.logger = logging.getLogger("ToolManager")
-        self.tools = {}
+        self.tools = ToolRegistry()
         self.llm = llm_instance
+        self.http = http_client
+        self.cache = get_tool_cache()
+        self.intents = IntentEngine(threshold=Config.INTENT_THRESHOLD)
+        self.last_intent = None
+        self.slots = SlotExtractor()
+        self.last_extraction = None
+        self.slot_stats = {"local": 0, "llm": 0}
         self._register_tools()
+        self.prefetcher = None
+        if Config.PREFETCH_ENABLED and self.cache:
+            self.prefetcher = PrefetchScheduler(self.tools, self.cache)
 
     def _register_tools(self):
-        self.register_tool(WeatherTool())
-        self.register_tool(NewsTool())
-        self.register_tool(SystemInfoTool())
-        self.register_tool(ScreenReaderTool())
+        # Registration order is routing priority on ties
+        self.register_entry_point("weather", "tools.weather:WeatherTool", http_client=self.http, tool_cache=self.cache)
+        self.register_entry_point("news", "tools.news:NewsTool", http_client=self.http, tool_cache=self.cache)
+        self.register_entry_point("screen_reader", "Functions.screen.screen_reader:ScreenReaderTool", http_client=self.http)
+        self.register_entry_point("system_info", "tools.system_info:SystemInfoTool")
 
+    def register_entry_point(self, name, entry_point, **kwargs):
+        """Registers a tool to be constructed on first use."""
+        self.tools.register(name, entry_point, **kwargs)
+        self.intents.add(name, self.tools.keywords(name))
+        self.logger.info(f"Tool registered: {name} ({entry_point})")
         
     def register_tool(self, tool):
-        self.tools[tool.name] = tool
+        self.tools.add(tool)
+        self.intents.add(tool.name, getattr(tool, "keywords", {}))
         self.logger.info(f"Tool registered: {tool.name}")
 
+    # Tools whose expensive part can start on a partial transcript (see speculate())
+    SPECULATIVE_TOOLS = ("weather", "news", "system_info", "screen_reader")
+
     def find_tool_for_intent(self, text):
-        text = text.lower()
-        if "weather" in text or "vedar" in text or "vader" in text:
-            return self.tools.get("weather")
-        if "news" in text:
-            return self.tools.get("news")
-        
-        screen_keywords = [
-            "on my screen", "read my screen", "see my screen", "look at my screen", "describe my screen",
-            "kya dikh raha hai", "screen par kya hai", "screen dekho", "reading screen",
-            "what do you see", "what is visible", "check my screen", "analyze screen",
-            "screen mein kya", "mere screen"
-        ]
-        
-        if any(keyword in text for keyword in screen_keywords):
-             self.logger.info("Manual Keyword detected screen reading intent.")
-             return self.tools.get("screen_reader")
-        
-        system_keywords = [
-            "system", "spec", "specs", "processor", "cpu", 
-            "memory", "ram", "disk", "storage", "space", "os", "platform",
-            "gpu", "graphics", "card"
-        ]
-        if any(keyword in text for keyword in system_keywords):
-            if "space" in text and not ("free" in text or "left" in text or "disk" in text or "storage" in text):
-                 pass
+        match = self.intents.route(text)
+        self.last_intent = match
+        if match:
+            self.logger.info(f"Intent '{match.intent}' (score {match.score:.2f}, matched {list(match.phrases)})")
+            return self.tools.get(match.intent)
+        return None
+
+    def _resolve_slot(self, slot, user_text, local_extract, llm_method):
+        """
+        Tries the local extractor first and only asks the LLM when the local
+        answer is not confident enough. Returns the value or None for "default".
+        """
+        started = time.perf_counter()
+        value, confidence = local_extract(user_text)
+        local_hit = confidence >= Config.SLOT_CONFIDENCE_THRESHOLD or not self.llm
+
+        if not local_hit:
+            extracted = getattr(self.llm, llm_method)(user_text)
+            value = extracted if extracted and extracted != "None" else None
+
+        self.slot_stats["local" if local_hit else "llm"] += 1
+        self.last_extraction = {
+            "slot": slot,
+            "value": value,
+            "confidence": confidence,
+            "local_hit": local_hit,
+            "elapsed_ms": (time.perf_counter() - started) * 1000
+        }
+        self.logger.info(
+            f"{slot}={value!r} via {'local extractor' if local_hit else 'LLM'} "
+            f"(confidence {confidence:.2f}, {self.last_extraction['elapsed_ms']:.1f} ms)"
+        )
+        return value
+
+    def _local_slot(self, user_text, local_extract):
+        """(value, confident) from the local extractor alone; never asks the LLM."""
+        value, confidence = local_extract(user_text)
+        return value, confidence >= Config.SLOT_CONFIDENCE_THRESHOLD
+
+    def plan(self, user_text, local_only=False):
+        """
+        Returns (tool name, params) for the utterance, or None when no tool
+        applies. With `local_only` (speculation on partial transcripts) the LLM
+        is never asked for a slot; an uncertain slot means no plan.
+        """
+        if local_only:
+            match = self.intents.route(user_text)
+            if not match:
+                return None
+            name = match.intent
+        else:
+            tool = self.find_tool_for_intent(user_text)
+            if not tool:
+                return None
+            name = tool.name
+
+        if name == "weather":
+            if local_only:
+                city, confident = self._local_slot(user_text, self.slots.extract_city)
+                if not confident:
+                    return None
             else:
-                 return self.tools.get("system_info")
-        
+                city = self._resolve_slot("city", user_text, self.slots.extract_city, "extract_city")
+            return name, {"city": city or Config.DEFAULT_CITY}
+
+        if name == "news":
+            if local_only:
+                query, confident = self._local_slot(user_text, self.slots.extract_news_topic)
+                if not confident:
+                    return None
+            else:
+                query = self._resolve_slot("news_topic", user_text, self.slots.extract_news_topic, "extract_news_topic")
+            return name, {"query": query}
+
+        return name, {}
+
+    def speculate(self, plan):
+        """
+        The part of a tool call worth starting before the user has finished:
+        the weather/news fetch itself, loading the system tool (and its
+        sampler), or grabbing the screen while the user is still asking
+        about it. Returns an artifact for execute(); a screen grab comes with
+        the time it was taken so execute() can tell whether it is still fresh.
+        """
+        name, params = plan
+        tool = self.tools.get(name)
+        if name == "weather":
+            return tool.execute(params["city"])
+        if name == "news":
+            return tool.execute(query=params["query"])
+        if name == "screen_reader":
+            return time.monotonic(), tool.manager.grab_frame()
         return None
 
-    def process(self, user_text):
-        tool = self.find_tool_for_intent(user_text)
-        if tool:
-            self.logger.info(f"Triggering tool: {tool.name}")
-            result = None
-            
-            if tool.name == "weather":
-                city = "Kolkata"
-                if self.llm:
-                    city = self.llm.extract_city(user_text)
-                    if not city or city == "None":
-                        city = "Kolkata"
-                
-                result = tool.execute(city)
-            
-            elif tool.name == "news":
-                query = None
-                if self.llm:
-                    extracted = self.llm.extract_news_topic(user_text)
-                    if extracted and extracted != "None":
-                        query = extracted
-                
-                result = tool.execute(query=query)
-            
-            elif tool.name == "system_info":
-                result = tool.execute(query_type=user_text)
-
-            elif tool.name == "screen_reader":
-                result = tool.execute(prompt=user_text)
-            
-            self.logger.info(f"Tool Output: {str(result)[:100]}...") 
-            return result
-            
-        
+    def execute(self, plan, user_text, on_partial=None, artifact=MISSING):
+        """Runs a planned tool call, finishing from a speculative artifact when one is given."""
+        name, params = plan
+        tool = self.tools.get(name)
+        self.logger.info(f"Triggering tool: {name}{' (speculated)' if artifact is not MISSING else ''}")
+
+        if name in ("weather", "news"):
+            self._record_usage(name, dict(params, category=None) if name == "news" else params)
+            if artifact is not MISSING:
+                return artifact
+            return tool.execute(params["city"]) if name == "weather" else tool.execute(query=params["query"])
+
+        if name == "system_info":
+            return tool.execute(query_type=user_text)
+
+        if name == "screen_reader":
+            frame = None
+            if artifact is not MISSING:
+                grabbed_at, frame = artifact
+                age = time.monotonic() - grabbed_at
+                if age > Config.SPECULATION_FRAME_MAX_AGE:
+                    # Grabbed on an early partial; the screen may have changed since, so the tool grabs anew
+                    self.logger.info(f"Speculative frame is {age:.1f}s old; grabbing a fresh one.")
+                    frame = None
+            return tool.execute(prompt=user_text, on_partial=on_partial, frame=frame)
+
         return None
+
+    def _record_usage(self, tool_name, params):
+        if self.prefetcher:
+            self.prefetcher.record(tool_name, params)
+
+    async def aprocess(self, user_text, on_partial=None, speculation=None):
+        return await asyncio.to_thread(self.process, user_text, on_partial, speculation)
+
+    def process(self, user_text, on_partial=None, speculation=None):
+        """
+        Runs the matching tool; tools that stream (the screen reader) report
+        their output so far to on_partial. With a SpeculativeExecutor, work
+        already started on a partial transcript for the same plan is reused.
+        """
+        plan = self.plan(user_text)
+        if not plan:
+            return None
+
+        artifact = speculation.claim(plan) if speculation else MISSING
+        result = self.execute(plan, user_text, on_partial, artifact)
+        self.logger.info(f"Tool Output: {str(result)[:100]}...")
+        return result
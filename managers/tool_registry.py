@@ -0,0 +1,73 @@
+import importlib
+import logging
+import threading
+import time
+
+
+class ToolRegistry:
+    """
+    Maps tool names to entry points ("package.module:Class") plus constructor
+    arguments. A tool's module is only imported when its class is needed
+    (for its routing keywords) and the tool is only constructed on the first
+    get(), so heavy dependencies and background threads are paid for when a
+    tool is actually used, not at startup.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger("ToolRegistry")
+        self._entry_points = {}
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, entry_point, **kwargs):
+        self._entry_points[name] = (entry_point, kwargs)
+
+    def add(self, tool):
+        """Registers an already constructed tool."""
+        with self._lock:
+            self._instances[tool.name] = tool
+
+    def load_class(self, name):
+        entry_point, _ = self._entry_points[name]
+        module_name, _, class_name = entry_point.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def attribute(self, name, attribute, default=None):
+        """Reads a class-level attribute of a tool (from the instance if it is loaded) without constructing it."""
+        with self._lock:
+            tool = self._instances.get(name)
+        if tool is not None:
+            return getattr(tool, attribute, default)
+        return getattr(self.load_class(name), attribute, default)
+
+    def keywords(self, name):
+        return self.attribute(name, "keywords", {})
+
+    def get(self, name, default=None):
+        with self._lock:
+            tool = self._instances.get(name)
+            if tool is not None or name not in self._entry_points:
+                return tool if tool is not None else default
+
+            started = time.perf_counter()
+            _, kwargs = self._entry_points[name]
+            tool = self.load_class(name)(**kwargs)
+            self._instances[name] = tool
+        self.logger.info(f"Loaded tool '{name}' in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return tool
+
+    def __getitem__(self, name):
+        tool = self.get(name)
+        if tool is None:
+            raise KeyError(name)
+        return tool
+
+    def __contains__(self, name):
+        return name in self._entry_points or name in self._instances
+
+    def names(self):
+        return list(dict.fromkeys(list(self._entry_points) + list(self._instances)))
+
+    def loaded(self):
+        with self._lock:
+            return list(self._instances)
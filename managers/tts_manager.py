@@ -1,7 +1,13 @@
 
+import asyncio
 import logging
+import queue
 import re
+import threading
+import time
 from modules.tts.edge_tts_engine import EdgeTTS
+from modules.tts.sentence_chunker import split_sentences
+from managers.echo_filter import EchoFilter
 from config import Config
 
 class TTSManager:
@@ -10,18 +16,127 @@ class TTSManager:
         self.engine = EdgeTTS(temp_folder="temp")
         self.default_voice = 'en-IE-EmilyNeural'
         self.last_spoken = ""
+        # Everything spoken recently, so transcripts of Ava's own voice can be dropped
+        self.echo_filter = EchoFilter()
+        self._stream_queue = None
+        self._stream_thread = None
+        self._interrupted = threading.Event()
+        self.barge_ins = 0
+        # perf_counter() at which the current/last streamed reply started playing
+        self.first_audio_at = None
+
+    def _clean(self, text):
+        return re.sub(r'\*.*?\*', '', text).replace("*", "").strip()
 
     def speak(self, text):
         self.logger.info(f"Speaking: {text}")
         
-        clean_text = re.sub(r'\*.*?\*', '', text).strip()
+        clean_text = self._clean(text)
         
         if clean_text:
             self.last_spoken = clean_text
+            for sentence in split_sentences(clean_text):
+                self.echo_filter.remember(sentence)
+            self.echo_filter.playback_started()
+            try:
+                self.engine.speak(clean_text, voice=self.default_voice)
+            finally:
+                self.echo_filter.playback_stopped()
+
+    async def aspeak(self, text):
+        await asyncio.to_thread(self.speak, text)
+
+    def warm_up(self):
+        return self.engine.warm_up(self.default_voice, phrases=Config.TTS_WARMUP_PHRASES)
+
+    def start_stream(self):
+        """Starts a worker that speaks sentences as they are fed, in order."""
+        self.finish_stream()
+        self.last_spoken = ""
+        self.first_audio_at = None
+        self._interrupted.clear()
+        self._stream_queue = queue.Queue()
+        self._stream_thread = threading.Thread(target=self._stream_worker, args=(self._stream_queue,), daemon=True)
+        self._stream_thread.start()
+
+    def feed(self, sentence):
+        if self._stream_queue is None:
+            self.start_stream()
+        self._stream_queue.put(sentence)
+
+    def finish_stream(self):
+        """Signals the end of the reply and blocks until the last sentence is spoken."""
+        if self._stream_queue is not None:
+            self._stream_queue.put(None)
+            self._stream_thread.join()
+            self._stream_queue = None
+            self._stream_thread = None
+
+    async def afinish_stream(self):
+        await asyncio.to_thread(self.finish_stream)
+
+    def is_idle(self):
+        """True when no streamed reply is being spoken."""
+        return self._stream_thread is None or not self._stream_thread.is_alive()
+
+    def _stream_worker(self, sentences):
+        self.echo_filter.playback_started()
+        try:
+            self._speak_stream(sentences)
+        finally:
+            self.echo_filter.playback_stopped()
+
+    def _speak_stream(self, sentences):
+        if self.engine.pipelined:
+            # Lets the engine synthesize the next sentence while this one plays
+            self.engine.speak_sentences(self._drain(sentences), voice=self.default_voice)
+            self.first_audio_at = self.engine.last_timing.get("first_audio_at")
+            return
+
+        for clean_text in self._drain(sentences):
+            started = time.perf_counter()
             self.engine.speak(clean_text, voice=self.default_voice)
+            if self.first_audio_at is None and self.engine.last_timing:
+                self.first_audio_at = started + self.engine.last_timing["time_to_first_audio"]
+
+    def _drain(self, sentences):
+        while True:
+            sentence = sentences.get()
+            if sentence is None or self._interrupted.is_set():
+                break
+            clean_text = self._clean(sentence)
+            if not clean_text:
+                continue
+            self.logger.info(f"Speaking: {clean_text}")
+            self.last_spoken = f"{self.last_spoken} {clean_text}".strip()
+            self.echo_filter.remember(clean_text)
+            yield clean_text
 
     def stop(self):
+        """Silences the current reply at once and drops the sentences still queued."""
+        self._interrupted.set()
         self.engine.stop()
 
+    def barge_in(self):
+        """The user started talking over a reply: cut it off. Returns False if nothing was being said."""
+        if self.is_idle():
+            return False
+        started = time.perf_counter()
+        position = self.engine.position()
+        self.stop()
+        self.barge_ins += 1
+        heard = f" after {position:.1f}s of audio" if position is not None else ""
+        self.logger.info(f"Barge-in: speech stopped{heard} in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return True
+
+    def pause(self):
+        self.engine.pause()
+
+    def resume(self):
+        self.engine.resume()
+
+    def position(self):
+        return self.engine.position()
+
     def wait(self):
         self.engine.wait()
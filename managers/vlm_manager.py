@@ -1,25 +1,160 @@
-import base64
+import json
 import logging
-from io import BytesIO
-import requests
-from PIL import ImageGrab
+import time
+from urllib.parse import urlsplit
+from config import Config
+from core.http_client import get_http_pool
+from modules.vision.screen_capture import ScreenCapture
+from modules.vision.screen_cache import ScreenAnalysisCache, changed_tiles
+
+class VLMError(Exception):
+    """Ollama answered with an error status or an error event."""
+
+
+def ollama_base_url(host):
+    """
+    Turns an OLLAMA_HOST value into a base URL the way Ollama's own client
+    reads it: "127.0.0.1:11434" or "0.0.0.0" gets http:// and the default
+    port, and the bind-all address is reached through localhost.
+    """
+    host = (host or "").strip().rstrip("/") or "localhost"
+    has_scheme = "://" in host
+    parts = urlsplit(host if has_scheme else f"http://{host}")
+    hostname = parts.hostname or "localhost"
+    if hostname in ("0.0.0.0", "::"):
+        hostname = "localhost"
+    elif ":" in hostname:
+        hostname = f"[{hostname}]"
+    port = parts.port or (None if has_scheme else 11434)
+    netloc = f"{hostname}:{port}" if port else hostname
+    return f"{parts.scheme}://{netloc}{parts.path}"
+
 
 class VLMManager:
-    def __init__(self, model="minicpm-v"):
+    def __init__(self, model="minicpm-v", http_client=None, base_url=Config.VLM_OLLAMA_URL):
         self.logger = logging.getLogger("VLMManager")
+        self.http = http_client or get_http_pool()
         self.model = model
-        # Assuming Ollama is running on default port
-        self.api_url = "http://localhost:11434/api/generate" 
+        self.api_url = f"{ollama_base_url(base_url)}/api/generate"
+        self.stream = Config.VLM_STREAM
+        # ttft_s, total_s, load_s (Ollama's model load time) and cold for the last request
+        self.last_timing = {}
+        self.capture = ScreenCapture()
+        self.last_capture = None
+        # Unchanged screen + same question -> the previous answer, without a VLM call
+        self.cache = ScreenAnalysisCache() if Config.VLM_CACHE_ENABLED else None
+        self._last_hashes = None
+        # (left, top, right, bottom) boxes, in screen pixels, that changed since the previous capture
+        self.last_changed_regions = []
 
-    def capture_screen(self):
+    def capture_screen(self, region=None):
+        """Returns the screen as a downscaled, encoded CaptureResult, or None if it could not be grabbed."""
+        frame = self.grab_frame(region)
+        return self.encode_frame(frame) if frame else None
+
+    def grab_frame(self, region=None):
         try:
-            screenshot = ImageGrab.grab()
-            return screenshot
+            return self.capture.grab_frame(region)
         except Exception as e:
             self.logger.error(f"Failed to capture screen: {e}")
             return None
 
-    def analyze_screen(self, user_query=None):
+    def encode_frame(self, frame):
+        result = self.capture.encode_frame(frame)
+        self.last_capture = result
+        self.logger.info(
+            f"Screen {result.source_size[0]}x{result.source_size[1]} -> {result.size[0]}x{result.size[1]} {result.format}: "
+            f"grab {result.capture_ms:.0f} ms, scale {result.scale_ms:.0f} ms, encode {result.encode_ms:.0f} ms, "
+            f"{result.payload_bytes / 1024:.0f} KB payload"
+        )
+        return result
+
+    def _track_changes(self, frame, hashes):
+        previous, self._last_hashes = self._last_hashes, hashes
+        tiles = self.cache.tiles
+        if not tiles or previous is None:
+            self.last_changed_regions = []
+            return
+        width, height = frame.source_size
+        self.last_changed_regions = [
+            (col * width // tiles, row * height // tiles, (col + 1) * width // tiles, (row + 1) * height // tiles)
+            for row, col in (divmod(index, tiles) for index in changed_tiles(previous[1], hashes[1], self.cache.tolerance))
+        ]
+        self.logger.info(f"Screen regions changed since the last capture: {len(self.last_changed_regions)} of {tiles * tiles}")
+
+    def keep_alive(self):
+        """keep_alive sent with every request; "pin" (-1) keeps the model resident until it is released."""
+        return -1 if Config.VLM_KEEP_ALIVE == "pin" else Config.VLM_KEEP_ALIVE
+
+    def warm_up(self):
+        """Loads the model into Ollama with an empty prompt, so the first screen question skips the load."""
+        started = time.perf_counter()
+        payload = {"model": self.model, "prompt": "", "keep_alive": self.keep_alive(), "stream": False}
+        response = self.http.post(self.api_url, json=payload, timeout=120)
+        if response.status_code != 200:
+            raise RuntimeError(f"Ollama returned {response.status_code}: {response.text[:100]}")
+        self._record_timing(started, None, response.json())
+        state = "loaded" if self.last_timing["cold"] else "already resident"
+        return f"{self.model} {state} (keep_alive {self.keep_alive()})"
+
+    def release(self):
+        """Asks Ollama to unload the model now (keep_alive 0)."""
+        response = self.http.post(self.api_url, json={"model": self.model, "keep_alive": 0}, timeout=10)
+        self.logger.info(f"Released {self.model} (HTTP {response.status_code})")
+
+    def _record_timing(self, started, first_token, final_event):
+        finished = time.perf_counter()
+        load_s = final_event.get("load_duration", 0) / 1e9
+        self.last_timing = {
+            "ttft_s": (first_token or finished) - started,
+            "total_s": finished - started,
+            "load_s": load_s,
+            # Ollama reports a few ms of load_duration even for a resident model
+            "cold": load_s > 0.5
+        }
+        self.logger.info(
+            f"{self.model}: first token {self.last_timing['ttft_s']:.2f}s, total {self.last_timing['total_s']:.2f}s, "
+            f"model load {load_s:.2f}s ({'cold' if self.last_timing['cold'] else 'warm'})"
+        )
+
+    def _generate(self, payload):
+        started = time.perf_counter()
+        response = self.http.post(self.api_url, json=payload, timeout=60)
+        if response.status_code != 200:
+            raise VLMError(response.text)
+        result = response.json()
+        self._record_timing(started, None, result)
+        return result.get("response", "")
+
+    def _generate_streaming(self, payload, on_partial=None):
+        """Reads Ollama's NDJSON stream, passing the text so far to on_partial as it grows."""
+        started = time.perf_counter()
+        first_token = None
+        parts = []
+        with self.http.stream("POST", self.api_url, json=payload, timeout=60) as response:
+            if response.status_code != 200:
+                response.read()
+                raise VLMError(response.text)
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get("error"):
+                    raise VLMError(event["error"])
+                delta = event.get("response", "")
+                if delta:
+                    if first_token is None:
+                        first_token = time.perf_counter()
+                    parts.append(delta)
+                    if on_partial:
+                        on_partial("".join(parts))
+                if event.get("done"):
+                    self._record_timing(started, first_token, event)
+                    break
+        return "".join(parts)
+
+    def analyze_screen(self, user_query=None, region=None, on_partial=None, frame=None):
+        """`frame` is a capture taken earlier (while the question was still being spoken); grabbed now otherwise."""
         base_prompt = "Briefly list the main applications and content visible on the screen."
         
         if user_query:
@@ -27,32 +162,44 @@ class VLMManager:
             final_prompt = f"User Question: '{user_query}'. Answer this question based on the screen content. Be extremely concise. OUTPUT IN ENGLISH ONLY."
         else:
              final_prompt = f"{base_prompt} OUTPUT IN ENGLISH ONLY."
-        screenshot = self.capture_screen()
-        if not screenshot:
+        frame = frame or self.grab_frame(region)
+        if not frame:
             return "Failed to capture screen."
 
-        buffered = BytesIO()
-        screenshot.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
+        hashes = None
+        if self.cache:
+            hashes = self.cache.hash(frame.image)
+            self._track_changes(frame, hashes)
+            cached = self.cache.get(hashes, final_prompt)
+            if cached is not None:
+                self.logger.info("Screen unchanged; answering from the analysis cache")
+                return cached
+        screenshot = self.encode_frame(frame)
 
         payload = {
             "model": self.model,
             "prompt": final_prompt,
-            "images": [img_str],
-            "stream": False
+            "images": [screenshot.image_b64],
+            "stream": self.stream,
+            "keep_alive": self.keep_alive()
         }
 
         try:
             self.logger.info(f"Sending screen to {self.model} for analysis...")
-            response = requests.post(self.api_url, json=payload, timeout=60)
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "No response from VLM.")
+            if self.stream:
+                answer = self._generate_streaming(payload, on_partial)
             else:
-                self.logger.error(f"VLM Error {response.status_code}: {response.text}")
-                return f"Error from VLM: {response.text}"
-                
+                answer = self._generate(payload)
+
+            if not answer:
+                return "No response from VLM."
+            if hashes is not None:
+                self.cache.put(hashes, final_prompt, answer)
+            return answer
+
+        except VLMError as e:
+            self.logger.error(f"VLM Error: {e}")
+            return f"Error from VLM: {e}"
         except Exception as e:
             self.logger.error(f"VLM Analysis Failed: {e}")
             return f"Error analyzing screen: {e}"
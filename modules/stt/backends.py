@@ -0,0 +1,173 @@
+"""
+Speech-to-text backends behind STTManager.
+
+A backend is any object with:
+
+    language                 locale the recognizer listens for ("en-IN")
+    start() -> str           prepares it (browser launched, model loaded); the
+                             returned detail is shown in the warm-up summary
+    listen(on_partial) -> str
+                             records one utterance, calling on_partial(text)
+                             with partial hypotheses, and returns the final
+                             text ("" when nothing was heard)
+    stop()                   releases the browser / audio device
+    last_timing              dict describing the last listen; "speech_end" is
+                             the perf_counter() at which the user stopped
+                             talking, when the backend can tell
+
+Heavy dependencies are imported in start(), not when this module loads.
+"""
+
+import json
+import logging
+import os
+import time
+
+from config import Config
+
+
+class BrowserBackend:
+    """Chrome web-speech page driven through Selenium (modules/stt/listener.py)."""
+
+    def __init__(self, language=Config.STT_LANGUAGE):
+        self.language = language
+        self.listener = None
+        self.last_timing = {}
+
+    def start(self):
+        from modules.stt.listener import SpeechToTextListener
+        self.listener = SpeechToTextListener(language=self.language, endpointing=Config.STT_ENDPOINTING)
+        if not self.listener.load_page():
+            raise RuntimeError("language selection failed")
+        return "recognition page loaded"
+
+    def listen(self, on_partial=None):
+        text = self.listener.run_cycle(callback=on_partial)
+        self.last_timing = dict(self.listener.last_timing, returned=time.perf_counter())
+        return text
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.close()
+
+
+class WhisperBackend:
+    """Offline faster-whisper with VAD endpointing (modules/stt/whisper_listener.py)."""
+
+    def __init__(self, language=Config.STT_LANGUAGE):
+        self.language = language
+        self.listener = None
+        self.last_timing = {}
+
+    def start(self):
+        from modules.stt.whisper_listener import WhisperListener
+        self.listener = WhisperListener(language=self.language)
+        return self.listener.warm_up()
+
+    def listen(self, on_partial=None):
+        text = self.listener.run_cycle(callback=on_partial)
+        self.last_timing = dict(self.listener.last_timing, returned=time.perf_counter())
+        return text
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.close()
+
+
+class ReplayBackend:
+    """
+    Replays a JSONL script instead of a microphone, so the full app loop can
+    run unattended with repeatable timing. Each line is one user turn:
+
+        {"text": "what's the weather in Paris", "pause": 1.5}
+        {"wav": "recordings/news.wav"}
+
+    "pause" is the silence (seconds) before the user starts, counted from
+    when Ava has stopped talking (default 1.0). Scripted text is "spoken"
+    at `words_per_minute`, with a partial after every word, and returned
+    `endpoint_ms` after the last word, like a recognizer's endpointing
+    delay. WAV turns (relative to the script) are streamed in real time
+    through the Whisper listener's VAD and decoder. Once the script is
+    exhausted the backend says "exit" so the app shuts down on its own.
+    """
+
+    def __init__(self, script_path, language=Config.STT_LANGUAGE, words_per_minute=150,
+                 endpoint_ms=Config.STT_ENDPOINT_SILENCE_MS, is_idle=None):
+        self.logger = logging.getLogger("ReplayBackend")
+        self.script_path = script_path
+        self.language = language
+        self.word_seconds = 60 / words_per_minute
+        self.endpoint_ms = endpoint_ms
+        # Called before each turn's pause; JarvisApp points it at "Ava has finished speaking"
+        self.is_idle = is_idle
+        self.turns = []
+        self.position = 0
+        self.whisper = None
+        self.last_timing = {}
+
+    def start(self):
+        base_dir = os.path.dirname(os.path.abspath(self.script_path))
+        with open(self.script_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    turn = json.loads(line)
+                    if "wav" in turn:
+                        turn["wav"] = os.path.join(base_dir, turn["wav"])
+                    self.turns.append(turn)
+
+        if any("wav" in turn for turn in self.turns):
+            from modules.stt.whisper_listener import WhisperListener
+            self.whisper = WhisperListener(language=self.language)
+            self.whisper.warm_up()
+        return f"{len(self.turns)} scripted turns from {os.path.basename(self.script_path)}"
+
+    def _wait_until_idle(self):
+        while self.is_idle is not None and not self.is_idle():
+            time.sleep(0.05)
+
+    def listen(self, on_partial=None):
+        self._wait_until_idle()
+        if self.position >= len(self.turns):
+            self.last_timing = {"speech_end": time.perf_counter(), "returned": time.perf_counter()}
+            return "exit"
+
+        turn = self.turns[self.position]
+        self.position += 1
+        time.sleep(turn.get("pause", 1.0))
+        if "wav" in turn:
+            return self._replay_wav(turn["wav"], on_partial)
+
+        words = turn["text"].split()
+        for count in range(1, len(words) + 1):
+            time.sleep(self.word_seconds)
+            if on_partial:
+                on_partial(" ".join(words[:count]))
+        speech_end = time.perf_counter()
+        time.sleep(self.endpoint_ms / 1000)
+        self.last_timing = {"speech_end": speech_end, "returned": time.perf_counter()}
+        return turn["text"]
+
+    def _replay_wav(self, path, on_partial):
+        from faster_whisper import decode_audio
+        import numpy as np
+
+        audio = decode_audio(path, sampling_rate=self.whisper.SAMPLE_RATE)
+        # Trailing silence so the VAD can endpoint the clip
+        audio = np.concatenate((audio, np.zeros(self.whisper.SAMPLE_RATE * 2, dtype=np.float32)))
+        text = self.whisper.listen_frames(self.whisper.paced_frames(audio), on_partial)
+        self.last_timing = dict(self.whisper.last_timing, returned=time.perf_counter())
+        return text
+
+    def stop(self):
+        if self.whisper is not None:
+            self.whisper.close()
+
+
+BACKENDS = {"browser": BrowserBackend, "whisper": WhisperBackend}
+
+
+def create_backend(name, language=Config.STT_LANGUAGE):
+    try:
+        return BACKENDS[name.lower()](language=language)
+    except KeyError:
+        raise ValueError(f"Unknown STT backend '{name}' (expected one of {', '.join(BACKENDS)})") from None
@@ -0,0 +1,67 @@
+import time
+
+from config import Config
+
+
+class UtteranceEndpointer:
+    """
+    Decides when a browser utterance is complete, without waiting for the
+    recognizer's own end-of-speech (which adds a second or more of dead air).
+
+    The utterance is complete as soon as every result the page has reported
+    is final, or once the transcript has not changed for `stable_ms`. The
+    stability rule needs at least `min_words` words, so a hesitation after
+    "what's" does not end the turn; shorter utterances still end on the
+    final result or when the page stops recording.
+
+    Times are time.time() seconds; the page stamps its events with
+    Date.now(), which reads the same clock.
+    """
+
+    def __init__(self, stable_ms, min_words=1):
+        self.stable_ms = stable_ms
+        self.min_words = min_words
+        self.reset()
+
+    def reset(self):
+        self.text = ""
+        self.changed_at = None
+        self.final = False
+
+    def on_transcript(self, text, at=None):
+        if text != self.text:
+            self.text = text
+            self.changed_at = at or time.time()
+            self.final = False
+
+    def on_result(self, final, text, at=None):
+        self.on_transcript(text, at)
+        self.final = bool(final) and bool(self.text)
+
+    def deadline(self):
+        """time.time() at which the current transcript counts as stable, or None while the rule cannot apply."""
+        if self.changed_at is None or len(self.text.split()) < self.min_words:
+            return None
+        return self.changed_at + self.stable_ms / 1000
+
+    def complete(self, now=None):
+        """Returns "final" or "stable" once the utterance is complete, None to keep listening."""
+        if self.final:
+            return "final"
+        deadline = self.deadline()
+        if deadline is not None and (now or time.time()) >= deadline:
+            return "stable"
+        return None
+
+
+def create_endpointer(aggressiveness=None):
+    """An endpointer for a Config.STT_ENDPOINT_PRESETS name (default Config.STT_ENDPOINTING); None for "off"."""
+    aggressiveness = aggressiveness or Config.STT_ENDPOINTING
+    if aggressiveness == "off":
+        return None
+    if aggressiveness not in Config.STT_ENDPOINT_PRESETS:
+        raise ValueError(
+            f"Unknown endpointing '{aggressiveness}' "
+            f"(expected off or one of {', '.join(Config.STT_ENDPOINT_PRESETS)})"
+        )
+    return UtteranceEndpointer(**Config.STT_ENDPOINT_PRESETS[aggressiveness])
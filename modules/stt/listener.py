@@ -12,17 +12,27 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 import os
+import time
+
+from modules.stt.endpointing import create_endpointer
 
 class SpeechToTextListener:
     """A class for performing speech-to-text using a web-based service."""
 
+    # Long-poll window for page events; one WebDriver round trip per batch or per window
+    EVENT_WAIT_MS = 5000
+    # Used only for pages without the event bridge
+    POLL_INTERVAL = 0.1
+
     def __init__(
             self, 
             website_path: str = None, 
             language: str = "hi-IN",
-            wait_time: int = 10):
+            wait_time: int = 10,
+            endpointing: str = None,
+            remote_url: str = None):
         
-        """Initializes the STT class with the given website path and language."""
+        """Initializes the STT class with the given website path and language. `endpointing` is an aggressiveness preset (see Config.STT_ENDPOINT_PRESETS) or "off"; `remote_url` is a running WebDriver endpoint to use instead of launching Chrome locally."""
         if website_path is None:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             website_path = os.path.join(current_dir, "src", "index.html")
@@ -35,9 +45,17 @@ class SpeechToTextListener:
         self.chrome_options.add_argument("--headless=new")
         self.chrome_options.add_argument("--log-level=3")
         self.chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        self.driver = webdriver.Chrome(options=self.chrome_options)
+        if remote_url:
+            self.driver = webdriver.Remote(command_executor=remote_url, options=self.chrome_options)
+        else:
+            self.driver = webdriver.Chrome(options=self.chrome_options)
+        self.driver.set_script_timeout(self.EVENT_WAIT_MS / 1000 + 5)
         self.wait = WebDriverWait(self.driver, wait_time)
+        self.start_timeout = wait_time
         self.is_page_loaded = False
+        self._has_bridge = None
+        self.endpointer = create_endpointer(endpointing)
+        self.last_timing = {}
 
     def stream(self, content: str):
         """Prints the given content to the console in real-time."""
@@ -64,6 +82,104 @@ class SpeechToTextListener:
         selected_language = language_select.find_element(By.CSS_SELECTOR, "option:checked").get_attribute("value")
         return selected_language == self.language
 
+    def is_recording(self) -> bool:
+        return self.driver.find_element(By.ID, "is_recording").text.startswith("Recording: True")
+
+    def has_event_bridge(self) -> bool:
+        """True when the loaded page exposes window.nextSttEvents (the bundled index.html does)."""
+        if self._has_bridge is None:
+            self._has_bridge = bool(self.driver.execute_script("return typeof window.nextSttEvents === 'function';"))
+        return self._has_bridge
+
+    def next_events(self, timeout_ms: int = None) -> list:
+        """Blocks until the page reports transcript/recording changes, or `timeout_ms` passes, and returns them."""
+        return self.driver.execute_async_script(
+            "window.nextSttEvents(arguments[arguments.length - 1], arguments[0]);",
+            timeout_ms or self.EVENT_WAIT_MS
+        ) or []
+
+    def follow_recording(self, on_text, wait_for_start: bool = False) -> None:
+        """
+        Calls `on_text(transcript)` on every transcript change until the
+        current recording ends, or until the endpointer judges the utterance
+        complete (the page's recognition is then aborted). With
+        `wait_for_start` the recording has just been requested, so a start is
+        awaited first (up to `start_timeout`).
+        """
+        if not self.has_event_bridge():
+            self._poll_recording(on_text, wait_for_start)
+            return
+
+        endpointer = self.endpointer
+        if endpointer:
+            endpointer.reset()
+        self.last_timing = {}
+        last_text, changed_at = "", None
+        recording = False if wait_for_start else self.is_recording()
+        if not recording and not wait_for_start:
+            return
+
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            wait_ms = self.EVENT_WAIT_MS
+            if not recording:
+                wait_ms = max(1, min(wait_ms, int((deadline - time.monotonic()) * 1000)))
+            elif endpointer and endpointer.deadline() is not None:
+                # Wake up when the transcript would count as stable, not after a full long-poll window
+                wait_ms = max(1, min(wait_ms, int((endpointer.deadline() - time.time()) * 1000) + 1))
+            for event in self.next_events(wait_ms):
+                if event["type"] in ("transcript", "result"):
+                    # A "result" can be delivered ahead of the "transcript" event for the same text
+                    text = event["data"] if event["type"] == "transcript" else event["data"]["text"]
+                    if text and text != last_text:
+                        last_text, changed_at = text, event["t"] / 1000
+                        on_text(text)
+                    if endpointer and text:
+                        if event["type"] == "result":
+                            endpointer.on_result(event["data"]["final"], text, changed_at)
+                        else:
+                            endpointer.on_transcript(text, changed_at)
+                elif event["type"] == "recording":
+                    if event["data"]:
+                        recording = True
+                    elif recording:
+                        self._record_endpoint("recording_end", changed_at)
+                        return
+            if recording and endpointer:
+                reason = endpointer.complete()
+                if reason:
+                    self.driver.execute_script("if (window.endSttUtterance) { window.endSttUtterance(); }")
+                    self._record_endpoint(reason, changed_at)
+                    return
+            if not recording and time.monotonic() > deadline:
+                return
+
+    def _record_endpoint(self, reason, changed_at):
+        """
+        Fills last_timing for the utterance just ended. Speech is taken to
+        have ended when the transcript last changed, so end_of_speech_to_text_s
+        is the dead air the endpointing added (plus recognizer lag).
+        """
+        self.last_timing = {"endpoint": reason, "speech_end": None}
+        if changed_at is not None:
+            tail = max(0.0, time.time() - changed_at)
+            self.last_timing["speech_end"] = time.perf_counter() - tail
+            self.last_timing["end_of_speech_to_text_s"] = tail
+
+    def _poll_recording(self, on_text, wait_for_start: bool) -> None:
+        """Fallback for pages without the bridge: the old DOM polling loop, throttled."""
+        deadline = time.monotonic() + self.start_timeout
+        while wait_for_start and not self.is_recording() and time.monotonic() < deadline:
+            time.sleep(self.POLL_INTERVAL)
+
+        last_text = ""
+        while self.is_recording():
+            text = self.get_text()
+            if text and text != last_text:
+                on_text(text)
+                last_text = text
+            time.sleep(self.POLL_INTERVAL)
+
     def start_listening(self):
         """Initializes the listener directly. Broken out from main() for better control."""
         if self.website_path.startswith("http"):
@@ -93,15 +209,7 @@ class SpeechToTextListener:
              if self.start_listening():
                  self.initialized = True
         
-        is_recording = self.driver.find_element(By.ID, "is_recording")
-        final_text = ""
-        
-        while is_recording.text.startswith("Recording: True"):
-            text = self.get_text()
-            if text and text != final_text:
-                self.stream(text)
-                final_text = text
-            is_recording = self.driver.find_element(By.ID, "is_recording")
+        self.follow_recording(self.stream)
 
         return self.get_text()
         
@@ -117,54 +225,41 @@ class SpeechToTextListener:
 
         # print("\033[94m\rListening...", end='', flush=True)
         
-        is_recording_elem = self.driver.find_element(By.ID, "is_recording")
-        
-        last_text = ""
-        while is_recording_elem.text.startswith("Recording: True"):
-             text = self.get_text()
-             if text and text != last_text:
-                 self.stream(text)
-                 last_text = text
-             is_recording_elem = self.driver.find_element(By.ID, "is_recording")
+        self.follow_recording(self.stream)
         
         return self.get_text()
 
+    def load_page(self) -> bool:
+        """Loads the recognition page and selects the language; safe to call before the first run_cycle()."""
+        if not self.is_page_loaded:
+            if self.website_path.startswith("http"):
+                self.driver.get(self.website_path)
+            else:
+                self.driver.get("file:///" + self.website_path.replace("\\", "/"))
+            self.is_page_loaded = True
+
+        self.wait.until(EC.presence_of_element_located((By.ID, "language_select")))
+        self.select_language()
+        return self.verify_language_selection()
+
     def run_cycle(self, callback=None):
          """Replicates the user's `main` method logic exactly."""
-         if not self.is_page_loaded:
-             if self.website_path.startswith("http"):
-                 self.driver.get(self.website_path)
-             else:
-                 self.driver.get("file:///" + self.website_path.replace("\\", "/"))
-             self.is_page_loaded = True
-
-         self.wait.until(EC.presence_of_element_located((By.ID, "language_select")))
-         self.select_language()
-         if not self.verify_language_selection():
+         if not self.load_page():
              return None
              
-         self.driver.execute_script("document.getElementById('convert_text').innerHTML = '';")
+         self.driver.execute_script(
+             "document.getElementById('convert_text').innerHTML = '';"
+             "if (window.resetSttEvents) { window.resetSttEvents(); }"
+         )
          self.driver.find_element(By.ID, "click_to_record").click()
          
-         is_recording = self.wait.until(EC.presence_of_element_located((By.ID, "is_recording")))
-         
-         streamed = False
-         while is_recording.text.startswith("Recording: True"):
-            text = self.get_text()
-            if text:
-                if callback:
-                    callback(text)
-                else:
-                    self.stream(text)
-                streamed = True
-            is_recording = self.driver.find_element(By.ID, "is_recording")
-         
-         if streamed:
-            pass
-            # print()
+         self.follow_recording(callback or self.stream, wait_for_start=True)
          
          return self.get_text()
 
+    def close(self):
+        self.driver.quit()
+
 if __name__ == "__main__":
     listener = SpeechToTextListener(language="hi-IN")
     speech = listener.run_cycle()
@@ -0,0 +1,262 @@
+"""
+Offline speech to text: microphone frames -> Silero VAD endpointing -> faster-whisper.
+
+No browser and no remote recognizer. The VAD model ships with faster-whisper
+and costs well under a millisecond per 32 ms frame on CPU; Whisper itself
+only runs on speech, for periodic partial hypotheses while the user talks
+and once more for the final text when the VAD has heard enough silence.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Iterable
+
+import numpy as np
+from config import Config
+
+
+class WhisperListener:
+    """Drop-in alternative to SpeechToTextListener with the same run_cycle(callback) entry point."""
+
+    SAMPLE_RATE = 16000
+    # Silero VAD scores 512-sample (32 ms) windows at 16 kHz
+    FRAME_SAMPLES = 512
+    # Audio kept from before the VAD fires so the first syllable is not clipped
+    PRE_ROLL_MS = 300
+    # Consecutive voiced frames needed to count as the start of an utterance
+    MIN_SPEECH_FRAMES = 3
+    # Samples of the previous window the VAD sees in front of each frame, and its LSTM state size
+    VAD_CONTEXT_SAMPLES = 64
+    VAD_STATE_SHAPE = (1, 1, 128)
+
+    def __init__(
+            self,
+            model_size: str = Config.STT_MODEL_SIZE,
+            device: str = Config.STT_DEVICE,
+            compute_type: str = Config.STT_COMPUTE_TYPE,
+            language: str = Config.STT_LANGUAGE,
+            beam_size: int = Config.STT_BEAM_SIZE,
+            vad_threshold: float = Config.STT_VAD_THRESHOLD,
+            endpoint_silence_ms: int = Config.STT_ENDPOINT_SILENCE_MS,
+            partial_interval: float = Config.STT_PARTIAL_INTERVAL,
+            max_utterance: float = Config.STT_MAX_UTTERANCE,
+            start_timeout: float = Config.STT_START_TIMEOUT):
+
+        self.logger = logging.getLogger("WhisperListener")
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        # Whisper takes bare language codes ("en"), the web listener locales ("en-IN")
+        self.language = language.split("-")[0] if language else None
+        self.beam_size = beam_size
+        self.vad_threshold = vad_threshold
+        self.endpoint_frames = max(1, round(endpoint_silence_ms / self.frame_ms))
+        self.pre_roll_frames = max(1, round(self.PRE_ROLL_MS / self.frame_ms))
+        self.partial_interval = partial_interval
+        self.max_frames = round(max_utterance * 1000 / self.frame_ms)
+        self.start_timeout = start_timeout
+
+        self.model = None
+        self.vad = None
+        self._load_lock = threading.Lock()
+        self._audio = None
+        self._vad_state = None
+        self.last_timing = {}
+
+    @property
+    def frame_ms(self) -> float:
+        return self.FRAME_SAMPLES * 1000 / self.SAMPLE_RATE
+
+    def load_model(self):
+        """Loads Whisper and the VAD once; safe to call from several threads."""
+        with self._load_lock:
+            if self.model is None:
+                from faster_whisper import WhisperModel
+                from faster_whisper.vad import get_vad_model
+
+                started = time.perf_counter()
+                self.model = WhisperModel(self.model_size, device=self.device, compute_type=self.compute_type)
+                self.vad = get_vad_model()
+                self.logger.info(
+                    f"Loaded whisper {self.model_size} ({self.device}, {self.compute_type}) "
+                    f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+                )
+        return self.model
+
+    def warm_up(self) -> str:
+        """Loads the models and runs one decode, so the first utterance does not pay for either."""
+        started = time.perf_counter()
+        self.load_model()
+        self.transcribe(np.zeros(self.SAMPLE_RATE, dtype=np.float32), beam_size=1)
+        return f"whisper {self.model_size} {self.compute_type} ready in {(time.perf_counter() - started) * 1000:.0f} ms"
+
+    def reset_vad(self):
+        """Starts the VAD cold (zero LSTM state, silent context); done once per utterance."""
+        self._vad_state = (
+            np.zeros(self.VAD_STATE_SHAPE, dtype=np.float32),
+            np.zeros(self.VAD_STATE_SHAPE, dtype=np.float32),
+            np.zeros(self.VAD_CONTEXT_SAMPLES, dtype=np.float32)
+        )
+
+    def speech_probability(self, frame: np.ndarray) -> float:
+        """
+        Scores one frame with Silero as the streaming model it is: the LSTM
+        state and the context samples carry over from the previous frame.
+        (SileroVADModel.__call__ restarts from zero state on every call.)
+        """
+        if self._vad_state is None:
+            self.reset_vad()
+        h, c, context = self._vad_state
+        window = np.concatenate((context, frame))[np.newaxis, :]
+        output, h, c = self.vad.session.run(None, {"input": window, "h": h, "c": c})
+        self._vad_state = (h, c, frame[-self.VAD_CONTEXT_SAMPLES:])
+        return float(np.ravel(output)[-1])
+
+    def transcribe(self, audio: np.ndarray, beam_size: int = None) -> str:
+        segments, _ = self.model.transcribe(
+            audio,
+            language=self.language,
+            beam_size=beam_size or self.beam_size,
+            condition_on_previous_text=False,
+            without_timestamps=True,
+            vad_filter=False
+        )
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    def listen_frames(self, frames: Iterable[np.ndarray], on_text=None) -> str:
+        """
+        Endpoints one utterance from an iterable of float32 FRAME_SAMPLES-long
+        frames and returns its text ("" if nobody spoke within start_timeout).
+        Partial hypotheses go to on_text while the user is still speaking.
+        """
+        self.load_model()
+        timing = {"partials": 0, "partial_decode_s": 0.0}
+        pre_roll, speech = [], []
+        voiced_run = silence_run = 0
+        self.reset_vad()
+        waited_frames = 0
+        start_limit = round(self.start_timeout * 1000 / self.frame_ms)
+        last_voiced_at = None
+        next_partial = self.partial_interval
+        interval = self.partial_interval
+
+        for frame in frames:
+            is_voiced = self.speech_probability(frame) >= self.vad_threshold
+
+            if not speech:
+                pre_roll.append(frame)
+                voiced_run = voiced_run + 1 if is_voiced else 0
+                if voiced_run >= self.MIN_SPEECH_FRAMES:
+                    speech = pre_roll[-(self.pre_roll_frames + voiced_run):]
+                    last_voiced_at = time.perf_counter()
+                else:
+                    del pre_roll[:-(self.pre_roll_frames + self.MIN_SPEECH_FRAMES)]
+                    waited_frames += 1
+                    if waited_frames >= start_limit:
+                        self.last_timing = timing
+                        return ""
+                continue
+
+            speech.append(frame)
+            if is_voiced:
+                silence_run = 0
+                last_voiced_at = time.perf_counter()
+            else:
+                silence_run += 1
+            if silence_run >= self.endpoint_frames or len(speech) >= self.max_frames:
+                break
+
+            heard = len(speech) * self.FRAME_SAMPLES / self.SAMPLE_RATE
+            if on_text and heard >= next_partial:
+                started = time.perf_counter()
+                text = self.transcribe(np.concatenate(speech), beam_size=1)
+                elapsed = time.perf_counter() - started
+                timing["partials"] += 1
+                timing["partial_decode_s"] += elapsed
+                if text:
+                    on_text(text)
+                # Decoding the growing buffer gets slower; never spend more than half the time decoding partials
+                interval = max(interval, 2 * elapsed)
+                next_partial = heard + interval
+
+        if not speech:
+            self.last_timing = timing
+            return ""
+
+        # Trailing silence is not sent to Whisper
+        audio = np.concatenate(speech[:len(speech) - silence_run] if silence_run else speech)
+        started = time.perf_counter()
+        text = self.transcribe(audio)
+        finished = time.perf_counter()
+        timing["speech_s"] = len(audio) / self.SAMPLE_RATE
+        timing["final_decode_s"] = finished - started
+        timing["rtf"] = timing["final_decode_s"] / timing["speech_s"]
+        # Last voiced frame seen -> text returned: endpoint hang time plus the final decode
+        timing["end_of_speech_to_text_s"] = finished - last_voiced_at
+        timing["speech_end"] = last_voiced_at
+        self.last_timing = timing
+        if text and on_text:
+            on_text(text)
+        return text
+
+    def paced_frames(self, audio: np.ndarray, realtime: bool = True):
+        """Yields frames of recorded audio, at the rate a microphone would deliver them unless `realtime` is off."""
+        frame_seconds = self.FRAME_SAMPLES / self.SAMPLE_RATE
+        started = time.perf_counter()
+        for index in range(len(audio) // self.FRAME_SAMPLES):
+            if realtime:
+                delay = started + index * frame_seconds - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            yield audio[index * self.FRAME_SAMPLES:(index + 1) * self.FRAME_SAMPLES]
+
+    def microphone_frames(self, stop: threading.Event):
+        """Yields microphone frames; a capture thread keeps reading while Whisper decodes."""
+        import pyaudio
+
+        if self._audio is None:
+            self._audio = pyaudio.PyAudio()
+        stream = self._audio.open(format=pyaudio.paInt16, channels=1, rate=self.SAMPLE_RATE,
+                                  input=True, frames_per_buffer=self.FRAME_SAMPLES)
+        frames = queue.Queue()
+
+        def capture():
+            while not stop.is_set():
+                data = stream.read(self.FRAME_SAMPLES, exception_on_overflow=False)
+                frames.put(np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0)
+
+        thread = threading.Thread(target=capture, name="WhisperCapture", daemon=True)
+        thread.start()
+        try:
+            while True:
+                yield frames.get()
+        finally:
+            stop.set()
+            thread.join()
+            stream.stop_stream()
+            stream.close()
+
+    def stream(self, content: str):
+        """Prints the given content to the console in real-time."""
+        print(f"\r\033[96mUser Speaking:\033[0m {content}", end='', flush=True)
+
+    def run_cycle(self, callback=None) -> str:
+        stop = threading.Event()
+        frames = self.microphone_frames(stop)
+        try:
+            return self.listen_frames(frames, callback or self.stream)
+        finally:
+            frames.close()
+
+    def close(self):
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
+
+
+if __name__ == "__main__":
+    listener = WhisperListener()
+    speech = listener.run_cycle()
+    print("FINAL EXTRACTION: ", speech)
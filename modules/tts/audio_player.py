@@ -0,0 +1,192 @@
+import io
+import logging
+import threading
+import time
+from collections import deque
+
+from config import Config
+
+
+class PCMRingBuffer:
+    """
+    Fixed-capacity byte ring. write() blocks while the ring is full (unless
+    cleared), read() returns whatever is available up to the requested size.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = bytearray(capacity)
+        self.start = 0
+        self.size = 0
+        self.generation = 0
+        self.cond = threading.Condition()
+
+    def write(self, chunk):
+        """Returns False if the ring was cleared before all of `chunk` fit."""
+        view = memoryview(chunk)
+        with self.cond:
+            generation = self.generation
+            while view:
+                while self.size == self.capacity and generation == self.generation:
+                    self.cond.wait()
+                if generation != self.generation:
+                    return False
+                end = (self.start + self.size) % self.capacity
+                count = min(len(view), self.capacity - self.size, self.capacity - end)
+                self.data[end:end + count] = view[:count]
+                self.size += count
+                view = view[count:]
+                self.cond.notify_all()
+        return True
+
+    def read(self, count):
+        with self.cond:
+            count = min(count, self.size, self.capacity - self.start)
+            chunk = bytes(self.data[self.start:self.start + count])
+            self.start = (self.start + count) % self.capacity
+            self.size -= count
+            self.cond.notify_all()
+            return chunk
+
+    def clear(self):
+        with self.cond:
+            self.start = self.size = 0
+            self.generation += 1
+            self.cond.notify_all()
+
+    def __len__(self):
+        return self.size
+
+
+class AudioPlayer:
+    """
+    In-process, interruptible audio output on one pygame mixer channel.
+
+    Encoded clips (edge-tts MP3) are decoded to PCM with the mixer's own
+    decoder and written into a ring buffer. A playback thread hands the
+    channel `chunk_ms` slices, never more than one ahead of the slice that
+    is playing, so stop() and pause() are heard within one slice. The
+    channel is fed continuously, so consecutive clips play without gaps.
+    """
+
+    def __init__(self, buffer_seconds=Config.AUDIO_BUFFER_SECONDS, chunk_ms=Config.AUDIO_CHUNK_MS):
+        import pygame
+
+        self.logger = logging.getLogger("AudioPlayer")
+        self.pygame = pygame
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        frequency, size, channels = pygame.mixer.get_init()
+        self.bytes_per_second = frequency * (abs(size) // 8) * channels
+        frame_bytes = (abs(size) // 8) * channels
+        self.chunk_bytes = max(frame_bytes, int(self.bytes_per_second * chunk_ms / 1000) // frame_bytes * frame_bytes)
+        self.ring = PCMRingBuffer(int(self.bytes_per_second * buffer_seconds) // frame_bytes * frame_bytes)
+        self.channel = pygame.mixer.Channel(0)
+        pygame.mixer.set_reserved(1)
+
+        self._lock = threading.Condition()
+        self._pending = deque()  # byte lengths of the slices currently on the channel
+        self._played_bytes = 0
+        self._slice_started = None
+        self._paused_at = None
+        self._paused = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="AudioPlayer", daemon=True)
+        self._thread.start()
+
+    def decode(self, encoded):
+        """Any format the mixer can load (MP3, WAV, OGG) -> raw PCM in the mixer's output format."""
+        return self.pygame.mixer.Sound(file=io.BytesIO(encoded)).get_raw()
+
+    def play(self, encoded):
+        """
+        Queues a clip behind whatever is playing and returns once it has all
+        been handed to the channel (its last slice may still be sounding);
+        wait() blocks until playback is silent. Returns False if stopped.
+        """
+        return self.ring.write(self.decode(encoded))
+
+    def wait(self):
+        with self._lock:
+            while (len(self.ring) or self._pending) and not self._closed:
+                self._lock.wait(0.05)
+
+    def stop(self):
+        """Drops everything queued and silences the channel immediately."""
+        self.ring.clear()
+        with self._lock:
+            self.channel.stop()
+            self._pending.clear()
+            self._slice_started = None
+            self._paused = False
+            self._paused_at = None
+            self._lock.notify_all()
+
+    def pause(self):
+        with self._lock:
+            if not self._paused:
+                self._paused = True
+                self._paused_at = time.perf_counter()
+                self.channel.pause()
+
+    def resume(self):
+        with self._lock:
+            if self._paused:
+                self._paused = False
+                if self._slice_started is not None:
+                    self._slice_started += time.perf_counter() - self._paused_at
+                self._paused_at = None
+                self.channel.unpause()
+                self._lock.notify_all()
+
+    def is_playing(self):
+        with self._lock:
+            return bool(self._pending) and not self._paused
+
+    def position(self):
+        """Seconds of audio played since the player was created (pauses excluded)."""
+        with self._lock:
+            played = self._played_bytes / self.bytes_per_second
+            if self._pending and self._slice_started is not None:
+                now = self._paused_at or time.perf_counter()
+                current = self._pending[0] / self.bytes_per_second
+                played += min(max(0.0, now - self._slice_started), current)
+            return played
+
+    def queued_seconds(self):
+        """Audio written but not yet played."""
+        with self._lock:
+            return (len(self.ring) + sum(self._pending)) / self.bytes_per_second
+
+    def close(self):
+        self.stop()
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+
+    def _run(self):
+        tick = self.chunk_bytes / self.bytes_per_second / 4
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                if not self._paused:
+                    self._retire_finished_slices()
+                    if len(self._pending) < 2 and len(self.ring):
+                        chunk = self.ring.read(self.chunk_bytes)
+                        sound = self.pygame.mixer.Sound(buffer=chunk)
+                        if self._pending:
+                            self.channel.queue(sound)
+                        else:
+                            self.channel.play(sound)
+                            self._slice_started = time.perf_counter()
+                        self._pending.append(len(chunk))
+                        continue
+                self._lock.wait(tick)
+
+    def _retire_finished_slices(self):
+        on_channel = int(self.channel.get_busy()) + int(self.channel.get_queue() is not None)
+        while len(self._pending) > on_channel:
+            self._played_bytes += self._pending.popleft()
+            self._slice_started = time.perf_counter() if self._pending else None
+            self._lock.notify_all()
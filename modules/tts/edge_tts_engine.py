@@ -1,8 +1,12 @@
 import os
 import time
+import queue
 import logging
+import threading
 import subprocess
-from playsound import playsound
+from config import Config
+from modules.tts.sentence_chunker import split_sentences
+from modules.tts.phrase_cache import PhraseCache
 
 class EdgeTTS:
     def __init__(self, temp_folder="temp"):
@@ -11,37 +15,89 @@ class EdgeTTS:
         if not os.path.exists(self.temp_folder):
             os.makedirs(self.temp_folder)
         self.current_file = None
+        self.pipelined = Config.TTS_PIPELINED
+        self.lookahead = Config.TTS_LOOKAHEAD
+        self.last_timing = {}
+        self._stop_event = threading.Event()
+        self._player = None
+        self._player_error = None
+        self.cache = None
+        if Config.TTS_CACHE_ENABLED:
+            self.cache = PhraseCache(
+                cache_dir=Config.TTS_CACHE_DIR,
+                max_bytes=Config.TTS_CACHE_MAX_MB * 1024 * 1024,
+                engine="edge-tts"
+            )
 
     def speak(self, text: str, voice: str = 'en-IE-EmilyNeural') -> None:
         if not text:
             return
 
+        if self.pipelined:
+            self.speak_pipelined(text, voice)
+        else:
+            self.speak_single(text, voice)
+
+    def speak_single(self, text: str, voice: str = 'en-IE-EmilyNeural') -> None:
+        """Synthesizes the whole text to one MP3 file, then plays it."""
+        if not text:
+            return
+
+        started = time.perf_counter()
+        self._stop_event.clear()
+
+        cached = self.cache.get(text, voice) if self.cache else None
+        if cached:
+            self.logger.info(f"TTS cache hit: {text[:50]}...")
+            first_audio = time.perf_counter()
+            try:
+                self._play_bytes(cached)
+                self.wait()
+            except Exception as e:
+                self.logger.error(f"Playback Error: {e}")
+            self.last_timing = {
+                "time_to_first_audio": first_audio - started,
+                "total": time.perf_counter() - started,
+                "chunks": 1
+            }
+            return
+
         try:
             timestamp = int(time.time())
             audio_file = os.path.join(self.temp_folder, f"tts_{timestamp}.mp3")
-            
+
             audio_file = os.path.abspath(audio_file)
-            
+
             self.logger.info(f"Generating TTS: {text[:50]}...")
-            
+
             import edge_tts
             import asyncio
-            
+
             async def _gen():
                 comm = edge_tts.Communicate(text, voice)
                 await comm.save(audio_file)
-            
+
             asyncio.run(_gen())
 
             if os.path.exists(audio_file):
+                if self.cache and self.cache.cacheable(text):
+                    with open(audio_file, "rb") as f:
+                        self.cache.put(text, voice, f.read())
+
                 self.logger.info("Playing audio...")
                 self.current_file = audio_file
+                first_audio = time.perf_counter()
                 try:
-                    playsound(audio_file)
+                    self._play_file(audio_file)
                 except Exception as e:
                     self.logger.error(f"Playback Error: {e}")
                 finally:
-                    self.stop() 
+                    self.stop()
+                self.last_timing = {
+                    "time_to_first_audio": first_audio - started,
+                    "total": time.perf_counter() - started,
+                    "chunks": 1
+                }
             else:
                 self.logger.error("Audio file was not generated.")
 
@@ -49,9 +105,173 @@ class EdgeTTS:
             self.logger.error(f"TTS Error: {e}")
             self.stop()
 
+    def speak_pipelined(self, text: str, voice: str = 'en-IE-EmilyNeural') -> None:
+        """Splits text into sentences and plays them through the synthesis pipeline."""
+        self.speak_sentences(split_sentences(text), voice)
+
+    def speak_sentences(self, sentences, voice: str = 'en-IE-EmilyNeural') -> None:
+        """
+        Synthesizes chunk N+1 while chunk N plays. `sentences` may be any
+        iterable, including a blocking generator fed by a streaming LLM.
+        At most `lookahead` synthesized chunks wait in memory at a time.
+        """
+        self._stop_event.clear()
+        started = time.perf_counter()
+        first_audio = None
+        chunks = 0
+        ready = queue.Queue(maxsize=max(1, self.lookahead))
+
+        producer = threading.Thread(target=self._synthesize_worker, args=(sentences, voice, ready), daemon=True)
+        producer.start()
+
+        while True:
+            audio = ready.get()
+            if audio is None:
+                break
+            if self._stop_event.is_set():
+                continue
+            if first_audio is None:
+                first_audio = time.perf_counter()
+            chunks += 1
+            try:
+                self._play_bytes(audio)
+            except Exception as e:
+                self.logger.error(f"Playback Error: {e}")
+
+        producer.join()
+        self.wait()
+        self.last_timing = {
+            "time_to_first_audio": (first_audio - started) if first_audio else None,
+            "first_audio_at": first_audio,
+            "total": time.perf_counter() - started,
+            "chunks": chunks
+        }
+
+    def _synthesize_worker(self, sentences, voice, ready):
+        try:
+            for sentence in sentences:
+                if self._stop_event.is_set():
+                    break
+                if not sentence or not sentence.strip():
+                    continue
+                audio = self.synthesize(sentence, voice)
+                if audio:
+                    ready.put(audio)
+        except Exception as e:
+            self.logger.error(f"TTS Error: {e}")
+        finally:
+            ready.put(None)
+
+    def synthesize(self, text: str, voice: str = 'en-IE-EmilyNeural') -> bytes:
+        """Returns the encoded MP3 for `text`, from the phrase cache when possible."""
+        if self.cache:
+            cached = self.cache.get(text, voice)
+            if cached:
+                self.logger.info(f"TTS cache hit: {text[:50]}...")
+                return cached
+
+        self.logger.info(f"Generating TTS: {text[:50]}...")
+
+        import edge_tts
+        import asyncio
+
+        async def _gen():
+            audio = bytearray()
+            comm = edge_tts.Communicate(text, voice)
+            async for chunk in comm.stream():
+                if chunk["type"] == "audio":
+                    audio.extend(chunk["data"])
+            return bytes(audio)
+
+        audio = asyncio.run(_gen())
+        if self.cache:
+            self.cache.put(text, voice, audio)
+        return audio
+
+    def warm_up(self, voice: str = 'en-IE-EmilyNeural', phrases=()) -> str:
+        """
+        Checks `voice` against the voices edge-tts offers, opens the audio
+        device and pre-synthesizes `phrases` into the phrase cache.
+        """
+        import edge_tts
+        import asyncio
+
+        voices = asyncio.run(edge_tts.list_voices())
+        if not any(v.get("ShortName") == voice for v in voices):
+            raise ValueError(f"voice {voice} is not offered by edge-tts")
+
+        details = [f"voice {voice} resolved"]
+        if self.player() is not None:
+            details.append("audio player open")
+        else:
+            details.append(f"no in-memory player ({self._player_error})")
+
+        if self.cache:
+            missing = [p for p in phrases if self.cache.cacheable(p) and not self.cache.get(p, voice)]
+            for phrase in missing:
+                self.synthesize(phrase, voice)
+            if missing:
+                details.append(f"{len(missing)} phrases cached")
+        return ", ".join(details)
+
+    def player(self):
+        """The interruptible PCM player, created on first use; None when pygame cannot open a device."""
+        if self._player is None and self._player_error is None:
+            try:
+                from modules.tts.audio_player import AudioPlayer
+                self._player = AudioPlayer()
+            except Exception as e:
+                self._player_error = e
+                self.logger.warning(f"In-memory audio player unavailable, falling back to playsound: {e}")
+        return self._player
+
+    def _play_file(self, audio_file):
+        if self.player() is not None:
+            with open(audio_file, "rb") as f:
+                self._play_bytes(f.read())
+            self.wait()
+            return
+        from playsound import playsound
+        playsound(audio_file)
+
+    def _play_bytes(self, audio):
+        """Queues a clip behind the one playing (gapless); wait() blocks until it has been heard."""
+        player = self.player()
+        if player is None:
+            # No in-memory player available; fall back to a temp file
+            audio_file = os.path.abspath(os.path.join(self.temp_folder, f"tts_{time.time_ns()}.mp3"))
+            with open(audio_file, "wb") as f:
+                f.write(audio)
+            self.current_file = audio_file
+            try:
+                self._play_file(audio_file)
+            finally:
+                self._remove_current_file()
+            return
+
+        if not self._stop_event.is_set():
+            player.play(audio)
+
     def stop(self):
-        """Stops playback (if possible) and cleans up temporary files."""
-        
+        """Cuts playback off within one player slice and cleans up temporary files."""
+        self._stop_event.set()
+        if self._player is not None:
+            self._player.stop()
+        self._remove_current_file()
+
+    def pause(self):
+        if self._player is not None:
+            self._player.pause()
+
+    def resume(self):
+        if self._player is not None:
+            self._player.resume()
+
+    def position(self):
+        """Seconds of speech played so far (by the in-memory player), or None without one."""
+        return self._player.position() if self._player is not None else None
+
+    def _remove_current_file(self):
         if self.current_file and os.path.exists(self.current_file):
             try:
                 os.remove(self.current_file)
@@ -61,14 +281,10 @@ class EdgeTTS:
             self.current_file = None
 
     def wait(self):
-        """
-        playsound is synchronized (blocking) by default on Windows,
-        so explicit waiting is not strictly necessary unless threaded.
-        Keeping method for compatibility.
-        """
-        pass
+        """Blocks until queued audio has finished playing (playsound is already blocking)."""
+        if self._player is not None:
+            self._player.wait()
 
 if __name__ == "__main__":
     tts = EdgeTTS(temp_folder="../../temp")
     tts.speak("Hello, I have been updated to use the simpler playsound method.")
-
@@ -0,0 +1,125 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+
+class PhraseCache:
+    """
+    Content-addressed on-disk cache of synthesized audio.
+
+    Entries are keyed by (normalized text, voice, engine) and stored as
+    `<sha256>.mp3` files. The directory is bounded to `max_bytes`; the least
+    recently used entries are evicted first. Recency is kept in file mtimes
+    so the LRU order survives restarts without a separate index file.
+    """
+
+    def __init__(self, cache_dir="cache/tts", max_bytes=50 * 1024 * 1024, engine="edge-tts", max_chars=200):
+        self.logger = logging.getLogger("PhraseCache")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.engine = engine
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        files = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith(".mp3") and os.path.isfile(path):
+                stat = os.stat(path)
+                files.append((stat.st_mtime, name[:-4], stat.st_size))
+            elif name.endswith(".tmp"):
+                # Leftover from an interrupted write
+                os.remove(path)
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def normalize(text):
+        text = unicodedata.normalize("NFKC", text)
+        return re.sub(r"\s+", " ", text).strip()
+
+    def key(self, text, voice):
+        raw = f"{self.engine}\0{voice}\0{self.normalize(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def cacheable(self, text):
+        return 0 < len(self.normalize(text)) <= self.max_chars
+
+    def get(self, text, voice):
+        if not self.cacheable(text):
+            return None
+
+        key = self.key(text, voice)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    audio = f.read()
+                os.utime(path)
+            except OSError as e:
+                self.logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+                self._total_bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def put(self, text, voice, audio):
+        if not audio or not self.cacheable(text):
+            return
+
+        key = self.key(text, voice)
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        with self._lock:
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(audio)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                self.logger.warning(f"Failed to cache phrase: {e}")
+                return
+
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(audio)
+            self._total_bytes += len(audio)
+            self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes
+        }
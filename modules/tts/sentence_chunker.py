@@ -0,0 +1,46 @@
+import re
+
+# A sentence ends at . ! ? (or the Devanagari danda) followed by whitespace,
+# optionally after closing quotes/brackets.
+SENTENCE_BOUNDARY = re.compile(r'[.!?।]+["\'\)\]]*\s+')
+
+ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "etc.", "e.g.", "i.e.", "no."}
+
+
+class SentenceChunker:
+    """Incrementally splits streamed text into complete sentences.
+
+    `feed()` returns the sentences completed by the new delta, `flush()`
+    returns whatever is left once the stream ends. Fragments shorter than
+    `min_chars` are held back and merged into the following sentence so TTS
+    doesn't synthesize one-word clips.
+    """
+
+    def __init__(self, min_chars=12):
+        self.min_chars = min_chars
+        self.buffer = ""
+
+    def feed(self, delta):
+        self.buffer += delta
+        sentences = []
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(self.buffer):
+            candidate = self.buffer[start:match.end()].strip()
+            last_word = candidate.rsplit(" ", 1)[-1].lower()
+            if last_word in ABBREVIATIONS or len(candidate) < self.min_chars:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self.buffer = self.buffer[start:]
+        return sentences
+
+    def flush(self):
+        tail = self.buffer.strip()
+        self.buffer = ""
+        return [tail] if tail else []
+
+
+def split_sentences(text, min_chars=12):
+    """Splits a finished text into sentences using the same rules as SentenceChunker."""
+    chunker = SentenceChunker(min_chars=min_chars)
+    return chunker.feed(text + " ") + chunker.flush()
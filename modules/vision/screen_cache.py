@@ -0,0 +1,122 @@
+import threading
+import time
+
+from config import Config
+from managers.intent_engine import tokenize
+
+# dHash compares each pixel with its right neighbour on a 9x8 grayscale thumbnail: 64 bits
+HASH_WIDTH, HASH_HEIGHT = 9, 8
+
+
+def _dhash_block(pixels, stride, left, top):
+    bits = 0
+    for y in range(top, top + HASH_HEIGHT):
+        row = y * stride
+        for x in range(left, left + HASH_WIDTH - 1):
+            bits = (bits << 1) | (pixels[row + x] > pixels[row + x + 1])
+    return bits
+
+
+def screen_hashes(image, tiles=0):
+    """
+    Returns (dhash, tile_hashes) for a PIL image. With `tiles` = n the
+    screen is also split into an n x n grid and each cell gets its own
+    dHash, so a change confined to one corner is still visible.
+    """
+    from PIL import Image
+
+    gray = image.convert("L")
+    small = gray.resize((HASH_WIDTH, HASH_HEIGHT), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    whole = _dhash_block(small.tobytes(), HASH_WIDTH, 0, 0)
+    if not tiles:
+        return whole, ()
+
+    grid = gray.resize((HASH_WIDTH * tiles, HASH_HEIGHT * tiles), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    pixels, stride = grid.tobytes(), HASH_WIDTH * tiles
+    tile_hashes = tuple(
+        _dhash_block(pixels, stride, col * HASH_WIDTH, row * HASH_HEIGHT)
+        for row in range(tiles) for col in range(tiles)
+    )
+    return whole, tile_hashes
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def changed_tiles(before, after, tolerance):
+    """Indices (row-major) of the tiles whose hashes differ by more than `tolerance` bits."""
+    if not before or len(before) != len(after):
+        return list(range(len(after)))
+    return [index for index, (a, b) in enumerate(zip(before, after)) if hamming(a, b) > tolerance]
+
+
+def normalize_prompt(prompt):
+    # Quotes around the embedded user question would otherwise stick to its first and last words
+    return " ".join(filter(None, (token.strip("'") for token in tokenize(prompt or ""))))
+
+
+class ScreenAnalysisCache:
+    """
+    Remembers VLM answers keyed by (screen hash, normalized question).
+
+    A lookup matches an entry younger than `ttl` for the same question whose
+    whole-screen hash is within `tolerance` bits, and, when tiles are used,
+    none of whose tiles moved by more than `tolerance` bits either (a new
+    notification in one corner barely moves the global hash).
+    """
+
+    def __init__(self, ttl=Config.VLM_CACHE_TTL, tolerance=Config.VLM_CACHE_TOLERANCE,
+                 tiles=Config.VLM_CACHE_TILES, max_entries=Config.VLM_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.tolerance = tolerance
+        self.tiles = tiles
+        self.max_entries = max_entries
+        self.entries = []
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def hash(self, image):
+        return screen_hashes(image, self.tiles)
+
+    def _matches(self, entry, prompt, whole, tile_hashes):
+        if entry["prompt"] != prompt or hamming(entry["hash"], whole) > self.tolerance:
+            return False
+        return not tile_hashes or not changed_tiles(entry["tiles"], tile_hashes, self.tolerance)
+
+    def get(self, hashes, prompt):
+        whole, tile_hashes = hashes
+        prompt = normalize_prompt(prompt)
+        now = time.time()
+        with self._lock:
+            self.entries = [entry for entry in self.entries if now - entry["stored"] < self.ttl]
+            for entry in reversed(self.entries):
+                if self._matches(entry, prompt, whole, tile_hashes):
+                    self.hits += 1
+                    return entry["answer"]
+            self.misses += 1
+            return None
+
+    def put(self, hashes, prompt, answer):
+        whole, tile_hashes = hashes
+        with self._lock:
+            self.entries.append({
+                "hash": whole, "tiles": tile_hashes, "prompt": normalize_prompt(prompt),
+                "answer": answer, "stored": time.time()
+            })
+            del self.entries[:-self.max_entries]
+
+    def invalidate(self):
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,129 @@
+import base64
+import logging
+import platform
+import time
+from collections import namedtuple
+from io import BytesIO
+
+from config import Config
+
+CaptureResult = namedtuple("CaptureResult", [
+    "image_b64", "format", "size", "source_size", "capture_ms", "scale_ms", "encode_ms", "payload_bytes"
+])
+
+# A grabbed, downscaled screen that has not been encoded yet
+Frame = namedtuple("Frame", ["image", "source_size", "capture_ms", "scale_ms"])
+
+
+def active_window_bbox():
+    """(left, top, right, bottom) of the foreground window, or None where that cannot be asked."""
+    if platform.system() != "Windows":
+        return None
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    rect = wintypes.RECT()
+    hwnd = user32.GetForegroundWindow()
+    if not hwnd or not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        return None
+    if rect.right <= rect.left or rect.bottom <= rect.top:
+        return None
+    return rect.left, rect.top, rect.right, rect.bottom
+
+
+class ScreenCapture:
+    """
+    Screenshot -> downscale -> encode -> base64 for vision-model requests.
+
+    The vision model resizes whatever it gets to a few hundred pixels per
+    slice, so sending a 4K PNG only costs encode time and payload. The
+    longest side is reduced to `max_side` first (cheap box reduction, then
+    a bilinear resize), and the result is encoded as JPEG or WebP at
+    `quality` (PNG is kept as an option). The encode buffer is reused
+    between calls and base64 reads straight from it.
+    """
+
+    FORMATS = {"JPEG": "jpeg", "WEBP": "webp", "PNG": "png"}
+
+    def __init__(self, max_side=Config.VLM_MAX_SIDE, image_format=Config.VLM_IMAGE_FORMAT,
+                 quality=Config.VLM_IMAGE_QUALITY, region=Config.VLM_CAPTURE_REGION):
+        self.logger = logging.getLogger("ScreenCapture")
+        self.max_side = max_side
+        self.format = image_format.upper()
+        if self.format not in self.FORMATS:
+            raise ValueError(f"Unsupported image format '{image_format}' (expected one of {', '.join(self.FORMATS)})")
+        self.quality = quality
+        # None = whole screen, "active" = foreground window, or a (left, top, right, bottom) box
+        self.region = region
+        self._buffer = BytesIO()
+
+    def bbox(self, region=None):
+        region = region if region is not None else self.region
+        if region == "active":
+            box = active_window_bbox()
+            if box is None:
+                self.logger.debug("Active-window capture unavailable here; using the whole screen")
+            return box
+        return tuple(region) if region else None
+
+    def grab(self, region=None):
+        from PIL import ImageGrab
+        return ImageGrab.grab(bbox=self.bbox(region), all_screens=False)
+
+    def downscale(self, image):
+        if not self.max_side or max(image.size) <= self.max_side:
+            return image
+        from PIL import Image
+
+        scale = self.max_side / max(image.size)
+        target = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        # reducing_gap box-reduces by an integer factor first, so the filtered resize only sees ~2x the target
+        return image.resize(target, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+    def encode(self, image):
+        """Encodes into the reused buffer and returns the base64 text."""
+        if self.format != "PNG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        buffer = self._buffer
+        buffer.seek(0)
+        buffer.truncate()
+        if self.format == "PNG":
+            image.save(buffer, format="PNG", compress_level=1)
+        elif self.format == "WEBP":
+            image.save(buffer, format="WEBP", quality=self.quality, method=0)
+        else:
+            image.save(buffer, format="JPEG", quality=self.quality)
+        return base64.b64encode(buffer.getbuffer()).decode("ascii"), buffer.tell()
+
+    def scale(self, image, capture_ms=0.0):
+        started = time.perf_counter()
+        scaled = self.downscale(image)
+        return Frame(scaled, image.size, capture_ms, (time.perf_counter() - started) * 1000)
+
+    def encode_frame(self, frame):
+        started = time.perf_counter()
+        image_b64, encoded_bytes = self.encode(frame.image)
+        return CaptureResult(
+            image_b64=image_b64,
+            format=self.format,
+            size=frame.image.size,
+            source_size=frame.source_size,
+            capture_ms=frame.capture_ms,
+            scale_ms=frame.scale_ms,
+            encode_ms=(time.perf_counter() - started) * 1000,
+            payload_bytes=len(image_b64)
+        )
+
+    def process(self, image, capture_ms=0.0):
+        return self.encode_frame(self.scale(image, capture_ms))
+
+    def grab_frame(self, region=None):
+        """Grabs and downscales the screen (or region); encode_frame() turns it into a request image."""
+        started = time.perf_counter()
+        image = self.grab(region)
+        return self.scale(image, (time.perf_counter() - started) * 1000)
+
+    def capture(self, region=None):
+        """Grabs the screen (or region) and returns a CaptureResult ready for the request body."""
+        return self.encode_frame(self.grab_frame(region))
@@ -0,0 +1,222 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from config import Config
+
+NOT_MODIFIED = object()
+
+
+class ToolFetchError(Exception):
+    """Raised by a tool loader when the API answered with an error; errors are never cached."""
+
+
+class ToolResultCache:
+    """
+    Shared cache of tool API responses, keyed on the tool name and its
+    normalized parameters (never on API keys).
+
+    An entry younger than the tool's TTL is served directly. Between TTL and
+    TTL + stale window it is still served, but a background refresh is started
+    so the next ask is fresh (stale-while-revalidate). Older entries are
+    refetched synchronously, sending the stored ETag / Last-Modified so the
+    API can answer 304. If a refetch fails, whatever is stored is served
+    rather than an error. Entries persist to a JSON file across restarts;
+    anything older than `max_age` seconds is dropped when the file is loaded.
+    The file also keeps the last day's API call times, so the hourly
+    prefetch budget (calls_in_window) survives a restart.
+    """
+
+    def __init__(self, path=Config.TOOL_CACHE_FILE, ttls=None, max_age=86400):
+        self.logger = logging.getLogger("ToolResultCache")
+        self.path = path
+        self.ttls = ttls or Config.TOOL_CACHE_TTLS
+        self.max_age = max_age
+        self._entries, calls = self._load()
+        self._lock = threading.Lock()
+        # Background refreshes, prefetches and interactive fetches all save; one writer at a time
+        self._save_lock = threading.Lock()
+        self._refreshing = set()
+        self._calls = deque(calls)
+        self.stats_counts = {"hits": 0, "stale_hits": 0, "misses": 0, "revalidated": 0, "errors_served_stale": 0}
+
+    @staticmethod
+    def key(tool, **params):
+        parts = [tool]
+        for name in sorted(params):
+            value = params[name]
+            if value is None or value == "":
+                continue
+            parts.append(f"{name}={' '.join(str(value).lower().split())}")
+        return "|".join(parts)
+
+    def _load(self):
+        """Returns (entries, calls) from the cache file."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}, []
+        if "entries" not in stored:
+            # Files written before call times were persisted hold the entries alone
+            stored = {"entries": stored, "calls": []}
+        cutoff = time.time() - self.max_age
+        entries = {key: entry for key, entry in stored["entries"].items() if entry.get("stored_at", 0) >= cutoff}
+        call_cutoff = time.time() - 86400
+        calls = [(at, tool) for at, tool in stored.get("calls", []) if at >= call_cutoff]
+        return entries, sorted(calls)
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with self._save_lock:
+            with self._lock:
+                snapshot = json.dumps({"entries": self._entries, "calls": list(self._calls)})
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.path)
+
+    def _count(self, name):
+        with self._lock:
+            self.stats_counts[name] += 1
+
+    def fetch(self, tool, params, loader):
+        """
+        Returns the cached or freshly loaded data for `tool` with `params`.
+
+        `loader(validators)` receives {"etag", "last_modified"} of the stored
+        entry (or an empty dict) and returns (data, validators), or
+        (NOT_MODIFIED, validators) after a 304. It raises on failure.
+        """
+        key = self.key(tool, **params)
+        ttl, stale_window = self.ttls.get(tool, (0, 0))
+        with self._lock:
+            entry = self._entries.get(key)
+        age = time.time() - entry["stored_at"] if entry else None
+
+        if entry and age < ttl:
+            self._count("hits")
+            return entry["data"]
+
+        if entry and age < ttl + stale_window:
+            self._count("stale_hits")
+            self._refresh_in_background(key, loader, entry)
+            return entry["data"]
+
+        self._count("misses")
+        try:
+            return self._refresh(key, loader, entry)
+        except Exception as e:
+            if entry is None:
+                raise
+            self.logger.warning(f"Refresh of {key} failed ({e}); serving data from {age / 60:.0f} min ago.")
+            self._count("errors_served_stale")
+            return entry["data"]
+
+    def refresh(self, tool, params, loader):
+        """Loads `tool` with `params` from the API now, regardless of the stored entry's age."""
+        key = self.key(tool, **params)
+        with self._lock:
+            entry = self._entries.get(key)
+        return self._refresh(key, loader, entry)
+
+    def age(self, tool, params):
+        """Seconds since the entry was stored, or None if there is none."""
+        with self._lock:
+            entry = self._entries.get(self.key(tool, **params))
+        return time.time() - entry["stored_at"] if entry else None
+
+    def calls_in_window(self, tool, seconds=3600):
+        """API calls made for `tool` (interactive and background) in the last `seconds`."""
+        now = time.time()
+        cutoff = now - seconds
+        with self._lock:
+            while self._calls and self._calls[0][0] < now - 86400:
+                self._calls.popleft()
+            return sum(1 for at, name in self._calls if at >= cutoff and name == tool)
+
+    def _refresh(self, key, loader, entry):
+        validators = entry.get("validators", {}) if entry else {}
+        with self._lock:
+            self._calls.append((time.time(), key.split("|", 1)[0]))
+        try:
+            data, new_validators = loader(validators)
+        except Exception:
+            # The failed call still counts against the budget, including after a restart
+            self._save()
+            raise
+        if data is NOT_MODIFIED:
+            self._count("revalidated")
+            data = entry["data"]
+        with self._lock:
+            self._entries[key] = {"data": data, "stored_at": time.time(), "validators": new_validators or validators}
+        self._save()
+        return data
+
+    def _refresh_in_background(self, key, loader, entry):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._refresh(key, loader, entry)
+            except Exception as e:
+                self.logger.debug(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def invalidate(self, tool=None):
+        with self._lock:
+            if tool is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k.split("|", 1)[0] == tool]:
+                    del self._entries[key]
+        self._save()
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self.stats_counts)
+            counts["entries"] = len(self._entries)
+        served = counts["hits"] + counts["stale_hits"]
+        total = served + counts["misses"]
+        counts["hit_rate"] = served / total if total else 0.0
+        return counts
+
+
+def conditional_headers(validators):
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def response_validators(response):
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_tool_cache():
+    """Returns the process-wide cache, or None when Config.TOOL_CACHE_ENABLED is off."""
+    global _shared_cache
+    if not Config.TOOL_CACHE_ENABLED:
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ToolResultCache()
+        return _shared_cache
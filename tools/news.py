@@ -1,13 +1,24 @@
 import logging
-import httpx
 from config import Config
+from core.http_client import get_http_pool
+from tools.cache import NOT_MODIFIED, ToolFetchError, conditional_headers, get_tool_cache, response_validators
 
 class NewsTool:
-    def __init__(self):
+    # Phrase -> weight for IntentEngine routing (Hinglish included)
+    keywords = {
+        "news": 1.0, "headlines": 1.0, "headline": 1.0, "khabar": 1.0, "samachar": 1.0,
+        "breaking": 0.6, "latest on": 0.6, "what's happening in": 0.6, "current affairs": 1.0
+    }
+    # Config attribute holding the key; the prefetcher checks it without constructing the tool
+    api_key_setting = "NEWS_API_KEY"
+
+    def __init__(self, http_client=None, tool_cache=None):
         self.name = "news"
         self.description = "Get API news. Can get top headlines or search for specific topics."
         self.logger = logging.getLogger("NewsTool")
-        self.api_key = Config.NEWS_API_KEY
+        self.http = http_client or get_http_pool()
+        self.cache = tool_cache if tool_cache is not None else get_tool_cache()
+        self.api_key = getattr(Config, self.api_key_setting)
         self.base_url = "https://newsapi.org/v2"
 
     def execute(self, query=None, category=None):
@@ -15,42 +26,62 @@ class NewsTool:
             return "Error: News API Key is missing."
 
         try:
-            params = {
-                "apiKey": self.api_key,
-                "language": "en",
-                "pageSize": 5, 
-            }
-
-            if query:
-                url = f"{self.base_url}/everything" 
-                params["q"] = query
-                params["sortBy"] = "relevancy"
-            else:
-                url = f"{self.base_url}/top-headlines"
-                params["country"] = "us"
-                if category:
-                    params["category"] = category
-
-            response = httpx.get(url, params=params)
-            data = response.json()
-
-            if response.status_code == 200:
-                articles = data.get("articles", [])
-                if not articles:
-                    return f"No news found for {query if query else 'top headlines'}."
-                
-                result = []
-                for idx, article in enumerate(articles, 1):
-                    title = article.get("title", "No Title")
-                    source = article.get("source", {}).get("name", "Unknown Source")
-                    result.append(f"{idx}. {title} ({source})")
-                
-                return "\n".join(result)
+            if self.cache:
+                data = self.cache.fetch(
+                    self.name, {"query": query, "category": category},
+                    lambda validators: self._fetch(query, category, validators)
+                )
             else:
-                error_msg = data.get('message', 'Unknown error')
-                self.logger.error(f"News API Error: {error_msg}")
-                return f"Error fetching news: {error_msg}"
+                data, _ = self._fetch(query, category, {})
 
+            articles = data.get("articles", [])
+            if not articles:
+                return f"No news found for {query if query else 'top headlines'}."
+            
+            result = []
+            for idx, article in enumerate(articles, 1):
+                title = article.get("title", "No Title")
+                source = article.get("source", {}).get("name", "Unknown Source")
+                result.append(f"{idx}. {title} ({source})")
+            
+            return "\n".join(result)
+
+        except ToolFetchError as e:
+            self.logger.error(f"News API Error: {e}")
+            return f"Error fetching news: {e}"
         except Exception as e:
             self.logger.error(f"News Fetch Error: {e}")
             return f"An error occurred: {e}"
+
+    def refresh(self, query=None, category=None):
+        """Refetches a query (or the top headlines) into the cache; used by the prefetch scheduler."""
+        self.cache.refresh(
+            self.name, {"query": query, "category": category},
+            lambda validators: self._fetch(query, category, validators)
+        )
+
+    def _fetch(self, query, category, validators):
+        params = {
+            "apiKey": self.api_key,
+            "language": "en",
+            "pageSize": 5, 
+        }
+
+        if query:
+            url = f"{self.base_url}/everything" 
+            params["q"] = query
+            params["sortBy"] = "relevancy"
+        else:
+            url = f"{self.base_url}/top-headlines"
+            params["country"] = "us"
+            if category:
+                params["category"] = category
+
+        response = self.http.get(url, params=params, headers=conditional_headers(validators))
+        if response.status_code == 304:
+            return NOT_MODIFIED, response_validators(response)
+
+        data = response.json()
+        if response.status_code != 200:
+            raise ToolFetchError(data.get('message', 'Unknown error'))
+        return data, response_validators(response)
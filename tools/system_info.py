@@ -1,14 +1,23 @@
 import logging
-import psutil
-import platform
-import shutil
-import GPUtil
+from tools.system_sampler import SystemSampler
 
 class SystemInfoTool:
-    def __init__(self):
+    # Phrase -> weight for IntentEngine routing. A bare "space" or "card" is too
+    # ambiguous on its own; negative phrases veto the common false positives.
+    keywords = {
+        "system": 1.0, "spec": 1.0, "specs": 1.0, "specification": 1.0, "specifications": 1.0,
+        "processor": 1.0, "cpu": 1.0, "memory": 0.8, "ram": 1.0, "disk": 1.0, "storage": 1.0,
+        "free space": 1.0, "space left": 1.0, "space free": 1.0, "space": 0.3,
+        "os": 1.0, "operating system": 1.0, "platform": 1.0, "gpu": 1.0, "graphics": 1.0,
+        "graphics card": 1.0, "card": 0.3, "outer space": -1.0, "credit card": -1.0, "solar system": -1.0
+    }
+
+    def __init__(self, sampler=None):
         self.name = "system_info"
         self.description = "Get current system resource usage (CPU, Memory, Disk, GPU, OS)."
         self.logger = logging.getLogger("SystemInfoTool")
+        self.sampler = sampler or SystemSampler()
+        self.sampler.start()
 
     def execute(self, query_type="all"):
         try:
@@ -20,72 +29,72 @@ class SystemInfoTool:
             
             qt = query_type.lower()
             fetch_all = "all" in qt or "system" in qt or "spec" in qt or "specs" in qt
+            sampler = self.sampler
+            if not sampler.has_samples():
+                # Asked within the first tick of startup
+                sampler.sample_once()
+            static = sampler.static
 
             if fetch_all or "os" in qt or "platform" in qt or "machine" in qt or "processor" in qt or "cpu" in qt:
-                uname = platform.uname()
+                sampler.wait_for_cpu()
                 os_info = (
-                    f"System: {uname.system}\n"
-                    f"Platform: {platform.platform()}\n"
-                    f"Processor: {uname.processor}"
+                    f"System: {static['system']}\n"
+                    f"Platform: {static['platform']}\n"
+                    f"Processor: {static['processor']} ({static['cpu_count']} logical cores)\n"
+                    f"CPU Usage: {sampler.latest('cpu'):.0f}%"
                 )
+                cpu_trend = sampler.trend_line("CPU", sampler.series["cpu"])
+                if cpu_trend:
+                    os_info += f"\n{cpu_trend}"
                 results.append("--- System/OS Info ---\n" + os_info)
 
             if fetch_all or "memory" in qt or "ram" in qt:
-                mem = psutil.virtual_memory()
-                total_mem_gb = mem.total / (1024 ** 3)
-                available_mem_gb = mem.available / (1024 ** 3)
-                mem_percent = mem.percent
-                
                 mem_str = (
-                    f"Total Memory: {total_mem_gb:.2f} GB\n"
-                    f"Available Memory: {available_mem_gb:.2f} GB\n"
-                    f"Memory Used: {mem_percent}%"
+                    f"Total Memory: {static['memory_total_gb']:.2f} GB\n"
+                    f"Available Memory: {sampler.latest('memory_available_gb'):.2f} GB\n"
+                    f"Memory Used: {sampler.latest('memory'):.1f}%"
                 )
+                mem_trend = sampler.trend_line("Memory use", sampler.series["memory"])
+                if mem_trend:
+                    mem_str += f"\n{mem_trend}"
                 results.append("--- Memory Info ---\n" + mem_str)
 
             if fetch_all or "disk" in qt or "storage" in qt or "space" in qt:
-                path = "/"
-                if platform.system() == "Windows":
-                    path = "C:\\"
-                
-                disk = shutil.disk_usage(path)
-                total_disk_gb = disk.total / (1024 ** 3)
-                free_disk_gb = disk.free / (1024 ** 3)
-                used_disk_gb = disk.used / (1024 ** 3)
-                disk_percent = (disk.used / disk.total) * 100
+                total_disk_gb = static['disk_total_gb']
+                free_disk_gb = sampler.latest('disk_free_gb')
+                disk_percent = (total_disk_gb - free_disk_gb) / total_disk_gb * 100
 
                 disk_str = (
                     f"Total Disk Space: {total_disk_gb:.2f} GB\n"
                     f"Free Disk Space: {free_disk_gb:.2f} GB\n"
                     f"Disk Used: {disk_percent:.1f}%"
                 )
-                results.append(f"--- Disk Info ({path}) ---\n" + disk_str)
+                results.append(f"--- Disk Info ({sampler.disk_path}) ---\n" + disk_str)
 
             # --- GPU Info ---
             if fetch_all or "gpu" in qt or "graphics" in qt or "card" in qt:
-                try:
-                    gpus = GPUtil.getGPUs()
-                    if gpus:
-                        for gpu in gpus:
-                            gpu_str = (
-                                f"GPU: {gpu.name}\n"
-                                f"VRAM Used: {gpu.memoryUsed}MB / {gpu.memoryTotal}MB\n"
-                                f"Load: {gpu.load*100:.1f}%"
-                            )
-                            results.append("--- GPU Info ---\n" + gpu_str)
-                    elif "gpu" in qt: 
-                        results.append("--- GPU Info ---\nNo dedicated NVIDIA GPU detected.")
-                except Exception as e:
-                    self.logger.error(f"Error fetching GPU info: {e}")
-                    if "gpu" in qt:
-                        results.append(f"--- GPU Info ---\nError fetching GPU info.")
+                if sampler.gpus:
+                    for gpu in sampler.gpus.values():
+                        gpu_str = (
+                            f"GPU: {gpu['name']}\n"
+                            f"VRAM Used: {gpu['memory_used_mb'].latest():.0f}MB / {gpu['memory_total_mb']:.0f}MB\n"
+                            f"Load: {gpu['load'].latest():.1f}%\n"
+                            f"Temperature: {gpu['temperature'].latest():.0f}°C"
+                        )
+                        gpu_trend = sampler.trend_line("GPU load", gpu["load"])
+                        if gpu_trend:
+                            gpu_str += f"\n{gpu_trend}"
+                        results.append("--- GPU Info ---\n" + gpu_str)
+                elif "gpu" in qt: 
+                    results.append("--- GPU Info ---\nNo dedicated NVIDIA GPU detected.")
 
             if not results:
-                cpu_usage = psutil.cpu_percent(interval=0.1)
-                return f"CPU Usage: {cpu_usage}% (Specify 'os', 'memory', 'disk' for more info)"
+                sampler.wait_for_cpu()
+                cpu_usage = sampler.latest("cpu")
+                return f"CPU Usage: {cpu_usage:.0f}% (Specify 'os', 'memory', 'disk' for more info)"
 
             return "\n\n".join(results)
 
         except Exception as e:
             self.logger.error(f"Error fetching system stats: {e}")
-            return f"Error gathering system stats: {e}"
\ No newline at end of file
+            return f"Error gathering system stats: {e}"
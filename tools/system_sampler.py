@@ -0,0 +1,200 @@
+import logging
+import platform
+import shutil
+import threading
+import time
+from array import array
+
+import psutil
+from config import Config
+
+
+class RingBuffer:
+    """Fixed-capacity float series backed by a preallocated array; the oldest value is overwritten."""
+
+    def __init__(self, capacity, typecode="d"):
+        self.capacity = capacity
+        self.data = array(typecode, [0.0]) * capacity
+        self.head = 0
+        self.count = 0
+
+    def append(self, value):
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self):
+        """All stored values, oldest first."""
+        start = (self.head - self.count) % self.capacity
+        if start + self.count <= self.capacity:
+            return self.data[start:start + self.count]
+        return self.data[start:] + self.data[:self.head]
+
+    def last(self):
+        return self.data[(self.head - 1) % self.capacity] if self.count else None
+
+    def __len__(self):
+        return self.count
+
+
+class MetricSeries:
+    """Timestamped readings of one metric in two parallel ring buffers."""
+
+    def __init__(self, capacity):
+        self.times = RingBuffer(capacity)
+        self.readings = RingBuffer(capacity, "f")
+
+    def append(self, timestamp, value):
+        self.times.append(timestamp)
+        self.readings.append(value)
+
+    def latest(self):
+        return self.readings.last()
+
+    def since(self, seconds):
+        """(timestamp, value) pairs from the last `seconds`, oldest first."""
+        cutoff = time.time() - seconds
+        return [(t, v) for t, v in zip(self.times.values(), self.readings.values()) if t >= cutoff]
+
+
+class SystemSampler:
+    """
+    Samples CPU, memory, disk and GPU usage on a daemon thread so the system
+    tool can answer from memory. Host facts that never change (OS, platform,
+    processor, totals) are read once. GPU readings shell out to nvidia-smi,
+    so they are taken every Config.SYSTEM_GPU_SAMPLE_EVERY samples only.
+    psutil measures CPU use since its previous call, so a CPU reading is
+    only taken once `cpu_window` seconds have passed since the last one; a
+    sample right after startup would otherwise read 0% over a ~0 ms window.
+    """
+
+    def __init__(self, interval=Config.SYSTEM_SAMPLE_INTERVAL, capacity=Config.SYSTEM_SAMPLE_HISTORY,
+                 gpu_every=Config.SYSTEM_GPU_SAMPLE_EVERY, cpu_window=Config.SYSTEM_CPU_MIN_WINDOW):
+        self.logger = logging.getLogger("SystemSampler")
+        self.interval = interval
+        self.capacity = capacity
+        self.gpu_every = max(1, gpu_every)
+        self.cpu_window = cpu_window
+        self.disk_path = "C:\\" if platform.system() == "Windows" else "/"
+        self.static = self._static_facts()
+        self.series = {name: MetricSeries(capacity) for name in ("cpu", "memory", "memory_available_gb", "disk_free_gb")}
+        self.gpus = {}
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        psutil.cpu_percent(interval=None)  # Primes the counter; the next call measures from here
+        self._cpu_since = time.monotonic()
+
+    def _static_facts(self):
+        uname = platform.uname()
+        disk = shutil.disk_usage(self.disk_path)
+        return {
+            "system": uname.system,
+            "platform": platform.platform(),
+            "processor": uname.processor,
+            "cpu_count": psutil.cpu_count(),
+            "memory_total_gb": psutil.virtual_memory().total / (1024 ** 3),
+            "disk_total_gb": disk.total / (1024 ** 3)
+        }
+
+    def sample_once(self):
+        now = time.time()
+        cpu = None
+        if time.monotonic() - self._cpu_since >= self.cpu_window:
+            cpu = psutil.cpu_percent(interval=None)
+            self._cpu_since = time.monotonic()
+        mem = psutil.virtual_memory()
+        disk = shutil.disk_usage(self.disk_path)
+        with self._lock:
+            if cpu is not None:
+                self.series["cpu"].append(now, cpu)
+            self.series["memory"].append(now, mem.percent)
+            self.series["memory_available_gb"].append(now, mem.available / (1024 ** 3))
+            self.series["disk_free_gb"].append(now, disk.free / (1024 ** 3))
+            take_gpu = self._samples % self.gpu_every == 0
+            self._samples += 1
+        if take_gpu:
+            self._sample_gpus(now)
+
+    def _sample_gpus(self, now):
+        try:
+            # GPUtil drags in distutils/setuptools (~200 ms); import it on the sampler thread
+            import GPUtil
+            gpus = GPUtil.getGPUs()
+        except Exception as e:
+            self.logger.debug(f"GPU sampling failed: {e}")
+            return
+        with self._lock:
+            for gpu in gpus:
+                entry = self.gpus.get(gpu.id)
+                if entry is None:
+                    entry = self.gpus[gpu.id] = {
+                        "name": gpu.name,
+                        "memory_total_mb": gpu.memoryTotal,
+                        "load": MetricSeries(self.capacity),
+                        "memory_used_mb": MetricSeries(self.capacity),
+                        "temperature": MetricSeries(self.capacity)
+                    }
+                entry["load"].append(now, gpu.load * 100)
+                entry["memory_used_mb"].append(now, gpu.memoryUsed)
+                entry["temperature"].append(now, gpu.temperature)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                self.logger.error(f"System sampling failed: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="SystemSampler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def has_samples(self):
+        return len(self.series["memory"].readings) > 0
+
+    def wait_for_cpu(self):
+        """Makes sure a CPU reading exists, waiting out the rest of the measurement window (under a second) if needed."""
+        if self.latest("cpu") is not None:
+            return
+        remaining = self._cpu_since + self.cpu_window - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self.sample_once()
+
+    def latest(self, metric):
+        with self._lock:
+            return self.series[metric].latest()
+
+    def summary(self, series, seconds=Config.SYSTEM_TREND_WINDOW):
+        """
+        Returns (average, peak, direction, covered_seconds) over the last
+        `seconds`, or None with fewer than two readings.
+        """
+        with self._lock:
+            points = series.since(seconds)
+        if len(points) < 2:
+            return None
+        values = [v for _, v in points]
+        half = len(values) // 2
+        first, second = sum(values[:half]) / half, sum(values[half:]) / (len(values) - half)
+        direction = "rising" if second - first > 5 else "falling" if first - second > 5 else "steady"
+        return sum(values) / len(values), max(values), direction, time.time() - points[0][0]
+
+    def trend_line(self, label, series, unit="%", seconds=Config.SYSTEM_TREND_WINDOW):
+        result = self.summary(series, seconds)
+        if result is None:
+            return None
+        average, peak, direction, covered = result
+        if covered < 60:
+            # Too little history for a trend to mean anything
+            return None
+        minutes = round(covered / 60)
+        span = f"{minutes} minute{'s' if minutes != 1 else ''}"
+        return f"{label} averaged {average:.0f}{unit} over the last {span} (peak {peak:.0f}{unit}, {direction})"
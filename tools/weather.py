@@ -1,43 +1,70 @@
 import logging
-import httpx
 from config import Config
+from core.http_client import get_http_pool
+from tools.cache import NOT_MODIFIED, ToolFetchError, conditional_headers, get_tool_cache, response_validators
 
 class WeatherTool:
-    def __init__(self):
+    # Phrase -> weight for IntentEngine routing (Hinglish included)
+    keywords = {
+        "weather": 1.0, "vedar": 1.0, "vader": 1.0, "mausam": 1.0, "forecast": 1.0,
+        "temperature outside": 1.0, "how hot": 0.6, "how cold": 0.6, "temperature": 0.5,
+        "rain": 0.6, "raining": 0.8, "barish": 0.8, "humidity": 0.8, "humid": 0.6,
+        "umbrella": 0.6, "sunny": 0.6, "garmi": 0.5, "thand": 0.5
+    }
+    # Config attribute holding the key; the prefetcher checks it without constructing the tool
+    api_key_setting = "OPEN_WEATHER_API_KEY"
+
+    def __init__(self, http_client=None, tool_cache=None):
         self.name = "weather"
         self.description = "Get current weather for a city. Input should be the city name."
         self.logger = logging.getLogger("WeatherTool")
-        self.api_key = Config.OPEN_WEATHER_API_KEY
+        self.http = http_client or get_http_pool()
+        self.cache = tool_cache if tool_cache is not None else get_tool_cache()
+        self.api_key = getattr(Config, self.api_key_setting)
         if self.api_key:
             self.api_key = self.api_key.strip()
         
         self.base_url = "http://api.openweathermap.org/data/2.5/weather"
 
-    def execute(self, city="Kolkata"):
+    def execute(self, city=Config.DEFAULT_CITY):
         if not self.api_key:
             return "Error: OpenWeather API Key is missing."
 
         if not city or city.lower() == "none":
-            city = "Kolkata"
+            city = Config.DEFAULT_CITY
 
         try:
-            params = {
-                "q": city,
-                "appid": self.api_key,
-                "units": "metric"
-            }
-            response = httpx.get(self.base_url, params=params)
-            data = response.json()
-
-            if response.status_code == 200:
-                weather_desc = data['weather'][0]['description']
-                temp = data['main']['temp']
-                humidity = data['main']['humidity']
-                return f"The weather in {city} is {weather_desc}, {temp}°C, {humidity}% humidity."
+            if self.cache:
+                data = self.cache.fetch(self.name, {"city": city}, lambda validators: self._fetch(city, validators))
             else:
-                error_msg = data.get('message', 'Unknown error')
-                self.logger.error(f"Weather API Error: {error_msg}")
-                return f"Error fetching weather for {city}: {error_msg}"
+                data, _ = self._fetch(city, {})
+
+            weather_desc = data['weather'][0]['description']
+            temp = data['main']['temp']
+            humidity = data['main']['humidity']
+            return f"The weather in {city} is {weather_desc}, {temp}°C, {humidity}% humidity."
+        except ToolFetchError as e:
+            self.logger.error(f"Weather API Error: {e}")
+            return f"Error fetching weather for {city}: {e}"
         except Exception as e:
             self.logger.error(f"Weather Fetch Error: {e}")
             return f"An error occurred: {e}"
+
+    def refresh(self, city=Config.DEFAULT_CITY):
+        """Refetches `city` into the cache; used by the prefetch scheduler."""
+        self.cache.refresh(self.name, {"city": city}, lambda validators: self._fetch(city, validators))
+
+    def _fetch(self, city, validators):
+        params = {
+            "q": city,
+            "appid": self.api_key,
+            "units": "metric"
+        }
+        response = self.http.get(self.base_url, params=params, headers=conditional_headers(validators))
+        if response.status_code == 304:
+            return NOT_MODIFIED, response_validators(response)
+
+        data = response.json()
+        if response.status_code != 200:
+            raise ToolFetchError(data.get('message', 'Unknown error'))
+        return data, response_validators(response)